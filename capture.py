@@ -6,24 +6,222 @@ mitmproxy 스크립트: 인스타그램 앱의 네트워크 트래픽 캡처
 
 또는 mitmdump로 실행:
     mitmdump -s capture.py
+
+응답별 상세 정보 출력:
+    CAPTURE_LOG_LEVEL=DEBUG mitmdump -s capture.py
 """
 
+import asyncio
+import atexit
+import collections
+import itertools
 import json
-from datetime import datetime
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Optional, Union
 
 from mitmproxy import http
 
+try:
+    import orjson
+except ImportError:  # mitmproxy 단독 설치본 등 orjson이 없는 환경에서는 표준 json 사용
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # 선택 의존성: 없으면 simdjson/orjson/json 사용
+    msgspec = None
+
+try:
+    import simdjson
+except ImportError:  # 선택 의존성: 없으면 orjson/json으로 전체 파싱
+    simdjson = None
+
+try:
+    import xxhash
+except ImportError:  # 선택 의존성: 없으면 내장 hash() 사용
+    xxhash = None
+
+try:
+    import re2 as _keyword_re
+except ImportError:  # 선택 의존성: 없으면 표준 re 사용
+    _keyword_re = re
+
+
+# 로거 설정 (mitmproxy가 표준 logging 레코드를 이벤트 로그로 출력)
+# 응답별 상세 정보는 CAPTURE_LOG_LEVEL=DEBUG 일 때만 출력된다
+logger = logging.getLogger("capture")
+logger.setLevel(os.environ.get("CAPTURE_LOG_LEVEL", "INFO").upper())
+
+_SEP = "=" * 60
 
 # 출력 디렉토리 설정
 OUTPUT_DIR = Path("output/mitmproxy_capture")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+# 모든 응답을 한 파일에 한 줄씩 추가 (파일별 생성/열기 비용 제거)
+CAPTURE_FILE = OUTPUT_DIR / "capture.jsonl"
+
+# 인스타그램 관련 API 감지 키워드
+INSTAGRAM_KEYWORDS = (
+    "graph.instagram.com",
+    "i.instagram.com",
+    "clips/discover",  # 릴스 탐색
+    "feed/timeline",  # 피드 타임라인
+    "api/v1/feed",  # 피드 API
+    "stories/reel",  # 릴스 스토리
+    "media/",  # 미디어 관련
+    "reels/",  # 릴스 관련
+)
+# 키워드별 부분 문자열 검사 대신 한 번의 스캔으로 매칭 (re2가 있으면 DFA 기반)
+_INSTAGRAM_PATTERN = _keyword_re.compile("|".join(re.escape(k) for k in INSTAGRAM_KEYWORDS))
+
+# 본문을 읽어볼 가치가 있는 Content-Type (인스타그램은 JSON을 text/javascript, text/html로 내려주기도 함)
+_TEXTUAL_CONTENT_TYPE = re.compile(r"json|javascript|^text/", re.IGNORECASE)
+
+# simdjson 파서는 내부 버퍼를 재사용하지만 스레드 간 공유할 수 없으므로 워커 스레드마다 하나씩 생성
+_parser_local = threading.local()
+# 같은 엔드포인트를 반복 폴링하는 동일 응답은 최근 본문 해시로 걸러낸다
+_DEDUP_WINDOW = 4096  # 기억할 최근 응답 수
+_seen_order: "collections.deque[int]" = collections.deque()
+_seen_hashes: set[int] = set()
+_body_hash = xxhash.xxh3_64_intdigest if xxhash is not None else hash
+
+# msgspec은 최상위 값만 만들고 하위 값은 원본 JSON 조각(Raw)으로 남겨 둔다
+_MSGSPEC_DECODER = (
+    msgspec.json.Decoder(
+        Union[dict[str, msgspec.Raw], list[msgspec.Raw], str, int, float, bool, None]
+    )
+    if msgspec is not None
+    else None
+)
+_JSON_OBJECT_TYPES: tuple[type, ...] = (dict, simdjson.Object) if simdjson is not None else (dict,)
+
+
+def _json_loads(raw: bytes) -> Any:
+    """
+    JSON 바이트 파싱 (msgspec > simdjson > orjson > 표준 json 순으로 사용)
+
+    msgspec을 사용할 수 있으면 최상위 값만 디코딩하고 하위 값은 압축된 원본 조각(msgspec.Raw)으로 둔다.
+    simdjson을 사용할 수 있으면 지연 파싱 문서(프록시)를 반환하여
+    실제로 접근한 필드만 파이썬 객체로 만든다.
+    반환된 프록시가 살아있는 동안에는 다음 파싱을 할 수 없으므로 호출 범위 밖으로 넘기지 않는다.
+
+    Raises:
+        ValueError: JSON이 아니거나 UTF-8 디코딩에 실패한 경우
+    """
+    if _MSGSPEC_DECODER is not None:
+        # format()이 전체 문법 검사와 공백 제거를 한 번에 처리하므로 Raw 조각도 JSONL 한 줄에 들어간다
+        return _MSGSPEC_DECODER.decode(msgspec.json.format(raw, indent=-1))
+    if simdjson is not None:
+        parser = getattr(_parser_local, "parser", None)
+        if parser is None:
+            parser = _parser_local.parser = simdjson.Parser()
+        return parser.parse(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """JSON 직렬화 (JSONL 한 줄에 들어가도록 압축 형식, UTF-8 바이트로 반환)"""
+    if simdjson is not None and isinstance(data, (simdjson.Object, simdjson.Array)):
+        # 지연 파싱 문서는 파이썬 객체를 만들지 않고 최소화된 JSON 바이트를 그대로 사용
+        return data.mini
+    if msgspec is not None:  # Raw 조각은 그대로 이어붙임
+        return msgspec.json.encode(data)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 백그라운드 쓰기 설정: 훅에서는 큐에 넣기만 하고 디스크 I/O는 전용 스레드에서 배치로 처리
+_WRITE_BATCH_SIZE = 32  # 한 번에 꺼내서 기록할 최대 레코드 수
+_WRITE_BUFFER_SIZE = 1 << 20  # 캡처 파일 쓰기 버퍼 (1MB)
+_CAPTURE_ROTATE_BYTES = 512 * 1024 * 1024  # 캡처 파일 회전 크기 (512MB)
+_WRITE_QUEUE: "queue.Queue[Optional[bytes]]" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+
+# 파싱/직렬화 전용 워커 풀 (기본 실행기를 다른 작업과 공유하지 않도록 분리)
+_SAVE_WORKERS = 2
+_SAVE_POOL = ThreadPoolExecutor(max_workers=_SAVE_WORKERS, thread_name_prefix="cap-save")
+
+
+def _open_capture_file() -> BinaryIO:
+    """캡처 파일을 추가 모드로 열기"""
+    return open(CAPTURE_FILE, "ab", buffering=_WRITE_BUFFER_SIZE)
+
+
+def _rotate_capture_file(out: BinaryIO) -> BinaryIO:
+    """현재 캡처 파일을 닫고 이름을 바꾼 뒤 새 파일 열기"""
+    out.close()
+    CAPTURE_FILE.rename(CAPTURE_FILE.with_name(f"capture_{time.time_ns()}.jsonl"))
+    return _open_capture_file()
+
+
+def _writer_loop() -> None:
+    """큐에 쌓인 JSONL 레코드를 배치 단위로 캡처 파일에 추가 (None을 받으면 종료)"""
+    out = _open_capture_file()
+    try:
+        while True:
+            batch = [_WRITE_QUEUE.get()]
+            while len(batch) < _WRITE_BATCH_SIZE:
+                try:
+                    batch.append(_WRITE_QUEUE.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            records = [record for record in batch if record is not None]
+            try:
+                if records:
+                    out.writelines(records)
+                    out.flush()
+                    logger.info("[✓] 데이터 저장: %d건 -> %s", len(records), CAPTURE_FILE)
+                if out.tell() >= _CAPTURE_ROTATE_BYTES:
+                    out = _rotate_capture_file(out)
+            except Exception as e:
+                logger.error("[✗] 데이터 저장 실패: %s", e)
+
+            if stop:
+                return
+    finally:
+        out.close()
+
+
+def _enqueue_write(record: bytes) -> None:
+    """레코드를 쓰기 큐에 추가 (쓰기 스레드가 없으면 시작)"""
+    global _writer_thread
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_writer_loop, name="capture-writer", daemon=True)
+        _writer_thread.start()
+    _WRITE_QUEUE.put(record)
+
+
+def _flush_writes() -> None:
+    """남은 쓰기 작업을 모두 기록하고 쓰기 스레드 종료"""
+    global _writer_thread
+    if _writer_thread is None:
+        return
+    _WRITE_QUEUE.put(None)
+    _writer_thread.join()
+    _writer_thread = None
+
+
+atexit.register(_flush_writes)
 
 
 def save_data(url: str, data: Any, response_type: str = "json") -> None:
     """
-    캡처한 데이터를 파일로 저장
+    캡처한 데이터를 JSONL 레코드로 직렬화하여 쓰기 큐에 추가
+
+    레코드 형식: {"ts": time_ns, "url": ..., "type": ..., "data": ...}
+    실제 파일 기록은 백그라운드 쓰기 스레드에서 처리됩니다.
 
     Args:
         url: 요청 URL
@@ -31,107 +229,178 @@ def save_data(url: str, data: Any, response_type: str = "json") -> None:
         response_type: 데이터 타입 (json, text 등)
     """
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        
-        # URL에서 도메인 추출
-        domain = url.split("/")[2] if "/" in url else "unknown"
-        domain = domain.replace(".", "_")
+        # 직렬화는 여기서 끝내고 (지연 파싱 문서는 훅 밖으로 넘길 수 없음) 기록은 쓰기 스레드에 위임
+        payload = _json_dumps(data if response_type == "json" else str(data))
         
-        # 파일명 생성
-        filename = f"{domain}_{timestamp}.{response_type}"
-        filepath = OUTPUT_DIR / filename
-        
-        # 데이터 저장
-        if response_type == "json":
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        else:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(str(data))
-        
-        print(f"[✓] 데이터 저장: {filepath}")
+        # payload는 이미 인코딩된 JSON이므로 레코드에 그대로 이어붙임
+        record = b'{"ts":%d,"url":%b,"type":%b,"data":%b}\n' % (
+            time.time_ns(),
+            _json_dumps(url),
+            _json_dumps(response_type),
+            payload,
+        )
+        _enqueue_write(record)
     except Exception as e:
-        print(f"[✗] 데이터 저장 실패: {e}")
+        logger.error("[✗] 데이터 저장 실패: %s", e)
+
 
+def _materialize(value: Any) -> Any:
+    """msgspec.Raw 조각이면 파이썬 객체로 디코딩 (DEBUG 요약에서 들여다보는 값만)"""
+    if msgspec is not None and isinstance(value, msgspec.Raw):
+        return msgspec.json.decode(value)
+    return value
 
-def response(flow: http.HTTPFlow) -> None:
+
+def _describe_json(flow: http.HTTPFlow, url: str, host: str, data: Any, raw: bytes) -> str:
+    """
+    JSON 응답의 구조 요약 문자열 생성 (DEBUG 로그용)
+
+    Args:
+        flow: HTTP 요청/응답 플로우
+        url: 요청 URL
+        host: 요청 호스트
+        data: 파싱된 JSON 데이터
+        raw: 원본 응답 바이트
+
+    Returns:
+        여러 줄로 된 요약 문자열
+    """
+    lines = [
+        _SEP,
+        "[*] 인스타그램 데이터 발견!",
+        f"    URL: {url}",
+        f"    Host: {host}",
+        f"    Status: {flow.response.status_code}",
+        f"    Content-Type: {flow.response.headers.get('Content-Type', 'unknown')}",
+    ]
+    
+    # 데이터 타입 확인
+    if isinstance(data, _JSON_OBJECT_TYPES):
+        # items 키가 있으면 (피드/릴스 데이터)
+        if "items" in data:
+            items = _materialize(data.get("items", []))
+            items_count = len(items)
+            lines.append(f"    Items: {items_count}개")
+            
+            # 첫 번째 아이템 정보 출력
+            if items_count > 0:
+                first_item = _materialize(items[0])
+                lines.append(f"    첫 번째 아이템 키: {list(itertools.islice(first_item, 5))}")
+        
+        # 더 많은 정보 출력 (전체 키 리스트를 만들지 않고 앞부분만)
+        lines.append(f"    데이터 키: {list(itertools.islice(data, 10))}")
+    
+    # 데이터 미리보기 (처음 200자)
+    # str(data)는 전체 문서를 문자열로 렌더링한 뒤 잘라내므로 원본 바이트 앞부분만 사용
+    preview = raw[:200].decode("utf-8", "replace")
+    lines.append(f"    미리보기: {preview}...")
+    lines.append(_SEP)
+    return "\n".join(lines)
+
+
+def _process_json(flow: http.HTTPFlow, url: str, host: str, raw: bytes) -> bool:
+    """
+    JSON 응답 파싱, 요약 로그, 직렬화 후 쓰기 큐 추가 (워커 스레드에서 실행)
+
+    지연 파싱 문서는 이 함수 안에서만 사용하고 직렬화된 바이트만 밖으로 넘긴다.
+
+    Args:
+        flow: HTTP 요청/응답 플로우 (읽기 전용)
+        url: 요청 URL
+        host: 요청 호스트
+        raw: 원본 응답 바이트
+
+    Returns:
+        JSON으로 처리했으면 True, JSON이 아니면 False
+    """
+    try:
+        data = _json_loads(raw)
+    except ValueError:  # msgspec/simdjson/orjson/json 디코딩 오류는 모두 ValueError 하위 클래스
+        return False
+    
+    # 상세 정보는 DEBUG 레벨에서만 조립 (비활성화 시 문자열 포맷팅 비용 없음)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(_describe_json(flow, url, host, data, raw))
+    
+    # 데이터 저장
+    save_data(url, data, "json")
+    return True
+
+
+def _is_duplicate(raw: bytes) -> bool:
+    """
+    최근에 저장한 응답과 본문이 같은지 확인하고, 처음 보는 본문이면 기록
+
+    이벤트 루프 스레드에서만 호출되므로 별도 잠금은 필요 없다.
+
+    Args:
+        raw: 원본 응답 바이트
+
+    Returns:
+        최근 _DEDUP_WINDOW개 응답 중 같은 본문이 있으면 True
+    """
+    digest = _body_hash(raw)
+    if digest in _seen_hashes:
+        return True
+    if len(_seen_order) >= _DEDUP_WINDOW:
+        _seen_hashes.discard(_seen_order.popleft())
+    _seen_order.append(digest)
+    _seen_hashes.add(digest)
+    return False
+
+
+async def response(flow: http.HTTPFlow) -> None:
     """
     HTTP 응답을 가로채서 처리
 
+    파싱/직렬화는 워커 스레드에서 처리하여 이벤트 루프가 다른 플로우를 계속 처리하도록 한다.
+
     Args:
         flow: HTTP 요청/응답 플로우
     """
-    url = flow.request.pretty_url
     host = flow.request.pretty_host
     
-    # 인스타그램 관련 API 감지
-    instagram_keywords = [
-        "graph.instagram.com",
-        "i.instagram.com",
-        "clips/discover",  # 릴스 탐색
-        "feed/timeline",  # 피드 타임라인
-        "api/v1/feed",  # 피드 API
-        "stories/reel",  # 릴스 스토리
-        "media/",  # 미디어 관련
-        "reels/",  # 릴스 관련
-    ]
-    
     # 인스타그램 관련 요청인지 확인
-    is_instagram = any(keyword in url or keyword in host for keyword in instagram_keywords)
+    # pretty_url은 접근할 때마다 URL 문자열을 새로 조립하므로, 이미 분리된 host/path로 먼저 판별
+    is_instagram = bool(
+        _INSTAGRAM_PATTERN.search(host) or _INSTAGRAM_PATTERN.search(flow.request.path)
+    )
     
     if not is_instagram:
         return
     
+    # 이미지/동영상 등 바이너리 응답은 본문을 읽기 전에 제외 (media/, reels/ 키워드에 걸리는 대용량 에셋)
+    content_type = flow.response.headers.get("content-type", "")
+    if content_type and not _TEXTUAL_CONTENT_TYPE.search(content_type):
+        return
+    
+    url = flow.request.pretty_url
+    
     try:
-        # 응답 본문 가져오기
-        response_text = flow.response.text
+        # 응답 본문 가져오기 (text는 전체 디코딩을 유발하므로 bytes 사용)
+        raw = flow.response.content
+        
+        if not raw:
+            return
         
-        if not response_text:
+        # 반복 폴링으로 받은 동일 응답은 파싱/저장 생략
+        if _is_duplicate(raw):
+            logger.debug("[=] 중복 응답 건너뜀: %s", url)
             return
         
         # JSON 데이터 파싱 시도
-        try:
-            data = json.loads(response_text)
-            
-            # 데이터 구조 확인 및 출력
-            print(f"\n{'='*60}")
-            print(f"[*] 인스타그램 데이터 발견!")
-            print(f"    URL: {url}")
-            print(f"    Host: {host}")
-            print(f"    Status: {flow.response.status_code}")
-            print(f"    Content-Type: {flow.response.headers.get('Content-Type', 'unknown')}")
-            
-            # 데이터 타입 확인
-            if isinstance(data, dict):
-                # items 키가 있으면 (피드/릴스 데이터)
-                if "items" in data:
-                    items_count = len(data.get("items", []))
-                    print(f"    Items: {items_count}개")
-                    
-                    # 첫 번째 아이템 정보 출력
-                    if items_count > 0:
-                        first_item = data["items"][0]
-                        print(f"    첫 번째 아이템 키: {list(first_item.keys())[:5]}")
-                
-                # 더 많은 정보 출력
-                print(f"    데이터 키: {list(data.keys())[:10]}")
-            
-            # 데이터 미리보기 (처음 200자)
-            preview = str(data)[:200]
-            print(f"    미리보기: {preview}...")
-            print(f"{'='*60}\n")
-            
-            # 데이터 저장
-            save_data(url, data, "json")
-            
-        except json.JSONDecodeError:
-            # JSON이 아닌 경우 텍스트로 저장
-            print(f"\n[*] 텍스트 데이터 발견: {url}")
-            print(f"    미리보기: {response_text[:200]}...")
-            save_data(url, response_text, "txt")
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(_SAVE_POOL, _process_json, flow, url, host, raw):
+            return
+        
+        # JSON이 아닌 경우 텍스트로 저장
+        response_text = flow.response.text
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[*] 텍스트 데이터 발견: %s\n    미리보기: %s...", url, response_text[:200])
+        save_data(url, response_text, "txt")
             
     except Exception as e:
-        print(f"[✗] 응답 처리 중 오류: {e}")
+        logger.error("[✗] 응답 처리 중 오류: %s", e)
 
 
 def request(flow: http.HTTPFlow) -> None:
@@ -141,28 +410,31 @@ def request(flow: http.HTTPFlow) -> None:
     Args:
         flow: HTTP 요청/응답 플로우
     """
-    url = flow.request.pretty_url
     host = flow.request.pretty_host
     
     # 인스타그램 관련 요청만 로깅
-    if "instagram.com" in host or "graph.instagram.com" in host:
-        print(f"[→] 요청: {flow.request.method} {url}")
+    # graph.instagram.com도 instagram.com에 포함되므로 한 번만 검사하고, URL은 로깅할 때만 조립
+    if "instagram.com" in host:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[→] 요청: %s %s", flow.request.method, flow.request.pretty_url)
 
 
 # mitmproxy 이벤트 훅
 def start() -> None:
     """mitmproxy 시작 시 호출"""
-    print("\n" + "="*60)
+    print("\n" + _SEP)
     print("인스타그램 트래픽 캡처 시작")
-    print("="*60)
-    print(f"출력 디렉토리: {OUTPUT_DIR.absolute()}")
-    print("="*60 + "\n")
+    print(_SEP)
+    print(f"출력 파일: {CAPTURE_FILE.absolute()}")
+    print(_SEP + "\n")
 
 
 def done() -> None:
     """mitmproxy 종료 시 호출"""
-    print("\n" + "="*60)
+    _SAVE_POOL.shutdown(wait=True)
+    _flush_writes()
+    print("\n" + _SEP)
     print("인스타그램 트래픽 캡처 종료")
-    print(f"저장된 파일: {OUTPUT_DIR.absolute()}")
-    print("="*60 + "\n")
+    print(f"저장된 파일: {CAPTURE_FILE.absolute()}")
+    print(_SEP + "\n")
 
@@ -11,14 +11,18 @@ import sys
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+PROJECT_ROOT = str(Path(__file__).parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-# Poetry 가상 환경 확인 및 안내
-try:
-    from src.config import load_config
-except ImportError as e:
+
+def _print_import_help(error: ImportError) -> None:
+    """
+    필요한 모듈을 불러오지 못했을 때 Poetry 실행 방법 안내
+
+    Args:
+        error: 발생한 ImportError
+    """
     print("=" * 60)
     print("오류: 필요한 모듈을 찾을 수 없습니다.")
     print("=" * 60)
@@ -31,13 +35,18 @@ except ImportError as e:
     print("\n3. 또는 Poetry 가상 환경에 직접 접근:")
     print("   python -m poetry env info --path")
     print("   (출력된 경로의 Scripts\\python.exe main.py)")
-    print("\n원본 오류:", str(e))
+    print("\n원본 오류:", str(error))
     print("=" * 60)
-    sys.exit(1)
 
-from src.config import load_config
-from src.scraper import InstagramReelsScraper
-from src.utils.logger import setup_logger, get_logger
+
+# Poetry 가상 환경 확인 및 안내 (필요한 모듈을 한 번에 불러오고 실패 시 안내)
+try:
+    from src.config import load_config
+    from src.scraper import InstagramReelsScraper
+    from src.utils.logger import get_logger, setup_logger
+except ImportError as e:
+    _print_import_help(e)
+    sys.exit(1)
 
 
 def main() -> None:
@@ -74,8 +83,7 @@ def main() -> None:
         raise
     # finally:
     #     # 브라우저 종료 (주석 처리 - 브라우저가 자동으로 닫히지 않도록)
-    #     if scraper.browser_manager:
-    #         scraper.browser_manager.close()
+    #     scraper.close()
     
     # 브라우저를 열어둔 채로 종료 (수동으로 닫을 수 있도록)
     logger.info("프로그램이 종료되었습니다. 브라우저는 열려 있습니다.")
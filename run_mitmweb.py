@@ -1,10 +1,23 @@
 """
 mitmweb 실행 스크립트
 """
+import os
 import sys
-from pathlib import Path
 from mitmproxy.tools.main import mitmweb
 
+# 자동 감지할 캡처 스크립트 (우선순위 순)
+_SCRIPT_CANDIDATES = ("capture_bypass.py", "capture.py")
+
+# 포트/스크립트와 무관한 고정 mitmweb 인자
+# --set ssl_insecure=true : SSL 검증 완화 (디버깅용, 주의!)
+# --set verify_upstream_cert=false : 인증서 검증 완화
+# (주의: 보안상 프로덕션에서는 사용하지 마세요)
+_BASE_ARGS = (
+    "--ignore-hosts", "googleapis.com|google.com",
+    "--set", "ssl_insecure=true",
+    "--set", "verify_upstream_cert=false",
+)
+
 if __name__ == "__main__":
     # 포트 설정
     proxy_port = 8080  # 프록시 포트
@@ -30,15 +43,16 @@ if __name__ == "__main__":
     
     # capture.py 또는 capture_bypass.py가 있으면 자동으로 사용
     if script_file is None:
-        # 우선 capture_bypass.py 사용 (SSL 우회 모드)
-        bypass_path = Path("capture_bypass.py")
-        capture_path = Path("capture.py")
+        # 디렉토리를 한 번만 읽어 후보 스크립트 존재 여부 확인
+        with os.scandir(".") as entries:
+            existing = {entry.name for entry in entries if entry.name in _SCRIPT_CANDIDATES}
         
-        if bypass_path.exists():
-            script_file = str(bypass_path)
+        # 우선 capture_bypass.py 사용 (SSL 우회 모드)
+        if "capture_bypass.py" in existing:
+            script_file = "capture_bypass.py"
             print(f"[*] capture_bypass.py 스크립트 자동 감지 (SSL 우회 모드)")
-        elif capture_path.exists():
-            script_file = str(capture_path)
+        elif "capture.py" in existing:
+            script_file = "capture.py"
             print(f"[*] capture.py 스크립트 자동 감지")
     
     print("=" * 60)
@@ -56,17 +70,11 @@ if __name__ == "__main__":
     
     try:
         # mitmweb 실행 (포트 지정)
-        # --set confdir=~/.mitmproxy : 인증서 설정
-        # --set ssl_insecure=true : SSL 검증 완화 (디버깅용, 주의!)
         args = [
             "mitmweb",
             "--mode", f"regular@{proxy_port}",
             "--web-port", str(web_port),
-            "--ignore-hosts", "googleapis.com|google.com",
-            # SSL 검증 완화 (주의: 보안상 프로덕션에서는 사용하지 마세요)
-            "--set", "ssl_insecure=true",
-            # 인증서 검증 완화
-            "--set", "verify_upstream_cert=false",
+            *_BASE_ARGS,
         ]
         if script_file:
             args.extend(["-s", script_file])
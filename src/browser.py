@@ -2,19 +2,250 @@
 Playwright 브라우저 관리 모듈
 """
 
+import functools
 import platform
+import shutil
+import threading
 from pathlib import Path
 from typing import Optional
 
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, Route, sync_playwright
 
 from .config import ScrapingConfig
 from .exceptions import InstagramScraperError
 from .utils.logger import get_logger
 
+# 실제 Chrome 실행 파일 후보 경로 (Windows)
+_WINDOWS_CHROME_PATHS = (
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    str(Path.home() / r"AppData\Local\Google\Chrome\Application\chrome.exe"),
+)
+
+# block_resources 설정 시 요청 단계에서 차단할 리소스 타입 (DOM 데이터 수집에 필요 없는 대용량 응답)
+# stylesheet는 is_visible()/바운딩 박스 기반 요소 탐색이 레이아웃에 의존하므로 차단하지 않음
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+def _block_heavy_resources(route: Route) -> None:
+    """이미지/미디어/폰트 요청은 중단하고 나머지는 그대로 진행"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+@functools.lru_cache(maxsize=None)
+def _find_chrome_executable() -> Optional[str]:
+    """
+    실제 Chrome 실행 파일 경로 찾기 (Windows 전용)
+
+    결과는 프로세스당 한 번만 계산하여 캐시합니다.
+
+    Returns:
+        Chrome 실행 파일 경로, 없으면 None
+    """
+    if platform.system() != "Windows":
+        return None
+    return shutil.which("chrome") or next(
+        (path for path in _WINDOWS_CHROME_PATHS if Path(path).exists()), None
+    )
+
+
+def _minify_js(source: str) -> str:
+    """
+    JS 소스에서 주석 줄과 들여쓰기를 제거
+
+    줄 단위로만 처리하므로 자동 세미콜론 삽입(ASI)에 영향을 주지 않습니다.
+    """
+    lines = (line.strip() for line in source.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+# 봇 감지 우회를 위한 스텔스 스크립트 (import 시 한 번만 정리하여 모든 페이지에 재사용)
+_STEALTH_JS = _minify_js(
+    """
+    // WebDriver 속성 완전 제거
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+        configurable: true
+    });
+
+    // navigator.webdriver를 완전히 삭제
+    delete navigator.__proto__.webdriver;
+
+    // Chrome 객체 추가 (완전한 버전)
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+
+    // Permissions API 수정
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+
+    // Plugins 배열 추가 (실제 플러그인처럼)
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => {
+            const plugins = [];
+            for (let i = 0; i < 5; i++) {
+                plugins.push({
+                    0: { type: 'application/x-google-chrome-pdf', suffixes: 'pdf', description: 'Portable Document Format' },
+                    description: 'Portable Document Format',
+                    filename: 'internal-pdf-viewer',
+                    length: 1,
+                    name: 'Chrome PDF Plugin'
+                });
+            }
+            return plugins;
+        }
+    });
+
+    // Languages 설정
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['ko-KR', 'ko', 'en-US', 'en']
+    });
+
+    // Platform 설정
+    Object.defineProperty(navigator, 'platform', {
+        get: () => 'Win32'
+    });
+
+    // Hardware concurrency 설정
+    Object.defineProperty(navigator, 'hardwareConcurrency', {
+        get: () => 8
+    });
+
+    // Device memory 설정
+    Object.defineProperty(navigator, 'deviceMemory', {
+        get: () => 8
+    });
+
+    // Connection 설정
+    Object.defineProperty(navigator, 'connection', {
+        get: () => ({
+            effectiveType: '4g',
+            rtt: 50,
+            downlink: 10,
+            saveData: false,
+            onchange: null,
+            addEventListener: function() {},
+            removeEventListener: function() {},
+            dispatchEvent: function() { return true; }
+        })
+    });
+
+    // Canvas fingerprinting 방지
+    // 픽셀마다 Math.random()을 호출하지 않도록 -5~4 범위 노이즈를 typed array로 한 번에 만들고,
+    // 캔버스 크기가 같으면 재사용 (getRandomValues는 호출당 최대 65536바이트)
+    let canvasNoise = null;
+    const getCanvasNoise = (length) => {
+        if (!canvasNoise || canvasNoise.length !== length) {
+            canvasNoise = new Int8Array(length);
+            const bytes = new Uint8Array(canvasNoise.buffer);
+            for (let offset = 0; offset < length; offset += 65536) {
+                crypto.getRandomValues(bytes.subarray(offset, Math.min(offset + 65536, length)));
+            }
+            for (let i = 0; i < length; i++) {
+                canvasNoise[i] = (bytes[i] % 10) - 5;
+            }
+        }
+        return canvasNoise;
+    };
+    const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+    HTMLCanvasElement.prototype.toDataURL = function() {
+        const context = this.getContext('2d');
+        if (context) {
+            const imageData = context.getImageData(0, 0, this.width, this.height);
+            const pixels = imageData.data;
+            const noise = getCanvasNoise(pixels.length >> 2);
+            for (let i = 0, p = 0; i < pixels.length; i += 4, p++) {
+                pixels[i] += noise[p];
+            }
+            context.putImageData(imageData, 0, 0);
+        }
+        return originalToDataURL.apply(this, arguments);
+    };
+
+    // WebGL fingerprinting 방지
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {
+        if (parameter === 37445) {
+            return 'Intel Inc.';
+        }
+        if (parameter === 37446) {
+            return 'Intel Iris OpenGL Engine';
+        }
+        return getParameter.apply(this, arguments);
+    };
+
+    // AudioContext fingerprinting 방지
+    const AudioContext = window.AudioContext || window.webkitAudioContext;
+    if (AudioContext) {
+        const originalCreateOscillator = AudioContext.prototype.createOscillator;
+        AudioContext.prototype.createOscillator = function() {
+            const oscillator = originalCreateOscillator.apply(this, arguments);
+            const originalFrequency = oscillator.frequency.value;
+            Object.defineProperty(oscillator.frequency, 'value', {
+                get: () => originalFrequency + Math.random() * 0.0001,
+                set: (val) => { oscillator.frequency.value = val; }
+            });
+            return oscillator;
+        };
+    }
+
+    // Notification 권한 설정
+    const originalNotification = window.Notification;
+    window.Notification = function(title, options) {
+        return new originalNotification(title, options);
+    };
+    window.Notification.permission = 'default';
+    window.Notification.requestPermission = function() {
+        return Promise.resolve('default');
+    };
+
+    // Battery API 수정
+    if (navigator.getBattery) {
+        navigator.getBattery = function() {
+            return Promise.resolve({
+                charging: true,
+                chargingTime: 0,
+                dischargingTime: Infinity,
+                level: 1.0,
+                onchargingchange: null,
+                onchargingtimechange: null,
+                ondischargingtimechange: null,
+                onlevelchange: null,
+                addEventListener: function() {},
+                removeEventListener: function() {},
+                dispatchEvent: function() { return true; }
+            });
+        };
+    }
+"""
+)
+
 
 class BrowserManager:
-    """Playwright 브라우저 관리 클래스"""
+    """
+    Playwright 브라우저 관리 클래스
+
+    Playwright 드라이버와 실행된 브라우저는 프로세스 전체에서 공유하고(참조 카운트),
+    인스턴스마다 BrowserContext와 Page만 새로 생성합니다.
+    Playwright sync API 특성상 공유 객체는 처음 시작한 스레드에서만 사용해야 합니다.
+    """
+
+    _shared_lock = threading.Lock()
+    _shared_playwright: Optional[Playwright] = None
+    _playwright_refcount = 0
+    _shared_browsers: dict[tuple, Browser] = {}
+    _browser_refcounts: dict[tuple, int] = {}
 
     def __init__(self, config: ScrapingConfig) -> None:
         """
@@ -29,26 +260,81 @@ class BrowserManager:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._extra_pages: list[Page] = []
+        self.storage_state_loaded = False
+        self._browser_key: Optional[tuple] = None
+
+    @classmethod
+    def _acquire_playwright(cls) -> Playwright:
+        """공유 Playwright 드라이버 획득 (없으면 시작)"""
+        with cls._shared_lock:
+            if cls._shared_playwright is None:
+                cls._shared_playwright = sync_playwright().start()
+            cls._playwright_refcount += 1
+            return cls._shared_playwright
+
+    @classmethod
+    def _release_playwright(cls) -> None:
+        """공유 Playwright 드라이버 반환 (마지막 사용자면 종료)"""
+        with cls._shared_lock:
+            cls._playwright_refcount -= 1
+            if cls._playwright_refcount <= 0 and cls._shared_playwright is not None:
+                cls._shared_playwright.stop()
+                cls._shared_playwright = None
+                cls._playwright_refcount = 0
+
+    def _acquire_browser(self, browser_type, launch_options: dict) -> Browser:  # noqa: ANN001
+        """
+        실행 옵션이 같은 공유 브라우저 획득 (없거나 연결이 끊겼으면 새로 실행)
+
+        Args:
+            browser_type: Playwright BrowserType (chromium, firefox, webkit)
+            launch_options: 브라우저 실행 옵션
+
+        Returns:
+            Playwright Browser 객체
+        """
+        key = (
+            browser_type.name,
+            launch_options["headless"],
+            launch_options.get("executable_path"),
+        )
+        with self._shared_lock:
+            browser = self._shared_browsers.get(key)
+            if browser is None or not browser.is_connected():
+                browser = browser_type.launch(**launch_options)
+                self._shared_browsers[key] = browser
+                self._browser_refcounts[key] = 0
+            else:
+                self.logger.info("실행 중인 브라우저 재사용")
+            self._browser_refcounts[key] += 1
+        self._browser_key = key
+        return browser
+
+    def _release_browser(self) -> None:
+        """공유 브라우저 반환 (마지막 사용자면 종료)"""
+        key = self._browser_key
+        if key is None:
+            return
+        self._browser_key = None
+        with self._shared_lock:
+            self._browser_refcounts[key] -= 1
+            if self._browser_refcounts[key] > 0:
+                return
+            browser = self._shared_browsers.pop(key)
+            del self._browser_refcounts[key]
+        browser.close()
 
     def start(self) -> None:
         """브라우저 시작"""
         try:
             self.logger.info("Playwright 브라우저 시작 중...")
-            self.playwright = sync_playwright().start()
-
-            # 실제 Chrome 실행 파일 경로 찾기 (Windows)
-            chrome_executable_path = None
-            if platform.system() == "Windows":
-                possible_paths = [
-                    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-                    Path.home() / r"AppData\Local\Google\Chrome\Application\chrome.exe",
-                ]
-                for path in possible_paths:
-                    if Path(path).exists():
-                        chrome_executable_path = str(path)
-                        self.logger.info(f"실제 Chrome 발견: {chrome_executable_path}")
-                        break
+            self.playwright = self._acquire_playwright()
+
+            # 실제 Chrome 실행 파일 경로 찾기 (Windows, 캐시됨)
+            chrome_executable_path = _find_chrome_executable()
+            if chrome_executable_path:
+                self.logger.info(f"실제 Chrome 발견: {chrome_executable_path}")
 
             # 브라우저 타입 선택
             browser_type_map = {
@@ -101,8 +387,8 @@ class BrowserManager:
                 launch_options["executable_path"] = chrome_executable_path
                 self.logger.info("실제 Chrome 브라우저 사용 (봇 감지 우회 강화)")
 
-            # 브라우저 실행
-            self.browser = browser_type.launch(**launch_options)
+            # 브라우저 실행 (같은 옵션으로 이미 실행된 브라우저가 있으면 재사용)
+            self.browser = self._acquire_browser(browser_type, launch_options)
 
             # 실제 사용자처럼 보이게 하는 User-Agent (최신 Chrome)
             user_agent = (
@@ -148,186 +434,108 @@ class BrowserManager:
             if proxy_config:
                 context_options["proxy"] = proxy_config
 
+            # 저장된 브라우저 상태(쿠키/로컬 스토리지)가 있으면 복원
+            storage_state = self.config.playwright_storage_state
+            self.storage_state_loaded = bool(storage_state and storage_state.is_file())
+            if self.storage_state_loaded:
+                context_options["storage_state"] = str(storage_state)
+                self.logger.info(f"저장된 브라우저 상태 사용: {storage_state}")
+
             # 컨텍스트 생성 (쿠키, 세션 등 관리)
             self.context = self.browser.new_context(**context_options)
 
+            # 대용량 리소스 차단 (컨텍스트 단위로 등록하여 추가 페이지에도 적용)
+            if self.config.block_resources:
+                self.context.route("**/*", _block_heavy_resources)
+                self.logger.info("이미지/미디어/폰트 요청 차단 활성화")
+
             # 페이지 생성
-            self.page = self.context.new_page()
-            self.page.set_default_timeout(self.config.playwright_timeout)
-
-            # 강화된 WebDriver 속성 제거 및 스텔스 모드 (봇 감지 우회)
-            self.page.add_init_script(
-                """
-                // WebDriver 속성 완전 제거
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                    configurable: true
-                });
+            self.page = self._open_page()
 
-                // navigator.webdriver를 완전히 삭제
-                delete navigator.__proto__.webdriver;
-
-                // Chrome 객체 추가 (완전한 버전)
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: function() {},
-                    csi: function() {},
-                    app: {}
-                };
-
-                // Permissions API 수정
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-
-                // Plugins 배열 추가 (실제 플러그인처럼)
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => {
-                        const plugins = [];
-                        for (let i = 0; i < 5; i++) {
-                            plugins.push({
-                                0: { type: 'application/x-google-chrome-pdf', suffixes: 'pdf', description: 'Portable Document Format' },
-                                description: 'Portable Document Format',
-                                filename: 'internal-pdf-viewer',
-                                length: 1,
-                                name: 'Chrome PDF Plugin'
-                            });
-                        }
-                        return plugins;
-                    }
-                });
+            self.logger.info(f"브라우저 시작 완료: {self.config.playwright_browser}")
 
-                // Languages 설정
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['ko-KR', 'ko', 'en-US', 'en']
-                });
+        except Exception as e:
+            self.logger.error(f"브라우저 시작 실패: {e}")
+            self.close()
+            raise InstagramScraperError(f"브라우저 시작에 실패했습니다: {e}") from e
 
-                // Platform 설정
-                Object.defineProperty(navigator, 'platform', {
-                    get: () => 'Win32'
-                });
+    def _open_page(self) -> Page:
+        """현재 컨텍스트에 스텔스 스크립트가 적용된 새 페이지 생성"""
+        page = self.context.new_page()
+        page.set_default_timeout(self.config.playwright_timeout)
+        page.set_default_navigation_timeout(self.config.playwright_navigation_timeout)
 
-                // Hardware concurrency 설정
-                Object.defineProperty(navigator, 'hardwareConcurrency', {
-                    get: () => 8
-                });
+        # 강화된 WebDriver 속성 제거 및 스텔스 모드 (봇 감지 우회)
+        page.add_init_script(_STEALTH_JS)
+        return page
 
-                // Device memory 설정
-                Object.defineProperty(navigator, 'deviceMemory', {
-                    get: () => 8
-                });
+    def new_page(self) -> Page:
+        """
+        같은 컨텍스트(쿠키/세션 공유)에 추가 페이지 생성
 
-                // Connection 설정
-                Object.defineProperty(navigator, 'connection', {
-                    get: () => ({
-                        effectiveType: '4g',
-                        rtt: 50,
-                        downlink: 10,
-                        saveData: false,
-                        onchange: null,
-                        addEventListener: function() {},
-                        removeEventListener: function() {},
-                        dispatchEvent: function() { return true; }
-                    })
-                });
+        여러 페이지의 네비게이션을 동시에 진행할 때 사용하며, close()에서 함께 닫힌다.
 
-                // Canvas fingerprinting 방지
-                const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-                HTMLCanvasElement.prototype.toDataURL = function() {
-                    const context = this.getContext('2d');
-                    if (context) {
-                        const imageData = context.getImageData(0, 0, this.width, this.height);
-                        for (let i = 0; i < imageData.data.length; i += 4) {
-                            imageData.data[i] += Math.floor(Math.random() * 10) - 5;
-                        }
-                        context.putImageData(imageData, 0, 0);
-                    }
-                    return originalToDataURL.apply(this, arguments);
-                };
-
-                // WebGL fingerprinting 방지
-                const getParameter = WebGLRenderingContext.prototype.getParameter;
-                WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                    if (parameter === 37445) {
-                        return 'Intel Inc.';
-                    }
-                    if (parameter === 37446) {
-                        return 'Intel Iris OpenGL Engine';
-                    }
-                    return getParameter.apply(this, arguments);
-                };
-
-                // AudioContext fingerprinting 방지
-                const AudioContext = window.AudioContext || window.webkitAudioContext;
-                if (AudioContext) {
-                    const originalCreateOscillator = AudioContext.prototype.createOscillator;
-                    AudioContext.prototype.createOscillator = function() {
-                        const oscillator = originalCreateOscillator.apply(this, arguments);
-                        const originalFrequency = oscillator.frequency.value;
-                        Object.defineProperty(oscillator.frequency, 'value', {
-                            get: () => originalFrequency + Math.random() * 0.0001,
-                            set: (val) => { oscillator.frequency.value = val; }
-                        });
-                        return oscillator;
-                    };
-                }
+        Returns:
+            Playwright Page 객체
 
-                // Notification 권한 설정
-                const originalNotification = window.Notification;
-                window.Notification = function(title, options) {
-                    return new originalNotification(title, options);
-                };
-                window.Notification.permission = 'default';
-                window.Notification.requestPermission = function() {
-                    return Promise.resolve('default');
-                };
-
-                // Battery API 수정
-                if (navigator.getBattery) {
-                    navigator.getBattery = function() {
-                        return Promise.resolve({
-                            charging: true,
-                            chargingTime: 0,
-                            dischargingTime: Infinity,
-                            level: 1.0,
-                            onchargingchange: null,
-                            onchargingtimechange: null,
-                            ondischargingtimechange: null,
-                            onlevelchange: null,
-                            addEventListener: function() {},
-                            removeEventListener: function() {},
-                            dispatchEvent: function() { return true; }
-                        });
-                    };
-                }
-            """
-            )
+        Raises:
+            InstagramScraperError: 브라우저가 시작되지 않은 경우
+        """
+        if self.context is None:
+            raise InstagramScraperError("브라우저가 시작되지 않았습니다. start()를 먼저 호출하세요.")
+        page = self._open_page()
+        self._extra_pages.append(page)
+        return page
 
-            self.logger.info(f"브라우저 시작 완료: {self.config.playwright_browser}")
+    def save_storage_state(self) -> Optional[Path]:
+        """
+        현재 컨텍스트의 쿠키/로컬 스토리지를 playwright_storage_state 경로에 저장
+
+        다음 실행에서 start()가 이 파일을 읽어 로그인 상태를 복원한다.
 
+        Returns:
+            저장된 파일 경로, 경로가 설정되지 않았거나 실패하면 None
+        """
+        storage_state = self.config.playwright_storage_state
+        if storage_state is None or self.context is None:
+            return None
+        try:
+            storage_state.parent.mkdir(parents=True, exist_ok=True)
+            self.context.storage_state(path=str(storage_state))
+            self.logger.info(f"브라우저 상태 저장: {storage_state}")
+            return storage_state
         except Exception as e:
-            self.logger.error(f"브라우저 시작 실패: {e}")
-            raise InstagramScraperError(f"브라우저 시작에 실패했습니다: {e}") from e
+            self.logger.warning(f"브라우저 상태 저장 실패: {e}")
+            return None
 
     def close(self) -> None:
-        """브라우저 종료"""
+        """브라우저 종료 (이 인스턴스의 context/page를 닫고 공유 브라우저 반환)"""
         try:
+            for page in self._extra_pages:
+                page.close()
             if self.page:
                 self.page.close()
             if self.context:
                 self.context.close()
-            if self.browser:
-                self.browser.close()
-            if self.playwright:
-                self.playwright.stop()
 
             self.logger.info("브라우저 종료 완료")
 
         except Exception as e:
             self.logger.warning(f"브라우저 종료 중 오류: {e}")
+        finally:
+            # 공유 브라우저/드라이버는 참조 카운트가 0이 될 때만 실제로 종료
+            try:
+                if self.browser:
+                    self._release_browser()
+                if self.playwright:
+                    self._release_playwright()
+            except Exception as e:
+                self.logger.warning(f"브라우저 종료 중 오류: {e}")
+            self.page = None
+            self._extra_pages = []
+            self.context = None
+            self.browser = None
+            self.playwright = None
 
     def get_page(self) -> Page:
         """
@@ -3,12 +3,17 @@
 Pydantic을 사용한 타입 안전한 설정 관리
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# 허용되는 출력 형식/로깅 레벨 (검증할 때마다 리스트를 새로 만들지 않도록 모듈 상수로 유지)
+VALID_OUTPUT_FORMATS = frozenset({"json", "csv"})
+VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
 
 class ScrapingConfig(BaseSettings):
     """스크래핑 설정"""
@@ -32,12 +37,18 @@ class ScrapingConfig(BaseSettings):
     # Playwright 설정
     playwright_headless: bool = Field(default=True, description="헤드리스 모드")
     playwright_timeout: int = Field(default=30000, ge=1000, le=120000, description="타임아웃 (밀리초)")
+    playwright_navigation_timeout: int = Field(
+        default=15000, ge=1000, le=120000, description="페이지 이동 타임아웃 (밀리초)"
+    )
     playwright_browser: str = Field(
         default="chromium", description="브라우저 (chromium, firefox, webkit)"
     )
     playwright_storage_state: Optional[Path] = Field(
         default=None, description="브라우저 상태 저장 경로 (쿠키/세션 유지)"
     )
+    block_resources: bool = Field(
+        default=False, description="이미지/미디어/폰트 요청 차단 (DOM 데이터만 수집할 때)"
+    )
 
     # 프록시 설정
     proxy_server: Optional[str] = Field(
@@ -49,6 +60,13 @@ class ScrapingConfig(BaseSettings):
     # 스크래핑 제한
     max_reels: Optional[int] = Field(default=None, ge=1, description="최대 수집 개수")
     request_delay: float = Field(default=2.0, ge=0.0, description="요청 간 딜레이 (초)")
+    requests_per_hour: int = Field(
+        default=180, ge=1, description="시간당 최대 페이지 이동 수 (요청 제한 회피)"
+    )
+    max_concurrency: int = Field(default=4, ge=1, le=16, description="동시에 로드할 페이지 수")
+    reel_tabs: int = Field(
+        default=1, ge=1, le=8, description="릴스 피드 수집에 함께 사용할 탭 수 (차례로 넘김)"
+    )
 
     @field_validator("max_reels", mode="before")
     @classmethod
@@ -66,6 +84,12 @@ class ScrapingConfig(BaseSettings):
     # 로깅 설정
     log_level: str = Field(default="INFO", description="로깅 레벨")
     log_file: Optional[Path] = Field(default=None, description="로그 파일 경로")
+    log_fast: bool = Field(
+        default=False, description="콘솔 로그를 색상 없이 시간/레벨/메시지만 출력"
+    )
+    save_debug_artifacts: bool = Field(
+        default=False, description="로그인 페이지 HTML/스크린샷 저장 (디버깅용)"
+    )
 
     @field_validator("log_file", mode="before")
     @classmethod
@@ -91,20 +115,27 @@ class ScrapingConfig(BaseSettings):
     @classmethod
     def validate_output_format(cls, v: str) -> str:
         """출력 형식 검증"""
-        if v.lower() not in ["json", "csv"]:
+        output_format = v.casefold()
+        if output_format not in VALID_OUTPUT_FORMATS:
             raise ValueError("output_format은 'json' 또는 'csv'여야 합니다.")
-        return v.lower()
+        return output_format
 
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """로깅 레벨 검증"""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"log_level은 {valid_levels} 중 하나여야 합니다.")
-        return v.upper()
+        level = v.upper()
+        if level not in VALID_LOG_LEVELS:
+            raise ValueError("log_level은 DEBUG, INFO, WARNING, ERROR, CRITICAL 중 하나여야 합니다.")
+        return level
 
 
+@lru_cache(maxsize=1)
 def load_config() -> ScrapingConfig:
-    """설정 로드"""
+    """
+    설정 로드
+
+    .env 파싱과 검증은 처음 한 번만 수행하고 이후에는 같은 인스턴스를 반환한다.
+    환경 변수를 바꾼 뒤 다시 읽으려면 load_config.cache_clear()를 호출한다.
+    """
     return ScrapingConfig()
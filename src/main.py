@@ -18,6 +18,7 @@ def main() -> None:
     setup_logger(
         log_level=config.log_level,
         log_file=config.log_file,
+        fast=config.log_fast,
     )
 
     logger = get_logger(__name__)
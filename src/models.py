@@ -3,13 +3,43 @@
 Pydantic을 사용한 타입 안전한 데이터 모델
 """
 
+import re
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, field_validator
+
+__all__ = [
+    "ReelData",
+    "ShortrendReelData",
+    "REEL_ADAPTER",
+    "REEL_LIST_ADAPTER",
+    "REEL_ID_RE",
+    "SHORTREND_ADAPTER",
+    "SHORTREND_LIST_ADAPTER",
+]
+
+# 릴스 URL의 shortcode (/reel/<id>/, /reels/<id>/)
+REEL_ID_RE = re.compile(r"/reels?/([^/?#]+)/?")
 
 
 class ReelData(BaseModel):
-    """릴스 데이터 모델"""
+    """릴스 데이터 모델 (생성 후 변경 불가)"""
+
+    model_config = ConfigDict(
+        frozen=True,
+        str_strip_whitespace=True,
+        json_schema_extra={
+            "example": {
+                "thumbnail": "https://example.com/thumbnail.jpg",
+                "likes": 1234,
+                "comments": 56,
+                "author": "username",
+                "music": "Song Name - Artist",
+                "link": "https://www.instagram.com/reel/abc123/",
+            }
+        },
+    )
 
     thumbnail: Optional[str] = Field(default=None, description="영상 썸네일 URL")
     likes: Optional[int] = Field(default=None, ge=0, description="좋아요 수")
@@ -23,24 +53,16 @@ class ReelData(BaseModel):
     @field_validator("author")
     @classmethod
     def validate_author(cls, v: Optional[str]) -> Optional[str]:
-        """작성자 이름 검증"""
-        if v is not None and len(v.strip()) == 0:
+        """작성자 이름 검증 (공백은 str_strip_whitespace로 이미 제거됨)"""
+        if v == "":
             return None
         return v
 
-    class Config:
-        """Pydantic 설정"""
-
-        json_schema_extra = {
-            "example": {
-                "thumbnail": "https://example.com/thumbnail.jpg",
-                "likes": 1234,
-                "comments": 56,
-                "author": "username",
-                "music": "Song Name - Artist",
-                "link": "https://www.instagram.com/reel/abc123/",
-            }
-        }
+    @cached_property
+    def reel_id(self) -> Optional[str]:
+        """링크의 릴스 shortcode (중복 체크 키, 처음 접근할 때 한 번만 계산하며 직렬화되지 않음)"""
+        match = REEL_ID_RE.search(str(self.link)) if self.link else None
+        return match.group(1) if match else None
 
 
 class ShortrendReelData(BaseModel):
@@ -79,3 +101,12 @@ class ShortrendReelData(BaseModel):
 
     # 원본 데이터 (디버깅용)
     raw_data: Optional[dict] = Field(default=None, description="원본 추출 데이터")
+
+
+# 검증/직렬화 스키마는 생성 비용이 크므로 모듈 로드 시 한 번만 만들어 재사용
+REEL_ADAPTER: TypeAdapter[ReelData] = TypeAdapter(ReelData)
+REEL_LIST_ADAPTER: TypeAdapter[list[ReelData]] = TypeAdapter(list[ReelData])
+SHORTREND_ADAPTER: TypeAdapter[ShortrendReelData] = TypeAdapter(ShortrendReelData)
+SHORTREND_LIST_ADAPTER: TypeAdapter[list[ShortrendReelData]] = TypeAdapter(
+    list[ShortrendReelData]
+)
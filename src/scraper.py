@@ -1,10 +1,19 @@
+import csv
+import gzip
+import hashlib
 import json
+import random
 import re
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page, Response
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from .browser import BrowserManager
 from .config import ScrapingConfig
@@ -15,10 +24,624 @@ from .exceptions import (
     RateLimitError,
     ScrapingError,
 )
-from .models import ReelData
+from .models import REEL_ADAPTER, REEL_ID_RE, REEL_LIST_ADAPTER, ReelData
+from .utils.dedup import PersistentKeys, RecentKeys
 from .utils.human_behavior import random_delay, random_mouse_movement, simulate_page_interaction
 from .utils.logger import get_logger
-from .utils.wait_utils import safe_fill_input, wait_for_element, wait_for_page_load
+from .utils.rate_limit import RateLimiter
+from .utils.wait_utils import (
+    combine_selectors,
+    first_visible_selector,
+    safe_fill_input,
+    wait_for_element,
+    wait_for_page_load,
+)
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # 선택 의존성: 없으면 표준 csv 모듈로 기록
+    pa = pacsv = None
+
+# 로그인 화면 셀렉터 (우선순위 순, 호출마다 리스트를 새로 만들지 않도록 모듈 상수로 유지)
+LOGIN_LINK_SELECTORS = (  # 로그인 링크
+    'a[href*="/accounts/login"]',
+    'a:has-text("Log in")',
+    'a:has-text("로그인")',
+)
+USERNAME_SELECTORS = (  # 사용자명 입력 필드
+    "#loginForm > div > div:nth-child(1) > div > label > input",  # 제공된 셀렉터 (간소화)
+    '#loginForm input[type="text"]',  # 더 간단한 대안
+    'input[name="username"]',
+    'input[aria-label*="전화번호"]',
+    'input[aria-label*="사용자 이름"]',
+)
+PASSWORD_SELECTORS = (  # 비밀번호 입력 필드
+    "#loginForm > div > div:nth-child(2) > div > label > input",  # 제공된 셀렉터 (간소화)
+    '#loginForm input[type="password"]',  # 더 간단한 대안
+    'input[name="password"]',
+    'input[type="password"]',
+)
+LOGIN_BUTTON_SELECTORS = (  # 로그인 버튼
+    "#loginForm > div > div:nth-child(3)",  # 제공된 셀렉터 (간소화)
+    "#loginForm > div > div:nth-child(3) button",  # 버튼이 내부에 있는 경우
+    '#loginForm button[type="submit"]',
+    'button[type="submit"]',
+    'button:has-text("Log in")',
+    'button:has-text("로그인")',
+)
+
+# 로그인 후 팝업 셀렉터 (0.5초마다 폴링하므로 매번 리스트를 새로 만들지 않음)
+POPUP_CONTAINER_SELECTORS = (  # 팝업 컨테이너
+    # 사용자 제공 셀렉터를 짧게 줄인 형태 (Instagram 팝업 레이어 안의 다이얼로그)
+    'body > div.x1n2onr6.xzkaem6 div[role="dialog"]',
+    # Instagram 팝업의 일반적인 패턴 (클래스명의 일부 사용)
+    'body > div.x1n2onr6.xzkaem6',
+    'div[role="dialog"]',
+    '[data-testid="modal"]',
+    '.x1n2onr6[role="dialog"]',
+    # 모달/다이얼로그 패턴
+    'div[role="presentation"]',
+    'div._a9-z',  # Instagram 알림 모달
+    'div._a9--',
+)
+# 컨테이너 셀렉터는 모두 순수 CSS이므로 쉼표로 결합해 한 번의 대기로 감시
+POPUP_CONTAINER_UNION = ", ".join(POPUP_CONTAINER_SELECTORS)
+POPUP_MAX_WAIT = 15.0  # 팝업 처리 전체 제한 시간 (초)
+POPUP_APPEAR_TIMEOUT = 2500  # 로그인 후 첫 팝업이 나타나기를 기다리는 시간 (밀리초)
+POPUP_FOLLOWUP_TIMEOUT = 1000  # 팝업을 닫은 뒤 다음 팝업을 기다리는 시간 (밀리초)
+POPUP_BUTTON_TEXTS = (  # 팝업 확인/닫기 버튼 텍스트 또는 aria-label (우선순위 순)
+    "확인",
+    "OK",
+    "Okay",
+    "Got it",
+    "알겠습니다",
+    "다음",
+    "Next",
+    "Close",
+    "닫기",
+)
+
+# 팝업(다이얼로그) DOM 삽입을 페이지 안에서 감지해 바인딩으로 알림 (Python 쪽 폴링 없음)
+# add_init_script는 문서 생성 직후 실행되어 body가 없을 수 있으므로 documentElement를 감시
+_POPUP_OBSERVER_JS = """
+(() => {
+    const isPopup = (n) =>
+        n.nodeType === 1 &&
+        (n.matches?.('div[role="dialog"], [role="presentation"]') ||
+            n.querySelector?.('div[role="dialog"]'));
+    new MutationObserver((mutations) => {
+        for (const m of mutations) {
+            for (const n of m.addedNodes) {
+                if (isPopup(n)) {
+                    window._onPopup(n.outerHTML.slice(0, 80));
+                    return;
+                }
+            }
+        }
+    }).observe(document.documentElement, { childList: true, subtree: true });
+})();
+"""
+
+# 팝업 안의 확인/닫기 버튼을 페이지 안에서 찾아 클릭 (버튼마다 is_visible/click 왕복 없음)
+# 텍스트/aria-label 비교는 :has-text()와 같이 대소문자 무시 부분 일치
+# 클릭한 버튼 설명을 반환하고, 찾지 못하면 null 반환
+_CLOSE_POPUP_JS = """
+([containerSelector, texts]) => {
+    const visible = (el) => el.getClientRects().length > 0;
+    const root =
+        [...document.querySelectorAll(containerSelector)].find(visible) || document;
+    const candidates = [
+        ...root.querySelectorAll('button, [role="button"], [aria-label], [data-testid]'),
+    ].filter((el) => visible(el) && !el.disabled);
+    const click = (el) => {
+        const target = el.closest('button, [role="button"]') || el;
+        target.dispatchEvent(new MouseEvent("click", { bubbles: true, cancelable: true }));
+    };
+    const label = (el) => (el.getAttribute("aria-label") || "").toLowerCase();
+    const text = (el) => (el.innerText || "").toLowerCase();
+    for (const token of texts.map((t) => t.toLowerCase())) {
+        const el = candidates.find(
+            (c) => (c.tagName === "BUTTON" && text(c).includes(token)) || label(c).includes(token)
+        );
+        if (el) {
+            click(el);
+            return `text=${token}`;
+        }
+    }
+    for (const testId of ["confirm", "ok", "close"]) {
+        const el = candidates.find((c) => c.dataset.testid === testId);
+        if (el) {
+            click(el);
+            return `data-testid=${testId}`;
+        }
+    }
+    const dialogButton = candidates.find(
+        (c) => c.tagName === "BUTTON" && c.closest('div[role="dialog"]')
+    );
+    if (dialogButton) {
+        click(dialogButton);
+        return 'div[role="dialog"] button';
+    }
+    return null;
+}
+"""
+
+# 릴스 탭 셀렉터 (사용자 제공 셀렉터 및 일반적인 대안)
+REELS_TAB_SELECTORS = (
+    # 사용자 제공 셀렉터
+    '#mount_0_0_fz > div > div > div.x9f619.x1n2onr6.x1ja2u2z > div > div > div.x78zum5.xdt5ytf.x1t2pt76.x1n2onr6.x1ja2u2z.x10cihs4 > div.html-div.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x9f619.x16ye13r.xvbhtw8.x78zum5.x15mokao.x1ga7v0g.x16uus16.xbiv7yw.x1uhb9sk.x1plvlek.xryxfnj.x1c4vz4f.x2lah0s.x1q0g3np.xqjyukv.x1qjc9v5.x1oa3qoh.x1qughib > div.html-div.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x9f619.xjbqb8w.x78zum5.x15mokao.x1ga7v0g.x16uus16.xbiv7yw.xixxii4.x13vifvy.x1plvlek.xryxfnj.x1c4vz4f.x2lah0s.xdt5ytf.xqjyukv.x1qjc9v5.x1oa3qoh.x1nhvcw1.x1dr59a3.xeq5yr9.x1n327nk > div > div > div > div > div.x1iyjqo2.xh8yej3 > div:nth-child(4) > span > div > a > div',
+    # 일반적인 릴스 탭 셀렉터들
+    'a[href="/reels/"]',
+    'a[href*="/reels"]',
+    'div:has-text("릴스")',
+    'div:has-text("Reels")',
+    'span:has-text("릴스")',
+    'span:has-text("Reels")',
+    # Instagram 네비게이션 바에서 릴스 찾기
+    'nav a[href*="/reels"]',
+    'nav span:has-text("릴스")',
+    'nav span:has-text("Reels")',
+)
+REELS_CONTAINER_SELECTORS = (  # 릴스 페이지 컨테이너
+    "section > main > div",
+    "div.xvc5jky",
+    "main > div",
+)
+LIKE_BUTTON_SELECTORS = (  # 좋아요 버튼
+    'svg[aria-label="좋아요"]',
+    'button[aria-label*="좋아요"]',
+    'svg[aria-label*="Like"]',
+)
+COMMENT_BUTTON_SELECTORS = (  # 댓글 버튼
+    'svg[aria-label="댓글"]',
+    'button[aria-label*="댓글"]',
+    'svg[aria-label*="Comment"]',
+)
+# 숫자 필드 추출 규칙 (필드명, 버튼 셀렉터(쉼표 결합), 백업용 아이콘 셀렉터, 숫자 텍스트 패턴)
+# 두 필드 모두 _EXTRACT_REEL_JS의 같은 함수가 처리하고 결과는 _parse_ko_count로 변환
+_COUNT_FIELDS = (
+    (
+        "likes",
+        ", ".join(LIKE_BUTTON_SELECTORS),
+        'svg[aria-label="좋아요"], svg[aria-label*="Like"]',
+        r"^[\d.,만천억\s]+$",  # "17.4만", "4346", "1,234"
+    ),
+    (
+        "comments",
+        ", ".join(COMMENT_BUTTON_SELECTORS),
+        'svg[aria-label="댓글"], svg[aria-label*="Comment"]',
+        r"^[\d,\s]+$",
+    ),
+)
+
+# 릴스 URL 파싱용 정규식 (폴링/추출 루프에서 반복 사용되므로 미리 컴파일)
+_URL_AUTHOR_RE = re.compile(r"^https?://[^/]+/([^/]+)/reels?/[^/?#]+")  # /username/reel/shortcode/
+_REELS_URL_RE = re.compile(r"/reels")
+# 피드 스크롤 시 다음 릴스 정보(좋아요/댓글/작성자 등)를 미리 받아오는 API 요청 URL
+_REEL_API_URL_PARTS = ("/graphql", "/api/v1/clips")
+
+# 릴스 피드
+REELS_URL = "https://www.instagram.com/reels/"
+
+# 릴스 카드
+REEL_CARD_SELECTOR = "div.x1qjc9v5"
+ACTIVE_REEL_CARD_SELECTOR = f'{REEL_CARD_SELECTOR}[data-active-reel="1"]'
+# 릴스 카드 또는 페이지 컨테이너 중 하나라도 보이면 릴스 페이지가 준비된 것으로 판단
+REELS_PAGE_READY_SELECTOR = (
+    ", ".join((REEL_CARD_SELECTOR, *REELS_CONTAINER_SELECTORS)) + " >> visible=true"
+)
+
+# 화면에 절반 이상 보이는 릴스 카드에 data-active-reel="1"을 붙여두는 IntersectionObserver
+# (카드는 스크롤 중에 계속 추가되므로 MutationObserver로 새 카드도 관찰 대상에 등록)
+_ACTIVE_REEL_OBSERVER_JS = """
+(() => {
+    const CARD = "%s";
+    const intersections = new IntersectionObserver(
+        (entries) => {
+            for (const e of entries) {
+                if (!e.isIntersecting || e.intersectionRatio < 0.5) continue;
+                for (const el of document.querySelectorAll("[data-active-reel]")) {
+                    if (el !== e.target) el.removeAttribute("data-active-reel");
+                }
+                e.target.setAttribute("data-active-reel", "1");
+            }
+        },
+        { threshold: [0.5] }
+    );
+    const observed = new WeakSet();
+    const observe = (el) => {
+        if (!observed.has(el)) {
+            observed.add(el);
+            intersections.observe(el);
+        }
+    };
+    new MutationObserver((mutations) => {
+        for (const m of mutations) {
+            for (const n of m.addedNodes) {
+                if (n.nodeType !== 1) continue;
+                if (n.matches(CARD)) observe(n);
+                n.querySelectorAll(CARD).forEach(observe);
+            }
+        }
+    }).observe(document.documentElement, { childList: true, subtree: true });
+})();
+""" % REEL_CARD_SELECTOR
+
+# 이동 후 새 릴스가 자리를 잡았는지 확인 (wait_for_function 폴링용)
+# 화면 중앙을 덮는 활성 카드의 영상 메타데이터가 로드되고, 스크롤 애니메이션이 끝나
+# 연속 두 번의 폴링에서 같은 카드가 같은 위치에 있으면 완료로 판단
+# (폴링 상태는 호출마다 다른 token으로 구분해 이전 대기의 값을 재사용하지 않음)
+_REEL_SETTLED_JS = """
+({ selector, token }) => {
+    const mid = innerHeight / 2;
+    const card = [...document.querySelectorAll(selector)].find((c) => {
+        const r = c.getBoundingClientRect();
+        return r.top <= mid && r.bottom >= mid;
+    });
+    const video = card && card.querySelector("video");
+    if (!video || video.readyState < 1) return false;
+    const top = card.getBoundingClientRect().top;
+    const prev = window.__reelSettle;
+    window.__reelSettle = { token, card, top };
+    return !!prev && prev.token === token && prev.card === card && prev.top === top;
+}
+"""
+
+# 해시태그 검색 결과의 릴스 카드 링크
+REEL_LINK_SELECTOR = 'a[href*="/reel/"]'
+
+# 릴스 카드에서 필요한 필드만 페이지 안에서 한 번에 추출 (전체 DOM을 CDP로 복사하지 않음)
+# 같은 릴스로 가는 링크가 여러 개일 수 있으므로 href 기준으로 중복 제거 후 limit개까지만 반환
+_REEL_CARDS_JS = """
+(links, limit) => {
+    const seen = new Set();
+    const cards = [];
+    for (const a of links) {
+        if (cards.length >= limit) break;
+        const href = a.href;
+        if (!href || seen.has(href)) continue;
+        seen.add(href);
+        const img = a.querySelector("img");
+        cards.push({
+            link: href,
+            thumbnail: (img && img.src) || null,
+            title: (img && img.alt) || null,
+        });
+    }
+    return cards;
+}
+"""
+
+# 현재 릴스의 모든 필드를 페이지 안에서 한 번에 수집 (필드별 locator/is_visible/text_content 왕복 없음)
+# 셀렉터 순서와 조건은 기존 Python 추출 규칙(reels.txt 기준)을 그대로 따르고,
+# 좋아요/댓글은 숫자 텍스트만 반환하여 Python에서 정수로 변환
+_EXTRACT_REEL_JS = """
+({ countFields, cardSelector, activeCardSelector, authorHint }) => {
+    const visible = (el) => !!el && el.getClientRects().length > 0;
+    const text = (el) => ((el && el.textContent) || "").trim();
+    const centerY = (el) => {
+        const r = el.getBoundingClientRect();
+        return r.top + r.height / 2;
+    };
+    const closestToCenter = (elements, limit) => {
+        let best = null;
+        let bestDist = Infinity;
+        for (const el of [...elements].slice(0, limit)) {
+            const r = el.getBoundingClientRect();
+            if (r.bottom <= 0 || r.top >= innerHeight) continue;
+            const d = Math.abs(r.top + r.height / 2 - innerHeight / 2);
+            if (d < bestDist) {
+                bestDist = d;
+                best = el;
+            }
+        }
+        return best;
+    };
+    // 자기 자신을 제외한 가장 가까운 조상 (XPath ancestor:: 축과 같음, 브라우저 기본 closest 사용)
+    const ancestor = (el, selector) => (el && el.parentElement?.closest(selector)) || null;
+    const htmlDivAncestors = (el, limit) => {
+        const found = [];
+        for (let d = ancestor(el, 'div[class*="html-div"]'); d && found.length < limit; ) {
+            found.push(d);
+            d = ancestor(d, 'div[class*="html-div"]');
+        }
+        return found;
+    };
+    const numberNear = (containers, pattern) => {
+        for (const c of containers) {
+            const spans = [...c.querySelectorAll("span.html-span.x1vvkbs")].slice(0, 3);
+            for (const s of spans) {
+                const t = text(s);
+                if (pattern.test(t)) return t;
+            }
+        }
+        return null;
+    };
+
+    // 현재 video: 화면 중앙 좌표의 요소가 속한 카드(video가 하나뿐인 가장 가까운 div)의 video,
+    // 중앙이 카드 밖이거나 오버레이에 가려졌으면 세로 중앙이 화면 중앙에 가장 가까운 video
+    const hit = document.elementFromPoint(innerWidth / 2, innerHeight / 2);
+    const hitCard = hit && hit.closest("div:has(video)");
+    const video =
+        (hitCard && hitCard.querySelectorAll("video").length === 1
+            ? hitCard.querySelector("video")
+            : null) || closestToCenter(document.querySelectorAll("video"), 20);
+
+    // 현재 릴스 컨테이너: video의 카드 > 관찰자가 표시한 카드 > 중앙 카드 > 페이지 전체
+    let root = null;
+    if (video) {
+        root = ancestor(video, 'div:has(svg[aria-label="좋아요"])') || ancestor(video, "div");
+    } else {
+        root =
+            document.querySelector(activeCardSelector) ||
+            closestToCenter(document.querySelectorAll(cardSelector), 12);
+    }
+    const scope = root || document;
+
+    // 좋아요/댓글 수: 방법 1 - 컨테이너 안의 버튼에서 가까운 html-div 3개 안의 숫자
+    // 방법 2 - 현재 video와 세로 위치가 가장 가까운 아이콘의 html-div 안의 숫자
+    const countText = (buttonSelector, iconSelector, pattern) => {
+        // 버튼 셀렉터는 쉼표로 묶여 있어 한 번의 매칭으로 후보를 모두 얻고, 보이는 버튼 3개까지 시도
+        let tries = 0;
+        for (const button of scope.querySelectorAll(buttonSelector)) {
+            if (!visible(button)) continue;
+            const found = numberNear(htmlDivAncestors(button, 3), pattern);
+            if (found !== null) return found;
+            if (++tries >= 3) break;
+        }
+        if (!video) return null;
+        const videoY = centerY(video);
+        let icon = null;
+        let bestDist = Infinity;
+        for (const el of [...document.querySelectorAll(iconSelector)].slice(0, 10)) {
+            const d = Math.abs(centerY(el) - videoY);
+            if (d < bestDist) {
+                bestDist = d;
+                icon = el;
+            }
+        }
+        return icon ? numberNear(htmlDivAncestors(icon, 1), pattern) : null;
+    };
+    const counts = {};
+    for (const [name, buttonSelector, iconSelector, pattern] of countFields) {
+        counts[name] = countText(buttonSelector, iconSelector, new RegExp(pattern));
+    }
+
+    // 크리에이터: URL에서 이미 알아낸 값(authorHint)이 있으면 그대로 사용
+    // 방법 1 - "님의 릴스" 링크의 href(/username/reels/) 또는 내부 텍스트
+    // 방법 2 - 프로필 이미지가 든 링크의 텍스트
+    let author = authorHint || null;
+    const creatorLink = scope.querySelector('a[aria-label*="님의 릴스"]');
+    if (!author && visible(creatorLink)) {
+        const href = creatorLink.getAttribute("href") || "";
+        if (href.startsWith("/") && href.includes("/reels/")) {
+            const m = href.match(/^\\/([^/]+)\\/reels/);
+            if (m) {
+                author = m[1];
+            } else {
+                const span = creatorLink.querySelector('span[dir="auto"]');
+                if (visible(span) && text(span) && text(span).length < 50) author = text(span);
+            }
+        }
+    }
+    if (!author) {
+        for (const img of [...scope.querySelectorAll('img[alt*="프로필 사진"]')].slice(0, 5)) {
+            const span = img.closest("a")?.querySelector('span[dir="auto"]');
+            if (visible(span) && text(span) && text(span).length < 50) {
+                author = text(span);
+                break;
+            }
+        }
+    }
+
+    // 프로필 사진: alt에 "님의 프로필 사진"이 있는 이미지 > 크리에이터 링크 안의 이미지
+    let profileImage = null;
+    const profileImg = scope.querySelector('img[alt*="님의 프로필 사진"]');
+    if (visible(profileImg) && (profileImg.getAttribute("src") || "").includes("cdninstagram")) {
+        profileImage = profileImg.getAttribute("src");
+    }
+    if (!profileImage && visible(creatorLink)) {
+        const img = creatorLink.querySelector('img[src*="cdninstagram"]');
+        if (visible(img)) profileImage = img.getAttribute("src") || null;
+    }
+
+    // 배경음악: /reels/audio/ 링크 안의 span 또는 링크 텍스트 > "오리지널 오디오" 패턴
+    const musicSpans = "span.xuxw1ft, span.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft";
+    let music = null;
+    const audioLink = scope.querySelector('a[href*="/reels/audio/"]');
+    if (visible(audioLink)) {
+        const span = [...audioLink.querySelectorAll(musicSpans)]
+            .slice(0, 3)
+            .find((s) => text(s).length > 3);
+        music = span ? text(span) : text(audioLink).length > 3 ? text(audioLink) : null;
+    }
+    if (!music) {
+        // 길이 조건을 먼저 보고, 찾는 즉시 멈춤 (앞쪽 span에서 찾으면 나머지 텍스트는 읽지 않음)
+        const markers = ["오리지널 오디오", "· 오리지널"];
+        for (const el of [...scope.querySelectorAll(musicSpans)].slice(0, 20)) {
+            const t = text(el);
+            if (t.length > 5 && markers.some((m) => t.includes(m))) {
+                music = t;
+                break;
+            }
+        }
+    }
+
+    // 제목: 제목 스타일 span > 긴 span[dir="auto"] (작성자/음악/멘션/숫자 제외)
+    const excluded = new Set([author, music].filter(Boolean));
+    const findTitle = (selector, limit, minLength, prefixes) => {
+        for (const el of [...scope.querySelectorAll(selector)].slice(0, limit)) {
+            const t = text(el);
+            if (
+                t.length > minLength &&
+                t.length < 500 &&
+                !excluded.has(t) &&
+                !prefixes.some((p) => t.startsWith(p)) &&
+                !/^[\\d,]+$/.test(t)
+            ) {
+                return t;
+            }
+        }
+        return null;
+    };
+    const title =
+        findTitle("span.x6ikm8r.x10wlt62.xuxw1ft", 10, 5, ["@", "오리지널"]) ||
+        findTitle('span[dir="auto"]', 20, 10, ["@"]);
+
+    // 썸네일: video poster > 썸네일 클래스(xz74otr) 이미지 > video 근처 이미지 (프로필 사진 제외)
+    let thumbnail = null;
+    if (video && (video.getAttribute("poster") || "").includes("cdninstagram")) {
+        thumbnail = video.getAttribute("poster");
+    }
+    const thumbStart = video || root;
+    if (!thumbnail && thumbStart) {
+        const holder = ancestor(thumbStart, 'div:has(img[class*="xz74otr"])');
+        const img = holder?.querySelector(
+            'img.xz74otr[src*="cdninstagram"]:not([alt*="님의 프로필 사진"])'
+        );
+        const src = visible(img) ? img.getAttribute("src") || "" : "";
+        if (src.includes("t51") || src.includes("t52")) thumbnail = src;
+    }
+    if (!thumbnail && video) {
+        const holder = ancestor(ancestor(video, "div"), "div");
+        const img = holder?.querySelector(
+            'img[src*="cdninstagram"][src*="/v/t"]:not([alt*="님의 프로필 사진"])'
+        );
+        if (visible(img)) thumbnail = img.getAttribute("src") || null;
+    }
+
+    return {
+        counts,
+        author,
+        profileImage,
+        title,
+        thumbnail,
+        music,
+        link: location.href.includes("instagram.com") ? location.href : null,
+        container: video ? "video" : root ? "card" : "page",
+    };
+}
+"""
+
+# 추출 스크립트를 컨텍스트의 init script로 한 번만 설치해 window.__scrapeReel로 노출
+# (바뀌지 않는 셀렉터/정규식은 미리 채워 두고, 릴스마다 달라지는 작성자 힌트만 인자로 받음)
+_SCRAPE_REEL_INIT_JS = "window.__scrapeReel = (authorHint) => (%s)({...%s, authorHint});" % (
+    _EXTRACT_REEL_JS.strip(),
+    json.dumps(
+        {
+            "countFields": _COUNT_FIELDS,
+            "cardSelector": REEL_CARD_SELECTOR,
+            "activeCardSelector": ACTIVE_REEL_CARD_SELECTOR,
+        },
+        ensure_ascii=False,
+    ),
+)
+# 설치 전에 열린 문서라면 함수가 없으므로 null을 돌려주고 전체 스크립트로 다시 추출
+_CALL_SCRAPE_REEL_JS = "hint => (window.__scrapeReel ? window.__scrapeReel(hint) : null)"
+
+
+def _reel_id(url: str) -> Optional[str]:
+    """
+    URL에서 릴스 shortcode 추출 (/reel/<id>/, /reels/<id>/)
+
+    Args:
+        url: 페이지 또는 링크 URL
+
+    Returns:
+        shortcode, 릴스 URL이 아니면 None
+    """
+    match = REEL_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+# 숫자 뒤에 붙는 한국어 단위 (좋아요 수 표기: "17.4만", "3.2천", "1.2억")
+_KO_COUNT_UNITS = {"만": 10_000, "천": 1_000, "억": 100_000_000}
+
+
+def _parse_ko_count(text: Optional[str]) -> Optional[int]:
+    """
+    화면에 표시된 숫자 텍스트를 정수로 변환 (정규식 없이 문자열 연산만 사용)
+
+    Args:
+        text: 숫자 텍스트 (예: "17.4만", "3.2천", "1,234")
+
+    Returns:
+        변환된 정수, 숫자가 아니면 None
+    """
+    if not text:
+        return None
+    s = "".join(text.replace(",", "").split())
+    unit = _KO_COUNT_UNITS.get(s[-1:])
+    if unit is None:
+        # 단위가 없으면 점도 자릿수 구분자로 취급 ("1.234" -> 1234)
+        s = s.replace(".", "")
+        return int(s) if s.isdigit() else None
+    try:
+        # 17.4 * 10000 같은 부동소수점 오차로 1이 작아지지 않도록 반올림
+        return round(float(s[:-1]) * unit)
+    except ValueError:
+        return None
+
+def _iter_api_media(data: object) -> Iterator[dict]:
+    """
+    릴스 API(GraphQL/clips) 응답 JSON에서 미디어 객체를 모두 찾기
+
+    응답 구조가 쿼리마다 달라 경로를 고정하지 않고, shortcode(code)와 좋아요 수를 함께 가진
+    객체를 미디어로 취급한다.
+
+    Args:
+        data: response.json() 결과
+
+    Yields:
+        미디어 객체 (dict)
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "code" in node and "like_count" in node:
+                yield node
+            else:
+                stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def _reel_fields_from_media(media: dict) -> dict:
+    """
+    API 미디어 객체를 ReelData 필드로 변환 (link 제외)
+
+    Args:
+        media: _iter_api_media가 찾은 미디어 객체
+
+    Returns:
+        ReelData 필드 딕셔너리
+    """
+    user = media.get("user") or media.get("owner") or {}
+    caption = media.get("caption") or {}
+    candidates = (media.get("image_versions2") or {}).get("candidates") or [{}]
+    clips = media.get("clips_metadata") or {}
+    music_asset = (clips.get("music_info") or {}).get("music_asset_info") or {}
+    original_sound = clips.get("original_sound_info") or {}
+
+    # 화면에 표시되는 "아티스트 · 제목" 형식으로 맞춤
+    music = None
+    if music_asset.get("title"):
+        music = f"{music_asset.get('display_artist')} · {music_asset['title']}"
+    elif original_sound.get("original_audio_title"):
+        artist = (original_sound.get("ig_artist") or {}).get("username") or user.get("username")
+        music = f"{artist} · {original_sound['original_audio_title']}"
+
+    return {
+        "thumbnail": candidates[0].get("url"),
+        "likes": media.get("like_count"),
+        "comments": media.get("comment_count"),
+        "author": user.get("username"),
+        "creator_profile_image": user.get("profile_pic_url"),
+        "title": caption.get("text") or None,
+        "music": music,
+    }
 
 
 class InstagramReelsScraper:
@@ -51,14 +674,133 @@ class InstagramReelsScraper:
         self.config = config or ScrapingConfig()
         self.username = username or self.config.instagram_username
         self.password = password or self.config.instagram_password
-        self.browser_manager: Optional[BrowserManager] = None
         self.logger = get_logger(self.__class__.__name__)
 
+        # (id(page), selector) -> Locator 캐시 (폴링마다 Locator를 새로 만들지 않도록)
+        self._locator_cache: dict[tuple[int, str], Locator] = {}
+        self._navigation_hooked: set[int] = set()
+        self._page_observers_installed = False
+        self._rate_limiter = RateLimiter(requests_per_hour=self.config.requests_per_hour)
+        self._closing_popup = False
+        # shortcode -> API 응답에서 얻은 ReelData 필드 (해당 릴스는 DOM 추출을 건너뜀)
+        self._reel_cache: dict[str, dict] = {}
+
         # 출력 디렉토리 생성
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
         self.logger.info("InstagramReelsScraper 초기화 완료")
 
+    @cached_property
+    def browser(self) -> BrowserManager:
+        """브라우저 매니저 (처음 접근할 때 한 번만 생성 및 시작)"""
+        manager = BrowserManager(self.config)
+        manager.start()
+        manager.context.on("response", self._on_response)
+        return manager
+
+    def _on_response(self, response: Response) -> None:
+        """
+        컨텍스트의 모든 응답을 보고 요청 제한 여부를 기록
+
+        Args:
+            response: Playwright Response 객체
+        """
+        if response.status == 429:
+            self._rate_limiter.record_rate_limit(f"HTTP 429: {response.url[:80]}")
+        elif "/challenge/" in response.url:
+            self._rate_limiter.record_rate_limit(f"챌린지 페이지: {response.url[:80]}")
+        elif response.ok and response.request.resource_type == "document":
+            self._rate_limiter.record_success()
+
+        if (
+            response.ok
+            and response.request.resource_type in ("xhr", "fetch")
+            and any(part in response.url for part in _REEL_API_URL_PARTS)
+        ):
+            self._cache_reel_api_response(response)
+
+    def _cache_reel_api_response(self, response: Response) -> None:
+        """
+        릴스 API 응답의 미디어 정보를 shortcode별로 캐시
+
+        Args:
+            response: GraphQL/clips API 응답
+        """
+        try:
+            data = response.json()
+        except Exception as e:
+            self.logger.debug(f"API 응답 파싱 실패 (무시): {e}")
+            return
+        for media in _iter_api_media(data):
+            # 피드에 섞여 오는 일반 게시물은 제외 (product_type이 없으면 릴스 API 응답으로 간주)
+            if media.get("product_type", "clips") == "clips":
+                self._reel_cache[media["code"]] = _reel_fields_from_media(media)
+
+    def _collect_cached_reels(self, seen_keys: RecentKeys) -> list[ReelData]:
+        """
+        API 응답으로 미리 받아온 릴스 중 아직 수집하지 않은 것을 한 번에 ReelData로 변환
+
+        Args:
+            seen_keys: 이미 수집한 릴스의 중복 체크 키 (새로 수집한 shortcode가 추가됨)
+
+        Returns:
+            새로 수집한 릴스 리스트
+        """
+        reels = []
+        for shortcode, fields in list(self._reel_cache.items()):
+            if not seen_keys.add(shortcode):
+                continue
+            link = f"{REELS_URL}{shortcode}/"
+            reels.append(ReelData.model_construct(**fields, link=link))
+        return reels
+
+    def _goto(self, page: Page, url: str, **kwargs) -> None:  # noqa: ANN003
+        """
+        요청 제한을 지키면서 페이지 이동 (토큰 버킷/백오프 대기 후 goto)
+
+        Args:
+            page: Playwright Page 객체
+            url: 이동할 URL
+            **kwargs: page.goto에 전달할 옵션
+
+        Raises:
+            RateLimitError: 요청 제한이 연속으로 감지되어 회로가 열린 경우
+        """
+        self._rate_limiter.acquire()
+        page.goto(url, **kwargs)
+
+    @cached_property
+    def _io_pool(self) -> ThreadPoolExecutor:
+        """디버그 파일 기록용 백그라운드 스레드 (처음 사용할 때 생성)"""
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper-io")
+
+    @property
+    def _browser_started(self) -> bool:
+        """브라우저가 이미 시작되었는지 확인 (browser에 접근하지 않고 캐시만 확인)"""
+        return "browser" in self.__dict__
+
+    def _loc(self, page: Page, selector: str) -> Locator:
+        """
+        셀렉터별 Locator를 캐시에서 가져오거나 새로 만들어 저장
+
+        페이지가 이동(framenavigated)하면 캐시를 비웁니다.
+
+        Args:
+            page: Playwright Page 객체
+            selector: CSS 셀렉터
+
+        Returns:
+            캐시된 Locator 객체
+        """
+        key = (id(page), selector)
+        locator = self._locator_cache.get(key)
+        if locator is None:
+            if key[0] not in self._navigation_hooked:
+                page.on("framenavigated", lambda _: self._locator_cache.clear())
+                self._navigation_hooked.add(key[0])
+            locator = self._locator_cache[key] = page.locator(selector)
+        return locator
+
     def login(self, username: Optional[str] = None, password: Optional[str] = None) -> bool:
         """
         인스타그램에 로그인
@@ -72,6 +814,7 @@ class InstagramReelsScraper:
 
         Raises:
             LoginError: 로그인 실패 시
+            RateLimitError: 요청 제한이 연속으로 감지된 경우
         """
         username = username or self.username
         password = password or self.password
@@ -82,211 +825,24 @@ class InstagramReelsScraper:
         try:
             self.logger.info(f"로그인 시도: {username}")
 
-            # 브라우저 시작 (아직 시작되지 않은 경우)
-            if self.browser_manager is None:
-                self.browser_manager = BrowserManager(self.config)
-                self.browser_manager.start()
-
-            page = self.browser_manager.get_page()
+            # 브라우저는 처음 접근할 때 시작됨
+            page = self.browser.get_page()
+            self._install_page_observers()
 
             # 인스타그램 메인 페이지로 이동
+            # 응답이 시작(commit)되면 바로 반환하고, 실제 동기화는 로그인 폼/세션 쿠키 대기에서 수행
             self.logger.info("인스타그램 메인 페이지로 이동 중...")
-            page.goto("https://www.instagram.com/", wait_until="domcontentloaded", timeout=30000)
+            self._goto(page, "https://www.instagram.com/", wait_until="commit")
 
-            # 페이지가 완전히 로드될 때까지 대기 (DOM만 확인, networkidle은 타임아웃 위험)
-            try:
-                page.wait_for_load_state("domcontentloaded", timeout=10000)
-            except Exception:
-                self.logger.debug("페이지 로드 대기 실패 (계속 진행)")
-            
             random_delay(1.0, 2.0)  # 사용자처럼 랜덤 대기
 
-            # 페이지 상호작용 시뮬레이션 (봇 감지 우회)
-            simulate_page_interaction(page, min_actions=1, max_actions=2)
-
-            # 로그인 링크 클릭 또는 로그인 폼 확인
-            self.logger.info("로그인 폼 확인 중...")
-            try:
-                # 이미 로그인되어 있는지 확인
-                if "accounts/login" not in page.url:
-                    # 로그인 링크 찾기
-                    login_link_selectors = [
-                        'a[href*="/accounts/login"]',
-                        'a:has-text("Log in")',
-                        'a:has-text("로그인")',
-                    ]
-
-                    login_link = None
-                    for selector in login_link_selectors:
-                        try:
-                            login_link = page.locator(selector).first
-                            if login_link.is_visible(timeout=3000):
-                                self.logger.info(f"로그인 링크 찾음: {selector}")
-                                login_link.click()
-                                try:
-                                    page.wait_for_load_state("domcontentloaded", timeout=5000)
-                                except Exception:
-                                    pass
-                                page.wait_for_timeout(2000)
-                                break
-                        except Exception:
-                            continue
-
-                # 로그인 폼이 나타날 때까지 대기
-                page.wait_for_selector("#loginForm", timeout=10000, state="visible")
-                self.logger.info("로그인 폼 로드 완료")
-            except Exception as e:
-                self.logger.warning(f"loginForm 셀렉터 대기 실패, 계속 진행: {e}")
-
-            # 추가 안정화 대기
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(1000)
-
-            # 쿠키 수락 (있는 경우)
-            try:
-                accept_cookies = page.locator('button:has-text("Accept")').or_(
-                    page.locator('button:has-text("수락")')
-                )
-                if accept_cookies.count() > 0:
-                    accept_cookies.first.click()
-                    page.wait_for_timeout(1000)
-            except Exception:
-                pass  # 쿠키 버튼이 없을 수 있음
-
-            # 디버깅: 페이지 HTML 저장 및 스크린샷 저장
-            self.logger.info("=" * 60)
-            self.logger.info("로그인 페이지 로드 완료")
-            self.logger.info("=" * 60)
-            self.logger.info("현재 페이지 URL: " + page.url)
-
-            # 페이지 HTML 저장 (디버깅용)
-            html_content = page.content()
-            debug_dir = self.config.output_dir / "debug"
-            debug_dir.mkdir(parents=True, exist_ok=True)
-
-            html_file = debug_dir / "login_page.html"
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            self.logger.info(f"페이지 HTML 저장: {html_file}")
-
-            # 스크린샷 저장
-            screenshot_file = debug_dir / "login_page.png"
-            page.screenshot(path=str(screenshot_file), full_page=True)
-            self.logger.info(f"스크린샷 저장: {screenshot_file}")
-
-            self.logger.info("입력 필드와 로그인 버튼을 찾는 중...")
-
-            # 사용자명 입력 필드 찾기 및 입력
-            # 제공된 셀렉터: #loginForm > div... > div:nth-child(1) > div > label > input
-            username_selectors = [
-                "#loginForm > div > div:nth-child(1) > div > label > input",  # 제공된 셀렉터 (간소화)
-                '#loginForm input[type="text"]',  # 더 간단한 대안
-                'input[name="username"]',
-                'input[aria-label*="전화번호"]',
-                'input[aria-label*="사용자 이름"]',
-            ]
-
-            # 유틸리티 함수로 요소 찾기
-            username_input = wait_for_element(
-                page, username_selectors, timeout=5000, description="사용자명 입력 필드"
-            )
-
-            if not username_input:
-                raise LoginError("사용자명 입력 필드를 찾을 수 없습니다.")
-
-            # 안전하게 입력 (유틸리티 함수 사용)
-            if not safe_fill_input(username_input, username, description="사용자명"):
-                raise LoginError("사용자명 입력에 실패했습니다.")
-
-            # 비밀번호 입력 필드 찾기 및 입력
-            # 제공된 셀렉터: #loginForm > div... > div:nth-child(2) > div > label > input
-            password_selectors = [
-                "#loginForm > div > div:nth-child(2) > div > label > input",  # 제공된 셀렉터 (간소화)
-                '#loginForm input[type="password"]',  # 더 간단한 대안
-                'input[name="password"]',
-                'input[type="password"]',
-            ]
-
-            # 유틸리티 함수로 요소 찾기
-            password_input = wait_for_element(
-                page, password_selectors, timeout=5000, description="비밀번호 입력 필드"
-            )
-
-            if not password_input:
-                raise LoginError("비밀번호 입력 필드를 찾을 수 없습니다.")
-
-            # 안전하게 입력 (유틸리티 함수 사용)
-            if not safe_fill_input(password_input, password, description="비밀번호"):
-                raise LoginError("비밀번호 입력에 실패했습니다.")
-
-            # 로그인 버튼 찾기 및 클릭
-            # 제공된 셀렉터: #loginForm > div... > div:nth-child(3)
-            login_button_selectors = [
-                "#loginForm > div > div:nth-child(3)",  # 제공된 셀렉터 (간소화)
-                "#loginForm > div > div:nth-child(3) button",  # 버튼이 내부에 있는 경우
-                '#loginForm button[type="submit"]',
-                'button[type="submit"]',
-                'button:has-text("Log in")',
-                'button:has-text("로그인")',
-            ]
-
-            # 유틸리티 함수로 요소 찾기
-            login_button = wait_for_element(
-                page, login_button_selectors, timeout=5000, description="로그인 버튼"
-            )
-
-            if not login_button:
-                raise LoginError("로그인 버튼을 찾을 수 없습니다.")
-
-            # 버튼이 활성화될 때까지 대기
-            self.logger.info("로그인 버튼 활성화 대기 중...")
-            try:
-                login_button.wait_for(state="attached", timeout=3000)
-                page.wait_for_timeout(500)  # 추가 안정화 대기
-            except Exception:
-                pass  # 대기 실패해도 계속 진행
-
-            # 로그인 버튼 클릭
-            self.logger.info("로그인 버튼 클릭 중...")
-            # 클릭 가능한지 확인 후 클릭
-            try:
-                if login_button.is_enabled():
-                    login_button.click()
-                    self.logger.info("로그인 버튼 클릭 완료")
-                else:
-                    # 버튼이 비활성화되어 있으면 내부 버튼 찾기 시도
-                    inner_button = login_button.locator("button").first
-                    if inner_button.is_visible():
-                        inner_button.click()
-                        self.logger.info("내부 버튼 클릭 완료")
-                    else:
-                        # 강제 클릭 시도
-                        login_button.click(force=True)
-                        self.logger.info("강제 클릭 완료")
-            except Exception as e:
-                self.logger.warning(f"일반 클릭 실패, 강제 클릭 시도: {e}")
-                login_button.click(force=True)
-                self.logger.info("강제 클릭 완료")
-
-            # 로그인 버튼 클릭 후 20초 대기 (브라우저에 아무것도 하지 않고 대기만)
-            self.logger.info("로그인 처리 대기 중... (20초, 브라우저 조작 없음)")
-            time.sleep(20)  # Python의 time.sleep 사용 (브라우저 응답을 기다리지 않음)
-
-            # 로그인 결과 확인 (간단히 URL만 확인, 브라우저 조작 최소화)
-            try:
-                current_url = page.url
-                self.logger.info(f"현재 URL: {current_url}")
-
-                # 로그인 페이지에 여전히 있으면 경고만 출력
-                if "accounts/login" in current_url:
-                    self.logger.warning(
-                        "로그인 페이지에 여전히 있습니다. 로그인 실패 가능성이 있습니다."
-                    )
-                else:
-                    self.logger.info("로그인 성공으로 보입니다 (로그인 페이지가 아님)")
-            except Exception as e:
-                self.logger.warning(f"URL 가져오기 실패: {e}")
-                current_url = "https://www.instagram.com/"
+            if self._has_saved_session():
+                # 저장된 브라우저 상태(쿠키)로 이미 로그인된 경우 로그인 폼 단계 전체를 생략
+                self.logger.info("저장된 세션으로 로그인 상태 확인 - 로그인 폼 단계 생략")
+            else:
+                self._submit_login_form(page, username, password)
+                # 다음 실행에서 로그인을 생략할 수 있도록 세션 저장
+                self.browser.save_storage_state()
 
             # 로그인 후 팝업 처리
             self._handle_post_login_popup(page)
@@ -309,17 +865,226 @@ class InstagramReelsScraper:
             self.password = password
             self.logger.info("로그인 프로세스 완료")
             return True
+        except RateLimitError as e:
+            self.logger.error(f"요청 제한 초과: {e}")
+            raise
         except Exception as e:
             self.logger.error(f"로그인 실패: {e}")
             raise LoginError(f"로그인에 실패했습니다: {e}") from e
 
+    def _has_saved_session(self) -> bool:
+        """
+        저장된 브라우저 상태로 인스타그램 세션 쿠키가 복원되었는지 확인
+
+        Returns:
+            sessionid 쿠키가 있으면 True
+        """
+        return self.browser.storage_state_loaded and self._has_session_cookie()
+
+    def _has_session_cookie(self) -> bool:
+        """현재 컨텍스트에 인스타그램 sessionid 쿠키가 있는지 확인"""
+        try:
+            cookies = self.browser.context.cookies("https://www.instagram.com")
+        except Exception as e:
+            self.logger.debug(f"쿠키 확인 실패: {e}")
+            return False
+        return any(cookie["name"] == "sessionid" and cookie["value"] for cookie in cookies)
+
+    def _wait_for_session_cookie(self, timeout: float, interval: float = 0.5) -> bool:
+        """
+        sessionid 쿠키가 발급될 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+            interval: 확인 간격 (초)
+
+        Returns:
+            제한 시간 안에 쿠키가 발급되면 True
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._has_session_cookie():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
+    def _submit_login_form(self, page: Page, username: str, password: str) -> None:
+        """
+        로그인 폼을 찾아 자격증명을 입력하고 제출
+
+        Args:
+            page: Playwright Page 객체
+            username: 인스타그램 사용자명
+            password: 인스타그램 비밀번호
+
+        Raises:
+            LoginError: 입력 필드나 로그인 버튼을 찾지 못한 경우
+        """
+        # 페이지 상호작용 시뮬레이션 (봇 감지 우회)
+        simulate_page_interaction(page, min_actions=1, max_actions=2)
+
+        # 로그인 링크 클릭 또는 로그인 폼 확인
+        self.logger.info("로그인 폼 확인 중...")
+        try:
+            # 이미 로그인되어 있는지 확인
+            if "accounts/login" not in page.url:
+                # 로그인 링크 찾기 (후보 셀렉터를 하나의 Locator로 결합해 한 번에 확인)
+                # goto가 commit 시점에 반환되므로 로그인 폼이나 링크 중 하나가 나타날 때까지 먼저 대기
+                try:
+                    login_link = combine_selectors(page, LOGIN_LINK_SELECTORS).first
+                    login_link.or_(page.locator("#loginForm")).first.wait_for(
+                        state="visible", timeout=10000
+                    )
+                    if login_link.is_visible():
+                        self.logger.info("로그인 링크 찾음")
+                        login_link.click()
+                        try:
+                            page.wait_for_load_state("domcontentloaded", timeout=5000)
+                        except Exception:
+                            pass
+                        # 고정 대기 대신 아래 loginForm 대기로 폼 표시 시점을 확인
+                except Exception:
+                    pass
+
+            # 로그인 폼이 나타날 때까지 대기
+            page.wait_for_selector("#loginForm", timeout=10000, state="visible")
+            self.logger.info("로그인 폼 로드 완료")
+        except Exception as e:
+            self.logger.warning(f"loginForm 셀렉터 대기 실패, 계속 진행: {e}")
+
+        # 추가 안정화 대기
+        page.wait_for_load_state("domcontentloaded")
+
+        # 쿠키 수락 (있는 경우)
+        try:
+            accept_cookies = page.locator('button:has-text("Accept")').or_(
+                page.locator('button:has-text("수락")')
+            )
+            if accept_cookies.count() > 0:
+                accept_cookies.first.click()
+                # 배너가 사라지는 시점까지만 대기
+                accept_cookies.first.wait_for(state="hidden", timeout=3000)
+        except Exception:
+            pass  # 쿠키 버튼이 없을 수 있음
+
+        # 디버깅: 페이지 HTML 저장 및 스크린샷 저장
+        self.logger.info("=" * 60)
+        self.logger.info("로그인 페이지 로드 완료")
+        self.logger.info("=" * 60)
+        self.logger.info("현재 페이지 URL: " + page.url)
+
+        # 페이지 HTML/스크린샷 저장 (디버깅용, 설정한 경우에만)
+        if self.config.save_debug_artifacts:
+            debug_dir = self.config.output_dir / "debug"
+            debug_dir.mkdir(parents=True, exist_ok=True)
+
+            # 브라우저에서 받아오는 것만 여기서 하고, 파일 기록은 백그라운드 스레드에서 수행
+            html_file = debug_dir / "login_page.html"
+            self._io_pool.submit(html_file.write_text, page.content(), encoding="utf-8")
+            self.logger.debug(f"페이지 HTML 저장: {html_file}")
+
+            # 스크린샷 저장 (전체 페이지 캡처는 레이아웃을 여러 번 계산하므로 뷰포트만)
+            screenshot_file = debug_dir / "login_page.png"
+            self._io_pool.submit(screenshot_file.write_bytes, page.screenshot())
+            self.logger.debug(f"스크린샷 저장: {screenshot_file}")
+
+        self.logger.info("입력 필드와 로그인 버튼을 찾는 중...")
+
+        # 사용자명 입력 필드 찾기 및 입력
+        # 제공된 셀렉터: #loginForm > div... > div:nth-child(1) > div > label > input
+        # 유틸리티 함수로 요소 찾기
+        username_input = wait_for_element(
+            page, USERNAME_SELECTORS, timeout=5000, description="사용자명 입력 필드"
+        )
+
+        if not username_input:
+            raise LoginError("사용자명 입력 필드를 찾을 수 없습니다.")
+
+        # 안전하게 입력 (유틸리티 함수 사용)
+        if not safe_fill_input(username_input, username, description="사용자명"):
+            raise LoginError("사용자명 입력에 실패했습니다.")
+
+        # 비밀번호 입력 필드 찾기 및 입력
+        # 제공된 셀렉터: #loginForm > div... > div:nth-child(2) > div > label > input
+        # 유틸리티 함수로 요소 찾기
+        password_input = wait_for_element(
+            page, PASSWORD_SELECTORS, timeout=5000, description="비밀번호 입력 필드"
+        )
+
+        if not password_input:
+            raise LoginError("비밀번호 입력 필드를 찾을 수 없습니다.")
+
+        # 안전하게 입력 (유틸리티 함수 사용)
+        if not safe_fill_input(password_input, password, description="비밀번호"):
+            raise LoginError("비밀번호 입력에 실패했습니다.")
+
+        # 로그인 버튼 찾기 및 클릭
+        # 제공된 셀렉터: #loginForm > div... > div:nth-child(3)
+        # 유틸리티 함수로 요소 찾기
+        login_button = wait_for_element(
+            page, LOGIN_BUTTON_SELECTORS, timeout=5000, description="로그인 버튼"
+        )
+
+        if not login_button:
+            raise LoginError("로그인 버튼을 찾을 수 없습니다.")
+
+        # 버튼이 활성화될 때까지 대기
+        self.logger.info("로그인 버튼 활성화 대기 중...")
+        try:
+            login_button.wait_for(state="attached", timeout=3000)
+            page.wait_for_timeout(200)  # 봇 감지 회피용 짧은 지연
+        except Exception:
+            pass  # 대기 실패해도 계속 진행
+
+        # 로그인 버튼 클릭
+        self.logger.info("로그인 버튼 클릭 중...")
+        # 클릭 가능한지 확인 후 클릭
+        try:
+            if login_button.is_enabled():
+                login_button.click()
+                self.logger.info("로그인 버튼 클릭 완료")
+            else:
+                # 버튼이 비활성화되어 있으면 내부 버튼 찾기 시도
+                inner_button = login_button.locator("button").first
+                if inner_button.is_visible():
+                    inner_button.click()
+                    self.logger.info("내부 버튼 클릭 완료")
+                else:
+                    # 강제 클릭 시도
+                    login_button.click(force=True)
+                    self.logger.info("강제 클릭 완료")
+        except Exception as e:
+            self.logger.warning(f"일반 클릭 실패, 강제 클릭 시도: {e}")
+            login_button.click(force=True)
+            self.logger.info("강제 클릭 완료")
+
+        # 로그인 처리 대기 (최대 20초, 브라우저 조작 없음)
+        # 세션 쿠키가 발급되면 바로 진행 (쿠키 조회는 페이지 DOM을 건드리지 않음)
+        self.logger.info("로그인 처리 대기 중... (최대 20초, 브라우저 조작 없음)")
+        if self._wait_for_session_cookie(timeout=20.0):
+            self.logger.info("세션 쿠키 확인")
+            try:
+                page.wait_for_load_state("domcontentloaded", timeout=10000)
+            except Exception:
+                self.logger.debug("로그인 후 페이지 로드 대기 실패 (계속 진행)")
+
+        # 로그인 결과 확인 (page.url은 캐시된 값이라 브라우저 왕복 없음)
+        current_url = page.url
+        self.logger.info(f"현재 URL: {current_url}")
+        if "accounts/login" in current_url:
+            # 로그인 페이지에 여전히 있으면 경고만 출력
+            self.logger.warning("로그인 페이지에 여전히 있습니다. 로그인 실패 가능성이 있습니다.")
+        else:
+            self.logger.info("로그인 성공으로 보입니다 (로그인 페이지가 아님)")
+
     def _handle_post_login_popup(self, page: Page) -> None:
         """
         로그인 후 팝업 처리
 
         팝업이 있으면 확인 버튼을 클릭하거나, 마우스 이동/키 입력으로 닫습니다.
         팝업이 없으면 그냥 진행합니다.
-        일정 시간 동안 주기적으로 팝업을 모니터링하여 자동으로 감지하고 닫습니다.
+        최대 15초 동안 팝업이 나타나는지 브라우저 안에서 대기하여 자동으로 감지하고 닫습니다.
 
         Args:
             page: Playwright Page 객체
@@ -327,39 +1092,70 @@ class InstagramReelsScraper:
         try:
             self.logger.info("로그인 후 팝업 확인 중...")
 
-            # 팝업 감지 및 처리 (최대 15초 동안 주기적으로 확인)
-            max_check_time = 15000  # 15초
-            check_interval = 500  # 0.5초마다 확인
-            elapsed_time = 0
+            # 팝업 감지 및 처리 (최대 15초)
+            # Python에서 0.5초마다 폴링하지 않고, 결합 셀렉터 하나로 브라우저 안에서 대기
+            # (숨겨진 role="presentation" 등이 먼저 매칭될 수 있으므로 보이는 요소만 대상으로 함)
+            popup_locator = self._loc(page, f"{POPUP_CONTAINER_UNION} >> visible=true").first
+            deadline = time.monotonic() + POPUP_MAX_WAIT
+            timeout = POPUP_APPEAR_TIMEOUT
             popup_closed = False
 
-            while elapsed_time < max_check_time:
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    popup_locator.wait_for(state="visible", timeout=min(timeout, remaining * 1000))
+                except PlaywrightTimeoutError:
+                    break  # 제한 시간 안에 새 팝업이 나타나지 않음
+
                 if self._check_and_close_popup(page):
                     popup_closed = True
-                    # 팝업을 닫은 후 잠시 대기하고 한 번 더 확인
-                    time.sleep(1)  # Python time.sleep 사용
-                    if not self._check_and_close_popup(page):
-                            break
-                else:
-                    # 팝업이 없으면 잠시 대기 후 종료
-                    if elapsed_time > 2000:  # 최소 2초는 기다림
-                        break
-
-                time.sleep(check_interval / 1000)  # 밀리초를 초로 변환
-                elapsed_time += check_interval
+                    # 팝업을 닫은 후 연달아 나타나는 팝업은 짧게만 기다림
+                    timeout = POPUP_FOLLOWUP_TIMEOUT
 
             if popup_closed:
                 self.logger.info("팝업 자동 처리 완료")
             else:
                 self.logger.info("팝업이 없거나 이미 처리되었습니다.")
 
-            # 팝업 처리 후 추가 대기
-            time.sleep(1)  # Python time.sleep 사용
-            random_delay(0.5, 1.0)
+            # 팝업 처리 후 짧은 대기 (Playwright 이벤트 루프에 양보하여 바인딩/다른 페이지 처리)
+            page.wait_for_timeout(random.uniform(500, 1000))
 
         except Exception as e:
             self.logger.debug(f"팝업 처리 중 오류 (무시하고 계속 진행): {e}")
 
+    def _install_page_observers(self) -> None:
+        """
+        페이지 안에서 동작하는 관찰자 스크립트를 컨텍스트에 설치 (한 번만)
+
+        - 팝업 감지: 팝업이 DOM에 삽입되면 페이지가 바인딩을 호출하고, Playwright 호출 중에
+          _on_popup_detected가 실행되어 팝업을 바로 닫습니다.
+          로그인 이후 릴스 수집 중에 뜨는 팝업도 같은 경로로 처리됩니다.
+        - 현재 릴스 표시: 화면에 보이는 릴스 카드에 data-active-reel 속성을 붙여
+          _EXTRACT_REEL_JS가 video를 찾지 못했을 때 좌표 계산 없이 바로 사용할 수 있게 합니다.
+        - 릴스 추출 함수: _EXTRACT_REEL_JS를 window.__scrapeReel로 정의해 두어
+          릴스마다 긴 스크립트 대신 짧은 호출만 보냅니다.
+
+        다음 네비게이션부터 적용되므로 첫 goto 전에 호출해야 합니다.
+        """
+        if self._page_observers_installed:
+            return
+        context = self.browser.context
+        context.expose_binding("_onPopup", self._on_popup_detected)
+        context.add_init_script(_POPUP_OBSERVER_JS)
+        context.add_init_script(_ACTIVE_REEL_OBSERVER_JS)
+        context.add_init_script(_SCRAPE_REEL_INIT_JS)
+        self._page_observers_installed = True
+
+    def _on_popup_detected(self, source: dict, snippet: str) -> None:
+        """
+        페이지에서 팝업 삽입을 알렸을 때 호출되는 바인딩 콜백
+
+        Args:
+            source: 바인딩 호출 정보 (page, frame, context)
+            snippet: 삽입된 팝업 요소의 outerHTML 앞부분 (로깅용)
+        """
+        self.logger.debug(f"팝업 삽입 감지: {snippet}")
+        self._check_and_close_popup(source["page"])
+
     def _check_and_close_popup(self, page: Page) -> bool:
         """
         팝업이 있는지 확인하고 있으면 닫기
@@ -370,130 +1166,95 @@ class InstagramReelsScraper:
         Returns:
             팝업을 닫았으면 True, 없으면 False
         """
+        # 팝업을 닫는 도중 관찰자 바인딩이 다시 호출되는 경우(재진입)는 무시
+        if self._closing_popup:
+            return False
+        self._closing_popup = True
         try:
-            # 사용자 제공 팝업 셀렉터 및 일반적인 팝업 셀렉터들
-            popup_container_selectors = [
-                # 사용자 제공 셀렉터 (Instagram 팝업 컨테이너)
-                'body > div.x1n2onr6.xzkaem6 > div.x9f619.x1n2onr6.x1ja2u2z > div > div.x1uvtmcs.x4k7w5x.x1h91t0o.x1beo9mf.xaigb6o.x12ejxvf.x3igimt.xarpa2k.xedcshv.x1lytzrv.x1t2pt76.x7ja8zs.x1n2onr6.x1qrby5j.x1jfb8zj > div > div > div > div > div > div > div.x1i10hfl.xjqpnuy.xc5r6h4.xqeqjp1.x1phubyo.x972fbf.x10w94by.x1qhh985.x14e42zd.xdl72j9.x2lah0s.x3ct3a4.xdj266r.x14z9mp.xat24cr.x1lziwak.x2lwn1j.xeuugli.xexx8yu.x18d9i69.x1hl2dhg.xggy1nq.x1ja2u2z.x1t137rt.x1q0g3np.x1lku1pv.x1a2a7pz.x6s0dn4.xjyslct.x1ejq31n.x18oe1m7.x1sy0etr.xstzfhl.x9f619.x9bdzbf.x1ypdohk.x1f6kntn.xwhw2v2.xl56j7k.x17ydfre.x1n2onr6.x2b8uid.xlyipyv.x87ps6o.x5c86q.x18br7mf.x1i0vuye.xh8yej3.x6nl9eh.x1a5l9x9.x7vuprf.x1mg3h75.xn3w4p2.x106a9eq.x1xnnf8n.x18cabeq.x158me93.xk4oym4.x1uugd1q.x3nfvp2',
-                # Instagram 팝업의 일반적인 패턴 (클래스명의 일부 사용)
-                'body > div.x1n2onr6.xzkaem6',
-                'div[role="dialog"]',
-                '[data-testid="modal"]',
-                '.x1n2onr6[role="dialog"]',
-                # 모달/다이얼로그 패턴
-                'div[role="presentation"]',
-                'div._a9-z',  # Instagram 알림 모달
-                'div._a9--',
-            ]
-
-            # 1단계: 팝업 컨테이너 확인
-            for selector in popup_container_selectors:
-                try:
-                    popup = page.locator(selector).first
-                    if popup.is_visible(timeout=500):
-                        self.logger.info(f"팝업 컨테이너 발견: {selector[:50]}...")
-
-                        # 팝업 내부의 확인/닫기 버튼 찾기
-                        popup_button_selectors = [
-                            # 버튼 텍스트 기반
-                            'button:has-text("확인")',
-                            'button:has-text("OK")',
-                            'button:has-text("Okay")',
-                            'button:has-text("Got it")',
-                            'button:has-text("알겠습니다")',
-                            'button:has-text("다음")',
-                            'button:has-text("Next")',
-                            'button:has-text("Close")',
-                            'button:has-text("닫기")',
-                            # aria-label 기반
-                            'button[aria-label*="확인"]',
-                            'button[aria-label*="OK"]',
-                            'button[aria-label*="Close"]',
-                            'button[aria-label*="닫기"]',
-                            # 일반적인 팝업 버튼
-                            'div[role="dialog"] button',
-                            '[data-testid="confirm"]',
-                            '[data-testid="ok"]',
-                            '[data-testid="close"]',
-                            # X 버튼
-                            'button[aria-label*="Close"]',
-                            'svg[aria-label*="Close"]',
-                            '[aria-label*="닫기"]',
-                        ]
-
-                        # 팝업 내부에서 버튼 찾기
-                        button_found = False
-                        for button_selector in popup_button_selectors:
-                            try:
-                                # 팝업 컨테이너 내부에서 버튼 찾기
-                                button = popup.locator(button_selector).first
-                                if button.is_visible(timeout=500):
-                                    self.logger.info(f"팝업 확인 버튼 발견: {button_selector}")
-                                    button.click()
-                                    page.wait_for_timeout(500)
-                                    button_found = True
-                                    return True
-                            except Exception:
-                                pass
-
-                        # 버튼을 찾지 못한 경우, 다른 방법으로 팝업 닫기 시도
-                        if not button_found:
-                            self.logger.info("팝업 버튼을 찾지 못함. 다른 방법으로 닫기 시도...")
-
-                            # 방법 1: ESC 키
-                            try:
-                                page.keyboard.press("Escape")
-                                page.wait_for_timeout(500)
-                                # ESC 후 팝업이 사라졌는지 확인
-                                if not popup.is_visible(timeout=500):
-                                    self.logger.info("ESC 키로 팝업 닫기 성공")
-                                    return True
-                            except Exception:
-                                pass
-
-                            # 방법 2: 팝업 외부 영역 클릭 (배경 클릭)
-                            try:
-                                # 팝업의 위치를 확인하고 외부 영역 클릭
-                                viewport = page.viewport_size
-                                if viewport:
-                                    # 화면 상단 좌측 모서리 클릭 (보통 팝업 외부)
-                                    page.mouse.click(10, 10)
-                                    page.wait_for_timeout(500)
-                                    if not popup.is_visible(timeout=500):
-                                        self.logger.info("외부 영역 클릭으로 팝업 닫기 성공")
-                                        return True
-                            except Exception:
-                                pass
-
-                            # 방법 3: 마우스 이동으로 팝업 닫기 (일부 팝업은 마우스 움직임에 반응)
-                            try:
-                                random_mouse_movement(page, duration=0.2)
-                                page.wait_for_timeout(500)
-                                if not popup.is_visible(timeout=500):
-                                    self.logger.info("마우스 이동으로 팝업 닫기 성공")
-                                    return True
-                            except Exception:
-                                pass
-
-                            # 방법 4: Enter 키 (일부 팝업은 Enter로 닫힘)
-                            try:
-                                page.keyboard.press("Enter")
-                                page.wait_for_timeout(500)
-                                if not popup.is_visible(timeout=500):
-                                    self.logger.info("Enter 키로 팝업 닫기 성공")
-                                    return True
-                            except Exception:
-                                pass
-
-                        break  # 팝업을 처리했거나 시도했으므로 루프 종료
-                except Exception:
-                        continue
+            # 1단계: 팝업 컨테이너 확인 (셀렉터별 is_visible 대신 페이지 안에서 한 번에 확인)
+            selector = first_visible_selector(page, POPUP_CONTAINER_SELECTORS)
+            if selector is None:
+                return False
+
+            popup = self._loc(page, selector).first
+            self.logger.info(f"팝업 컨테이너 발견: {selector[:50]}...")
+
+            # 팝업 내부의 확인/닫기 버튼을 페이지 안에서 한 번에 찾아 클릭
+            clicked = page.evaluate(_CLOSE_POPUP_JS, [selector, list(POPUP_BUTTON_TEXTS)])
+            if clicked:
+                self.logger.info(f"팝업 확인 버튼 클릭: {clicked}")
+                page.wait_for_timeout(500)
+                return True
+
+            # 버튼을 찾지 못한 경우, 다른 방법으로 팝업 닫기 시도
+            self.logger.info("팝업 버튼을 찾지 못함. 다른 방법으로 닫기 시도...")
+
+            # 방법 1: ESC 키
+            try:
+                page.keyboard.press("Escape")
+                # ESC 후 팝업이 사라졌는지 확인
+                if self._popup_dismissed(popup):
+                    self.logger.info("ESC 키로 팝업 닫기 성공")
+                    return True
+            except Exception:
+                pass
+
+            # 방법 2: 팝업 외부 영역 클릭 (배경 클릭)
+            try:
+                # 팝업의 위치를 확인하고 외부 영역 클릭
+                viewport = page.viewport_size
+                if viewport:
+                    # 화면 상단 좌측 모서리 클릭 (보통 팝업 외부)
+                    page.mouse.click(10, 10)
+                    if self._popup_dismissed(popup):
+                        self.logger.info("외부 영역 클릭으로 팝업 닫기 성공")
+                        return True
+            except Exception:
+                pass
+
+            # 방법 3: 마우스 이동으로 팝업 닫기 (일부 팝업은 마우스 움직임에 반응)
+            try:
+                random_mouse_movement(page, duration=0.2)
+                if self._popup_dismissed(popup):
+                    self.logger.info("마우스 이동으로 팝업 닫기 성공")
+                    return True
+            except Exception:
+                pass
+
+            # 방법 4: Enter 키 (일부 팝업은 Enter로 닫힘)
+            try:
+                page.keyboard.press("Enter")
+                if self._popup_dismissed(popup):
+                    self.logger.info("Enter 키로 팝업 닫기 성공")
+                    return True
+            except Exception:
+                pass
 
             return False
 
         except Exception as e:
             self.logger.debug(f"팝업 확인 중 오류 (무시): {e}")
             return False
+        finally:
+            self._closing_popup = False
+
+    @staticmethod
+    def _popup_dismissed(popup: Locator, timeout: int = 1000) -> bool:
+        """
+        팝업이 사라질 때까지 대기 (고정 대기 후 확인하지 않고, 사라지는 즉시 반환)
+
+        Args:
+            popup: 팝업 컨테이너 Locator
+            timeout: 최대 대기 시간 (밀리초)
+
+        Returns:
+            제한 시간 안에 팝업이 사라졌으면 True
+        """
+        try:
+            popup.wait_for(state="hidden", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
 
     def _wait_for_main_page_load(self, page: Page) -> None:
         """
@@ -508,14 +1269,11 @@ class InstagramReelsScraper:
         try:
             self.logger.info("메인화면 로딩 대기 중...")
 
-            # DOM만 확인 (networkidle은 타임아웃 위험)
+            # DOM만 확인 (networkidle은 타임아웃 위험), 고정 대기 없이 사람처럼 짧은 랜덤 대기만
             try:
                 page.wait_for_load_state("domcontentloaded", timeout=10000)
             except Exception:
                 self.logger.debug("domcontentloaded 대기 실패 (계속 진행)")
-
-            # 추가 안정화 대기 (Python time.sleep 사용)
-            time.sleep(2)
             random_delay(1.0, 2.0)
 
             self.logger.info("메인화면 로딩 완료")
@@ -533,32 +1291,15 @@ class InstagramReelsScraper:
             ScrapingError: 이동 실패 시
         """
         try:
-            if self.browser_manager is None:
+            if not self._browser_started:
                 raise ScrapingError("브라우저가 시작되지 않았습니다. 먼저 로그인하세요.")
 
-            page = self.browser_manager.get_page()
+            page = self.browser.get_page()
             self.logger.info("릴스 탭으로 이동 중...")
 
-            # 릴스 탭 셀렉터 (사용자 제공 셀렉터 및 일반적인 대안)
-            reels_tab_selectors = [
-                # 사용자 제공 셀렉터
-                '#mount_0_0_fz > div > div > div.x9f619.x1n2onr6.x1ja2u2z > div > div > div.x78zum5.xdt5ytf.x1t2pt76.x1n2onr6.x1ja2u2z.x10cihs4 > div.html-div.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x9f619.x16ye13r.xvbhtw8.x78zum5.x15mokao.x1ga7v0g.x16uus16.xbiv7yw.x1uhb9sk.x1plvlek.xryxfnj.x1c4vz4f.x2lah0s.x1q0g3np.xqjyukv.x1qjc9v5.x1oa3qoh.x1qughib > div.html-div.xdj266r.x14z9mp.xat24cr.x1lziwak.xexx8yu.xyri2b.x18d9i69.x1c1uobl.x9f619.xjbqb8w.x78zum5.x15mokao.x1ga7v0g.x16uus16.xbiv7yw.xixxii4.x13vifvy.x1plvlek.xryxfnj.x1c4vz4f.x2lah0s.xdt5ytf.xqjyukv.x1qjc9v5.x1oa3qoh.x1nhvcw1.x1dr59a3.xeq5yr9.x1n327nk > div > div > div > div > div.x1iyjqo2.xh8yej3 > div:nth-child(4) > span > div > a > div',
-                # 일반적인 릴스 탭 셀렉터들
-                'a[href="/reels/"]',
-                'a[href*="/reels"]',
-                'div:has-text("릴스")',
-                'div:has-text("Reels")',
-                'span:has-text("릴스")',
-                'span:has-text("Reels")',
-                # Instagram 네비게이션 바에서 릴스 찾기
-                'nav a[href*="/reels"]',
-                'nav span:has-text("릴스")',
-                'nav span:has-text("Reels")',
-            ]
-
             # 유틸리티 함수로 요소 찾기
             reels_tab = wait_for_element(
-                page, reels_tab_selectors, timeout=10000, description="릴스 탭"
+                page, REELS_TAB_SELECTORS, timeout=10000, description="릴스 탭"
             )
 
             if not reels_tab:
@@ -567,11 +1308,11 @@ class InstagramReelsScraper:
             # 릴스 탭 클릭
             self.logger.info("릴스 탭 클릭 중...")
             reels_tab.click()
+            # 클라이언트 라우팅으로 URL이 바뀌는 시점까지만 대기 (페이지 내용은 _wait_for_reels_page_load에서 확인)
             try:
-                page.wait_for_load_state("domcontentloaded", timeout=10000)
-            except Exception:
-                self.logger.debug("릴스 탭 로드 대기 실패 (계속 진행)")
-            time.sleep(2)  # Python time.sleep 사용
+                page.wait_for_url(_REELS_URL_RE, wait_until="commit", timeout=10000)
+            except PlaywrightTimeoutError:
+                self.logger.debug("릴스 탭 URL 변경 대기 실패 (계속 진행)")
             random_delay(1.0, 2.0)
 
             # 릴스 페이지 로딩 확인
@@ -597,192 +1338,51 @@ class InstagramReelsScraper:
         """
         try:
             self.logger.info("릴스 페이지 로딩 대기 중...")
-            time.sleep(3)  # 초기 로딩 대기
-            
-            # 릴스 컨테이너가 나타날 때까지 대기
-            reels_container_selectors = [
-                'section > main > div',
-                'div.xvc5jky',
-                'main > div',
-            ]
-            
-            for selector in reels_container_selectors:
-                try:
-                    container = page.locator(selector).first
-                    if container.is_visible(timeout=5000):
-                        self.logger.info(f"릴스 컨테이너 발견: {selector}")
-                        break
-                except Exception:
-                    continue
 
-            # 추가 안정화 대기
-            time.sleep(2)
-            self.logger.info("릴스 페이지 로딩 완료")
-        except Exception as e:
-            self.logger.warning(f"릴스 페이지 로딩 대기 중 오류 (계속 진행): {e}")
-
-    def _get_current_reel_instancekey(self, page: Page) -> Optional[str]:
-        """
-        (중복 체크용 백업) 현재 보이는 릴스의 data-instancekey 값 추출
-
-        최근 레이아웃에서는 data-instancekey가 **플레이어 단위**로만 유지되거나
-        아예 존재하지 않는 경우가 많아서,
-        - "현재 어떤 릴스가 보이는지"를 구분하는 용도로는 사용하지 않는다.
-        - 단, 일부 예전 레이아웃에서만 중복 체크용 보조 수단으로 쓴다.
-        """
-        try:
-            instancekey_div = page.locator("div[data-instancekey]").first
-            if instancekey_div.is_visible(timeout=1000):
-                instancekey = instancekey_div.get_attribute("data-instancekey")
-                if instancekey:
-                    # INFO 로 남기면 로그가 너무 길어지므로 debug 로만 남김
-                    self.logger.debug(
-                        f"instancekey 추출 (중복 체크 보조용): {instancekey[:40]}..."
-                    )
-                    return instancekey
-        except Exception as e:
-            self.logger.debug(f"instancekey 추출 실패(무시 가능): {e}")
-
-        # instancekey 가 없다고 해서 오류는 아님
-        return None
-
-    def _get_current_reel_video(self, page: Page):
-        """
-        현재 화면(뷰포트)에서 중앙에 가장 가까운 video 요소를 찾는다.
-
-        인스타 릴스 피드는 슬롯(div)이 여러 개 미리 생성되어 있고,
-        슬롯 안의 내용만 교체되는 구조라서,
-        카드 div 클래스(x1qjc9v5 등)만으로는 "현재 보이는 릴스"를
-        안정적으로 식별하기 어렵다.
-
-        따라서 **실제 재생되는 video 요소**를 기준으로 현재 릴스를 판단한다.
-        """
-        try:
-            videos = page.locator("video")
-            count = videos.count()
-            if not count:
-                self.logger.warning("video 태그를 찾을 수 없습니다.")
-                return None
-
-            viewport = page.viewport_size
-            if not viewport:
-                self.logger.debug("viewport 정보를 가져올 수 없음. 첫 번째 video 사용.")
-                return videos.first
-
-            center_y = viewport["height"] / 2
-            closest_idx: Optional[int] = None
-            closest_dist = float("inf")
-
-            for i in range(min(20, count)):  # 너무 많이 보면 느려지니 최대 20개까지만
-                v = videos.nth(i)
-                try:
-                    rect = v.evaluate(
-                        "el => { const r = el.getBoundingClientRect(); "
-                        "return { top: r.top, bottom: r.bottom, height: r.height }; }"
-                    )
-
-                    # 화면에 일부라도 보이는 video 만 대상
-                    if rect["bottom"] <= 0 or rect["top"] >= viewport["height"]:
-                        continue
-
-                    mid_y = rect["top"] + rect["height"] / 2
-                    dist = abs(mid_y - center_y)
-                    if dist < closest_dist:
-                        closest_dist = dist
-                        closest_idx = i
-                except Exception:
-                    continue
-
-            if closest_idx is not None:
-                v = videos.nth(closest_idx)
-                self.logger.info(
-                    f"현재 릴스 video 선택 (index={closest_idx}, dist={closest_dist:.1f})"
+            # 고정 대기 없이, 릴스 카드나 컨테이너 중 하나가 보이는 즉시 진행
+            try:
+                self._loc(page, REELS_PAGE_READY_SELECTOR).first.wait_for(
+                    state="visible", timeout=10000
                 )
-                return v
-
-        except Exception as e:
-            self.logger.debug(f"현재 릴스 video 찾기 실패: {e}")
-
-        return None
+            except PlaywrightTimeoutError:
+                self.logger.warning("릴스 컨테이너를 찾지 못했습니다 (계속 진행)")
+            self.logger.info("릴스 페이지 로딩 완료")
+        except Exception as e:
+            self.logger.warning(f"릴스 페이지 로딩 대기 중 오류 (계속 진행): {e}")
 
-    def _get_current_reel_container(self, page: Page):
+    def _get_current_reel_instancekey(self, page: Page) -> Optional[str]:
         """
-        현재 화면에서 "재생 중인" 릴스 카드 컨테이너를 찾는다.
-
-        x1qjc9v5 카드들 중 **뷰포트 중앙에 가장 가까운 카드**를 선택한다.
+        (중복 체크용 백업) 현재 보이는 릴스의 data-instancekey 값 추출
 
-        (중요)
-        - 이전에는 data-instancekey 로 "현재 릴스"를 찾으려 했지만,
-          로그에서 보듯이 instancekey 값이 계속 동일하게 유지돼
-          항상 같은 카드만 바라보는 문제가 있었다.
-        - 그래서 이제는 **instancekey 를 전혀 사용하지 않고**,
-          화면 중앙 위치만 기준으로 현재 카드를 선택한다.
+        최근 레이아웃에서는 data-instancekey가 **플레이어 단위**로만 유지되거나
+        아예 존재하지 않는 경우가 많아서,
+        - "현재 어떤 릴스가 보이는지"를 구분하는 용도로는 사용하지 않는다.
+        - 단, 일부 예전 레이아웃에서만 중복 체크용 보조 수단으로 쓴다.
         """
         try:
-            # 카드 컨테이너(div.x1qjc9v5 ...)들 중 화면 중앙에 가장 가까운 것 선택
-            card_candidates = page.locator('div.x1qjc9v5')
-            count = card_candidates.count()
-            if not count:
-                # 클래스명이 조금 달라질 것을 대비한 백업 셀렉터
-                card_candidates = page.locator(
-                    'div[class*="x1qjc9v5"][class*="xg7h5cd"]'
-                )
-                count = card_candidates.count()
-
-            if not count:
-                self.logger.warning("현재 릴스 카드 컨테이너(div.x1qjc9v5)를 찾을 수 없습니다.")
-                return None
-
-            viewport = page.viewport_size
-            if not viewport:
-                self.logger.debug("viewport 정보를 가져올 수 없음. 첫 번째 카드 사용.")
-                return card_candidates.first
-
-            # 브라우저의 뷰포트 기준 좌표를 사용하기 위해 getBoundingClientRect() 사용
-            # Playwright의 bounding_box()는 페이지 전체 기준 좌표(scrollTop 포함)를 반환하므로,
-            # 스크롤된 상태에서는 viewport_height/2 와 비교하면 안 된다.
-            # 대신 JS evaluate를 통해 뷰포트 기준 좌표(top)를 직접 가져온다.
-            
-            closest_idx = None
-            closest_distance = float("inf")
-            
-            # 뷰포트 중앙 Y 좌표
-            viewport_center_y = viewport["height"] / 2
-
-            for i in range(min(12, count)):  # 너무 많이 보면 느려지니 12개까지만
-                div = card_candidates.nth(i)
-                try:
-                    # 뷰포트 기준 좌표(top, height) 가져오기
-                    rect = div.evaluate("el => { const r = el.getBoundingClientRect(); return { top: r.top, height: r.height, bottom: r.bottom }; }")
-                    
-                    # 요소의 수직 중앙점 (뷰포트 기준)
-                    element_center_y = rect["top"] + rect["height"] / 2
-                    
-                    # 뷰포트 중앙과의 거리
-                    distance = abs(element_center_y - viewport_center_y)
-                    
-                    # 화면에 보이는 요소만 대상 (적어도 일부라도 보여야 함)
-                    if rect["bottom"] > 0 and rect["top"] < viewport["height"]:
-                        if distance < closest_distance:
-                            closest_distance = distance
-                            closest_idx = i
-                except Exception:
-                    continue
-
-            if closest_idx is not None:
-                container = card_candidates.nth(closest_idx)
-                self.logger.info(f"현재 릴스 컨테이너 선택 완료 (index: {closest_idx}, 거리: {closest_distance:.1f}px)")
-                return container
-
+            instancekey_div = page.locator("div[data-instancekey]").first
+            if instancekey_div.is_visible(timeout=1000):
+                instancekey = instancekey_div.get_attribute("data-instancekey")
+                if instancekey:
+                    # INFO 로 남기면 로그가 너무 길어지므로 debug 로만 남김
+                    self.logger.debug(
+                        f"instancekey 추출 (중복 체크 보조용): {instancekey[:40]}..."
+                    )
+                    return instancekey
         except Exception as e:
-            self.logger.debug(f"현재 릴스 컨테이너 찾기 실패: {e}")
+            self.logger.debug(f"instancekey 추출 실패(무시 가능): {e}")
 
+        # instancekey 가 없다고 해서 오류는 아님
         return None
 
     def _extract_current_reel_data(self, page: Page) -> Optional[ReelData]:
         """
         현재 보이는 릴스의 정보를 수집
 
+        피드가 미리 받아온 API 응답에 현재 릴스(URL의 shortcode)가 있으면 DOM을 읽지 않고 그 값을
+        사용한다. 없으면 현재 릴스 컨테이너 결정과 필드별 추출/백업 규칙을 모두 _EXTRACT_REEL_JS
+        안에서 처리하여 릴스 하나당 CDP 왕복을 evaluate 한 번으로 줄인다.
+
         Args:
             page: Playwright Page 객체
 
@@ -791,579 +1391,51 @@ class InstagramReelsScraper:
         """
         try:
             self.logger.info("현재 릴스 정보 수집 중...")
-            
-            # 현재 URL 확인 (디버깅용)
-            current_url = page.url
-            self.logger.debug(f"현재 URL: {current_url}")
-            
-            reel_data = ReelData(
-                thumbnail=None,
-                likes=None,
-                comments=None,
-                author=None,
-                creator_profile_image=None,
-                title=None,
-                music=None,
-                link=None,
+            self.logger.debug(f"현재 URL: {page.url}")
+
+            shortcode = _reel_id(page.url)
+            cached = shortcode and self._reel_cache.get(shortcode)
+            if cached:
+                self.logger.info(f"릴스 정보 수집 완료 (API 응답: {shortcode})")
+                return ReelData.model_construct(**cached, link=page.url)
+
+            # 프로필 경로(/username/reel/...)로 열린 릴스는 URL에 작성자가 들어 있음
+            url_author = _URL_AUTHOR_RE.match(page.url)
+            author_hint = url_author.group(1) if url_author else None
+            raw = page.evaluate(_CALL_SCRAPE_REEL_JS, author_hint)
+            if raw is None:
+                raw = page.evaluate(
+                    _EXTRACT_REEL_JS,
+                    {
+                        "countFields": _COUNT_FIELDS,
+                        "cardSelector": REEL_CARD_SELECTOR,
+                        "activeCardSelector": ACTIVE_REEL_CARD_SELECTOR,
+                        "authorHint": author_hint,
+                    },
+                )
+            if raw["container"] == "page":
+                self.logger.info("현재 릴스 컨테이너를 찾지 못해 페이지 전체에서 검색했습니다.")
+            else:
+                self.logger.debug(f"현재 릴스 컨테이너 기준: {raw['container']}")
+
+            counts = {name: _parse_ko_count(raw["counts"][name]) for name, *_ in _COUNT_FIELDS}
+            fields = {
+                "thumbnail": raw["thumbnail"],
+                **counts,
+                "author": raw["author"],
+                "creator_profile_image": raw["profileImage"],
+                "title": raw["title"],
+                "music": raw["music"],
+                "link": raw["link"],
+            }
+            found = ", ".join(name for name, value in fields.items() if value is not None)
+            self.logger.info(f"릴스 정보 수집 완료 ({found or '수집된 필드 없음'})")
+            self.logger.debug(
+                f"좋아요 {counts['likes']}, 댓글 {counts['comments']}, 크리에이터 {raw['author']}"
             )
 
-            # 현재 릴스를 대표하는 컨테이너 결정
-            # 1순위: 화면 중앙에 가장 가까운 video 기준
-            root = page  # 기본값 (최악의 경우 페이지 전체 검색)
-            current_video = None  # 이후 썸네일/좋아요/댓글 추출에도 재사용
-            try:
-                current_video = self._get_current_reel_video(page)
-                if current_video:
-                    try:
-                        # 좋아요 버튼이 함께 들어있는 카드 컨테이너를 우선 시도
-                        container = current_video.locator(
-                            'xpath=ancestor::div[.//svg[@aria-label="좋아요"]][1]'
-                        )
-                        if container.count() > 0:
-                            root = container.first
-                            self.logger.info("현재 릴스 컨테이너를 video+좋아요 버튼 기준으로 선택")
-                        else:
-                            # fallback: video의 가장 가까운 상위 div 하나라도 사용
-                            fallback = current_video.locator("xpath=ancestor::div[1]")
-                            if fallback.count() > 0:
-                                root = fallback.first
-                                self.logger.info("현재 릴스 컨테이너를 video 상위 div 기준으로 선택")
-                    except Exception as e:
-                        self.logger.debug(f"video 기반 컨테이너 결정 실패: {e}")
-                else:
-                    # 2순위: 기존 카드 컨테이너 로직 (x1qjc9v5) 사용
-                    try:
-                        current_container = self._get_current_reel_container(page)
-                        if current_container:
-                            root = current_container
-                        else:
-                            self.logger.info(
-                                "현재 릴스 컨테이너를 찾지 못해 페이지 전체에서 검색합니다."
-                            )
-                    except Exception as e:
-                        self.logger.debug(
-                            f"현재 릴스 컨테이너 결정 실패 (페이지 전체 사용): {e}"
-                        )
-            except Exception as e:
-                self.logger.debug(f"현재 릴스 컨테이너 결정 중 예외 (페이지 전체 사용): {e}")
-
-            # 좋아요 수 추출 - reels.txt에서 확인한 규칙 기반
-            try:
-                # 방법 1: 좋아요 버튼 찾고 같은 컨테이너 내의 span.html-span.x1vvkbs 찾기
-                like_button_selectors = [
-                    'svg[aria-label="좋아요"]',
-                    'button[aria-label*="좋아요"]',
-                    'svg[aria-label*="Like"]',
-                ]
-                
-                for selector in like_button_selectors:
-                    try:
-                        like_button = root.locator(selector).first
-                        if like_button.is_visible(timeout=500):
-                            # 좋아요 버튼의 조상 요소에서 span.html-span.x1vvkbs 찾기
-                            # 좋아요 버튼과 같은 html-div 컨테이너 내의 형제 요소 찾기
-                            parent_div = like_button.locator('xpath=ancestor::div[contains(@class, "html-div")][position()<=3]')
-                            for i in range(min(3, parent_div.count())):
-                                try:
-                                    container = parent_div.nth(i)
-                                    # span.html-span.x1vvkbs 클래스를 가진 요소 찾기
-                                    number_spans = container.locator('span.html-span.x1vvkbs').all()
-                                    for span in number_spans[:3]:
-                                        try:
-                                            text = span.text_content() or ""
-                                            text = text.strip()
-                                            # 숫자 형식 처리 (예: "17.4만", "4346", "1,234")
-                                            if re.match(r'^[\d.,만천억]+$', text.replace(' ', '')):
-                                                likes_value = None
-
-                                                # "만" 단위 처리
-                                                if "만" in text:
-                                                    num_match = re.search(r'([\d.]+)', text)
-                                                    if num_match:
-                                                        num_val = float(num_match.group(1))
-                                                        likes_value = int(num_val * 10000)
-
-                                                # "천" 단위 처리
-                                                elif "천" in text:
-                                                    num_match = re.search(r'([\d.]+)', text)
-                                                    if num_match:
-                                                        num_val = float(num_match.group(1))
-                                                        likes_value = int(num_val * 1000)
-
-                                                # 단순 숫자 (콤마/점 포함)
-                                                else:
-                                                    likes_str = text.replace(",", "").replace(".", "")
-                                                    if likes_str.isdigit():
-                                                        likes_value = int(likes_str)
-
-                                                if likes_value and likes_value > 0:
-                                                    reel_data.likes = likes_value
-                                                    self.logger.info(f"좋아요 수: {reel_data.likes}")
-                                                    break
-                                        except Exception:
-                                            continue
-                                    if reel_data.likes:
-                                        break
-                                except Exception:
-                                    continue
-                            if reel_data.likes:
-                                break
-                    except Exception:
-                        continue
-
-                # 방법 2 (백업): 화면 전체에서 현재 비디오와 세로 위치가 가장 가까운 "좋아요" 아이콘 기준으로 수집
-                if not reel_data.likes and current_video:
-                    try:
-                        like_icons = page.locator(
-                            'svg[aria-label="좋아요"], svg[aria-label*="Like"]'
-                        )
-                        icon_count = like_icons.count()
-                        if icon_count:
-                            # 현재 비디오의 세로 중앙 위치
-                            video_rect = current_video.evaluate(
-                                "el => { const r = el.getBoundingClientRect(); "
-                                "return { top: r.top, height: r.height }; }"
-                            )
-                            video_center_y = video_rect["top"] + video_rect["height"] / 2
-
-                            closest_idx = None
-                            closest_dist = float("inf")
-
-                            for i in range(min(10, icon_count)):
-                                try:
-                                    icon = like_icons.nth(i)
-                                    rect = icon.evaluate(
-                                        "el => { const r = el.getBoundingClientRect(); "
-                                        "return { top: r.top, height: r.height }; }"
-                                    )
-                                    center_y = rect["top"] + rect["height"] / 2
-                                    dist = abs(center_y - video_center_y)
-                                    if dist < closest_dist:
-                                        closest_dist = dist
-                                        closest_idx = i
-                                except Exception:
-                                    continue
-
-                            if closest_idx is not None:
-                                like_button = like_icons.nth(closest_idx)
-                                parent_div = like_button.locator(
-                                    'xpath=ancestor::div[contains(@class, "html-div")][1]'
-                                )
-                                if parent_div.count() > 0:
-                                    container = parent_div.first
-                                    number_spans = container.locator(
-                                        'span.html-span.x1vvkbs'
-                                    ).all()
-                                    for span in number_spans[:3]:
-                                        try:
-                                            text = (span.text_content() or "").strip()
-                                            if re.match(
-                                                r'^[\d.,만천억]+$', text.replace(" ", "")
-                                            ):
-                                                likes_value = None
-                                                if "만" in text:
-                                                    m = re.search(r"([\d.]+)", text)
-                                                    if m:
-                                                        likes_value = int(
-                                                            float(m.group(1)) * 10000
-                                                        )
-                                                elif "천" in text:
-                                                    m = re.search(r"([\d.]+)", text)
-                                                    if m:
-                                                        likes_value = int(
-                                                            float(m.group(1)) * 1000
-                                                        )
-                                                else:
-                                                    likes_str = (
-                                                        text.replace(",", "")
-                                                        .replace(".", "")
-                                                        .strip()
-                                                    )
-                                                    if likes_str.isdigit():
-                                                        likes_value = int(likes_str)
-
-                                                if likes_value is not None:
-                                                    reel_data.likes = likes_value
-                                                    self.logger.info(
-                                                        f"좋아요 수(백업): {reel_data.likes}"
-                                                    )
-                                                    break
-                                        except Exception:
-                                            continue
-                    except Exception:
-                        pass
-
-            except Exception as e:
-                self.logger.debug(f"좋아요 수 추출 실패: {e}")
-
-            # 댓글 수 추출 - reels.txt에서 확인한 규칙 기반
-            try:
-                # 방법 1: 댓글 버튼 찾고 같은 컨테이너 내의 span.html-span.x1vvkbs 찾기
-                comment_button_selectors = [
-                    'svg[aria-label="댓글"]',
-                    'button[aria-label*="댓글"]',
-                    'svg[aria-label*="Comment"]',
-                ]
-                
-                for selector in comment_button_selectors:
-                    try:
-                        comment_button = root.locator(selector).first
-                        if comment_button.is_visible(timeout=500):
-                            # 댓글 버튼의 조상 요소에서 span.html-span.x1vvkbs 찾기
-                            parent_div = comment_button.locator('xpath=ancestor::div[contains(@class, "html-div")][position()<=3]')
-                            for i in range(min(3, parent_div.count())):
-                                try:
-                                    container = parent_div.nth(i)
-                                    # span.html-span.x1vvkbs 클래스를 가진 요소 찾기
-                                    number_spans = container.locator('span.html-span.x1vvkbs').all()
-                                    for span in number_spans[:3]:
-                                        try:
-                                            text = span.text_content() or ""
-                                            text = text.strip()
-                                            # 숫자 형식 처리 (댓글은 보통 숫자만)
-                                            if re.match(r'^[\d,]+$', text.replace(' ', '')):
-                                                comments_str = text.replace(',', '').replace('.', '')
-                                                if comments_str.isdigit():
-                                                    comments_value = int(comments_str)
-                                                    if comments_value >= 0:
-                                                        reel_data.comments = comments_value
-                                                        self.logger.info(f"댓글 수: {reel_data.comments}")
-                                                        break
-                                        except Exception:
-                                            continue
-                                    if reel_data.comments is not None:
-                                        break
-                                except Exception:
-                                    continue
-                            if reel_data.comments is not None:
-                                break
-                    except Exception:
-                        continue
-
-                # 방법 2 (백업): 현재 비디오 기준으로 세로 위치가 가장 가까운 "댓글" 아이콘 사용
-                if reel_data.comments is None and current_video:
-                    try:
-                        comment_icons = page.locator(
-                            'svg[aria-label="댓글"], svg[aria-label*="Comment"]'
-                        )
-                        icon_count = comment_icons.count()
-                        if icon_count:
-                            video_rect = current_video.evaluate(
-                                "el => { const r = el.getBoundingClientRect(); "
-                                "return { top: r.top, height: r.height }; }"
-                            )
-                            video_center_y = video_rect["top"] + video_rect["height"] / 2
-
-                            closest_idx = None
-                            closest_dist = float("inf")
-
-                            for i in range(min(10, icon_count)):
-                                try:
-                                    icon = comment_icons.nth(i)
-                                    rect = icon.evaluate(
-                                        "el => { const r = el.getBoundingClientRect(); "
-                                        "return { top: r.top, height: r.height }; }"
-                                    )
-                                    center_y = rect["top"] + rect["height"] / 2
-                                    dist = abs(center_y - video_center_y)
-                                    if dist < closest_dist:
-                                        closest_dist = dist
-                                        closest_idx = i
-                                except Exception:
-                                    continue
-
-                            if closest_idx is not None:
-                                comment_button = comment_icons.nth(closest_idx)
-                                parent_div = comment_button.locator(
-                                    'xpath=ancestor::div[contains(@class, "html-div")][1]'
-                                )
-                                if parent_div.count() > 0:
-                                    container = parent_div.first
-                                    number_spans = container.locator(
-                                        'span.html-span.x1vvkbs'
-                                    ).all()
-                                    for span in number_spans[:3]:
-                                        try:
-                                            text = (span.text_content() or "").strip()
-                                            if re.match(
-                                                r'^[\d,]+$', text.replace(" ", "")
-                                            ):
-                                                comments_str = (
-                                                    text.replace(",", "")
-                                                    .replace(".", "")
-                                                    .strip()
-                                                )
-                                                if comments_str.isdigit():
-                                                    comments_value = int(comments_str)
-                                                    reel_data.comments = comments_value
-                                                    self.logger.info(
-                                                        f"댓글 수(백업): {reel_data.comments}"
-                                                    )
-                                                    break
-                                        except Exception:
-                                            continue
-                    except Exception:
-                        pass
-
-            except Exception as e:
-                self.logger.debug(f"댓글 수 추출 실패: {e}")
-
-            # 크리에이터 이름 추출 - reels.txt에서 확인한 규칙 기반
-            try:
-                # 방법 1: aria-label에 "님의 릴스"가 포함된 링크에서 추출
-                try:
-                    creator_link = root.locator('a[aria-label*="님의 릴스"]').first
-                    if creator_link.is_visible(timeout=500):
-                        # href에서 사용자명 추출 (예: /jeonnamdragons_fc/reels/)
-                        href = creator_link.get_attribute("href") or ""
-                        if href.startswith("/") and "/reels/" in href:
-                            username_match = re.search(r'^/([^/]+)/reels', href)
-                            if username_match:
-                                reel_data.author = username_match.group(1)
-                                self.logger.info(f"크리에이터 (href): {reel_data.author}")
-                            else:
-                                # 링크 내부의 span[dir="auto"]에서 텍스트 추출
-                                author_span = creator_link.locator('span[dir="auto"]').first
-                                if author_span.is_visible(timeout=500):
-                                    author_text = author_span.text_content() or ""
-                                    if author_text.strip() and len(author_text.strip()) < 50:
-                                        reel_data.author = author_text.strip()
-                                        self.logger.info(f"크리에이터 (텍스트): {reel_data.author}")
-                except Exception:
-                    pass
-                
-                # 방법 2: 프로필 이미지 근처의 span[dir="auto"]에서 추출
-                if not reel_data.author:
-                    try:
-                        profile_imgs = root.locator(
-                            'img[alt*="프로필 사진"], img[alt*="님의 프로필 사진"]'
-                        ).all()
-                        for img in profile_imgs[:5]:
-                            try:
-                                # 이미지의 부모 링크에서 span 찾기
-                                parent_link = img.locator('xpath=ancestor::a[1]')
-                                if parent_link.count() > 0:
-                                    author_span = parent_link.locator('span[dir="auto"]').first
-                                    if author_span.is_visible(timeout=500):
-                                        author_text = author_span.text_content() or ""
-                                        if author_text.strip() and len(author_text.strip()) < 50:
-                                            reel_data.author = author_text.strip()
-                                            self.logger.info(f"크리에이터 (프로필 이미지): {reel_data.author}")
-                                            break
-                            except Exception:
-                                continue
-                    except Exception:
-                        pass
-                        
-            except Exception as e:
-                self.logger.debug(f"크리에이터 이름 추출 실패: {e}")
-
-            # 크리에이터 프로필 사진 추출 - reels.txt에서 확인한 규칙 기반
-            try:
-                # 방법 1: alt에 "님의 프로필 사진"이 포함된 이미지 찾기
-                try:
-                    profile_img = root.locator('img[alt*="님의 프로필 사진"]').first
-                    if profile_img.is_visible(timeout=500):
-                        img_src = profile_img.get_attribute("src")
-                        if img_src and "cdninstagram" in img_src:
-                            reel_data.creator_profile_image = img_src
-                            self.logger.info(f"프로필 사진: {reel_data.creator_profile_image[:50]}...")
-                except Exception:
-                    pass
-                
-                # 방법 2: 백업 - 프로필 링크 내부의 이미지
-                if not reel_data.creator_profile_image:
-                    try:
-                        creator_link = root.locator('a[aria-label*="님의 릴스"]').first
-                        if creator_link.is_visible(timeout=500):
-                            profile_img = creator_link.locator('img[src*="cdninstagram"]').first
-                            if profile_img.is_visible(timeout=500):
-                                img_src = profile_img.get_attribute("src")
-                                if img_src:
-                                    reel_data.creator_profile_image = img_src
-                                    self.logger.info(f"프로필 사진 (백업): {reel_data.creator_profile_image[:50]}...")
-                    except Exception:
-                        pass
-                        
-            except Exception as e:
-                self.logger.debug(f"프로필 사진 추출 실패: {e}")
-
-            # 제목 추출 - 제공된 HTML 구조 기반
-            try:
-                # 방법 1: span.x6ikm8r.x10wlt62.xuxw1ft 클래스를 가진 요소 (제목 스타일)
-                try:
-                    title_spans = root.locator('span.x6ikm8r.x10wlt62.xuxw1ft').all()
-                    for span in title_spans[:10]:
-                        try:
-                            title_text = span.text_content() or ""
-                            title_text = title_text.strip()
-                            # 제목 조건: 충분히 긴 텍스트, 사용자명/음악과 다름
-                            if (len(title_text) > 5 and len(title_text) < 500 and 
-                                title_text != reel_data.author and 
-                                (not reel_data.music or title_text != reel_data.music) and
-                                not title_text.startswith('@') and
-                                not re.match(r'^[\d,]+$', title_text) and
-                                not title_text.startswith('오리지널')):
-                                reel_data.title = title_text
-                                self.logger.info(f"제목: {reel_data.title[:50]}...")
-                                break
-                        except Exception:
-                            continue
-                except Exception:
-                    pass
-                
-                # 방법 2: span[dir="auto"] 중에서 긴 텍스트 찾기 (백업)
-                if not reel_data.title:
-                    try:
-                        title_spans = root.locator('span[dir="auto"]').all()
-                        for span in title_spans[:20]:
-                            try:
-                                title_text = span.text_content() or ""
-                                title_text = title_text.strip()
-                                if (len(title_text) > 10 and len(title_text) < 500 and 
-                                    title_text != reel_data.author and 
-                                    (not reel_data.music or title_text != reel_data.music) and
-                                    not title_text.startswith('@') and
-                                    not re.match(r'^[\d,]+$', title_text)):
-                                    reel_data.title = title_text
-                                    self.logger.info(f"제목 (백업): {reel_data.title[:50]}...")
-                                    break
-                            except Exception:
-                                continue
-                    except Exception:
-                        pass
-                        
-            except Exception as e:
-                self.logger.debug(f"제목 추출 실패: {e}")
-
-            # 영상 썸네일 추출 - reels.txt에서 확인한 규칙 기반
-            try:
-                # 방법 0: 현재 비디오의 poster 속성 사용 (가장 정확한 경우)
-                try:
-                    video_for_thumb = current_video or self._get_current_reel_video(page)
-                except Exception:
-                    video_for_thumb = None
-
-                if video_for_thumb:
-                    try:
-                        poster = video_for_thumb.get_attribute("poster")
-                        if poster and "cdninstagram" in poster:
-                            reel_data.thumbnail = poster
-                            self.logger.info(
-                                f"썸네일(poster): {reel_data.thumbnail[:50]}..."
-                            )
-                    except Exception:
-                        pass
-
-                # 방법 1: img.xz74otr 클래스를 가진 이미지 (릴스 썸네일)
-                if not reel_data.thumbnail:
-                    try:
-                        thumbnail_img = (
-                            (current_video or root)
-                            .locator(
-                                'xpath=ancestor::div[.//img[contains(@class, "xz74otr")]][1]'
-                            )
-                            .locator(
-                                'img.xz74otr[src*="cdninstagram"]:not([alt*="님의 프로필 사진"])'
-                            )
-                            .first
-                        )
-                        if thumbnail_img.is_visible(timeout=500):
-                            img_src = thumbnail_img.get_attribute("src")
-                            if img_src and ("t51" in img_src or "t52" in img_src):
-                                reel_data.thumbnail = img_src
-                                self.logger.info(
-                                    f"썸네일: {reel_data.thumbnail[:50]}..."
-                                )
-                    except Exception:
-                        pass
-
-                # 방법 2: 비디오 근처의 이미지 (프로필 사진 제외)
-                if not reel_data.thumbnail and video_for_thumb:
-                    try:
-                        parent = video_for_thumb.locator("xpath=ancestor::div[2]")
-                        if parent.count() > 0:
-                            thumbnail_img = parent.locator(
-                                'img[src*="cdninstagram"][src*="/v/t"]:not([alt*="님의 프로필 사진"])'
-                            ).first
-                            if thumbnail_img.is_visible(timeout=500):
-                                img_src = thumbnail_img.get_attribute("src")
-                                if img_src:
-                                    reel_data.thumbnail = img_src
-                                    self.logger.info(
-                                        f"썸네일 (비디오 근처): {reel_data.thumbnail[:50]}..."
-                                    )
-                    except Exception:
-                        pass
-
-            except Exception as e:
-                self.logger.debug(f"썸네일 추출 실패: {e}")
-
-            # 배경음악 추출 - reels.txt에서 확인한 규칙 기반
-            try:
-                # 방법 1: /audio/ 링크 내부의 span.xuxw1ft 또는 span.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft 찾기
-                try:
-                    audio_link = root.locator('a[href*="/reels/audio/"]').first
-                    if audio_link.is_visible(timeout=500):
-                        # 링크 내부의 span.xuxw1ft 또는 span.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft 클래스 요소 찾기
-                        music_spans = audio_link.locator('span.xuxw1ft, span.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft').all()
-                        for span in music_spans[:3]:
-                            try:
-                                music_text = span.text_content() or ""
-                                music_text = music_text.strip()
-                                # "오리지널 오디오"가 포함된 텍스트 찾기 (예: "jeonnamdragons_fc · 오리지널 오디오")
-                                if music_text and len(music_text) > 3:
-                                    reel_data.music = music_text
-                                    self.logger.info(f"배경음악: {reel_data.music}")
-                                    break
-                            except Exception:
-                                continue
-                        
-                        # 백업: 링크 내부의 모든 텍스트
-                        if not reel_data.music:
-                            music_text = audio_link.text_content() or ""
-                            music_text = music_text.strip()
-                            if music_text and len(music_text) > 3:
-                                reel_data.music = music_text
-                                self.logger.info(f"배경음악 (백업): {reel_data.music}")
-                except Exception:
-                    pass
-                
-                # 방법 2: 텍스트에 "오리지널 오디오" 또는 "· 오리지널"이 포함된 요소 찾기
-                if not reel_data.music:
-                    try:
-                        all_spans = root.locator(
-                            'span.xuxw1ft, span.x6ikm8r.x10wlt62.xlyipyv.xuxw1ft'
-                        ).all()
-                        for span in all_spans[:20]:
-                            try:
-                                text = span.text_content() or ""
-                                text = text.strip()
-                                if ("오리지널 오디오" in text or "· 오리지널" in text) and len(text) > 5:
-                                    reel_data.music = text
-                                    self.logger.info(f"배경음악 (패턴): {reel_data.music}")
-                                    break
-                            except Exception:
-                                continue
-                    except Exception:
-                        pass
-                        
-            except Exception as e:
-                self.logger.debug(f"배경음악 추출 실패: {e}")
-
-            # 게시물 링크 추출 - URL에서 직접 추출
-            try:
-                # 현재 페이지 URL 그대로를 사용 (릴스 전환 시 URL이 함께 바뀌므로 충분히 구분 가능)
-                current_url = page.evaluate("window.location.href")
-                if isinstance(current_url, str) and "instagram.com" in current_url:
-                    reel_data.link = current_url
-                    self.logger.info(f"링크 (URL): {reel_data.link}")
-
-            except Exception as e:
-                self.logger.debug(f"링크 추출 실패: {e}")
-
-            self.logger.info("릴스 정보 수집 완료")
-            return reel_data
+            # 추출 단계에서 값을 이미 정리했으므로 검증 없이 생성
+            return ReelData.model_construct(**fields)
 
         except Exception as e:
             self.logger.error(f"릴스 정보 수집 중 오류: {e}")
@@ -1382,8 +1454,8 @@ class InstagramReelsScraper:
         try:
             self.logger.info("다음 릴스로 이동 중...")
 
-            # 이동 전 URL 저장 (JS로 직접 가져오기)
-            initial_url = page.evaluate("window.location.href")
+            # 이동 전 URL 저장 (page.url은 같은 문서 내 URL 변경도 반영하므로 CDP 호출 불필요)
+            initial_url = page.url
             self.logger.debug(f"이동 전 URL: {initial_url}")
             
             # 방법 1: 마우스 휠로 화면 전체 높이만큼 스크롤 (1번만 시도)
@@ -1395,19 +1467,13 @@ class InstagramReelsScraper:
                     page.mouse.move(viewport["width"] // 2, viewport["height"] // 2)
                     page.mouse.wheel(0, viewport_height)
 
-                    # 충분한 대기 시간 (릴스 전환 대기)
-                    time.sleep(4)  # 대기 시간 증가
-
-                    # URL 변화 확인 (JS로 직접 가져오기)
-                    new_url = page.evaluate("window.location.href")
-                    if new_url != initial_url:
+                    # 릴스 전환(URL 변경)까지 최대 4초 대기
+                    if self._wait_for_url_change(page, initial_url):
+                        new_url = page.url
                         # /reels/<id>/ 형태면 ID 기준으로도 한 번 더 로그 남김
-                        new_match = re.search(r"/reels?/([^/?#]+)/?", new_url)
-                        old_match = re.search(r"/reels?/([^/?#]+)/?", initial_url)
-                        if new_match and old_match and new_match.group(1) != old_match.group(1):
-                            self.logger.info(
-                                f"스크롤로 다음 릴스 이동 완료 (reels ID 변경: {new_match.group(1)})"
-                            )
+                        new_id, old_id = _reel_id(new_url), _reel_id(initial_url)
+                        if new_id and old_id and new_id != old_id:
+                            self.logger.info(f"스크롤로 다음 릴스 이동 완료 (reels ID 변경: {new_id})")
                         else:
                             self.logger.info(
                                 f"스크롤로 다음 릴스 이동 완료 (URL 변경): {new_url}"
@@ -1424,17 +1490,13 @@ class InstagramReelsScraper:
             try:
                 self.logger.debug("마우스 휠 실패 또는 변화 없음, 화살표 키 시도...")
                 page.keyboard.press("ArrowDown")
-                time.sleep(4)  # 충분한 대기
 
                 # URL의 reel ID 또는 전체 URL 변경으로 확인
-                new_url = page.evaluate("window.location.href")
-                if new_url != initial_url:
-                    new_match = re.search(r"/reels?/([^/?#]+)/?", new_url)
-                    old_match = re.search(r"/reels?/([^/?#]+)/?", initial_url)
-                    if new_match and old_match and new_match.group(1) != old_match.group(1):
-                        self.logger.info(
-                            f"화살표 키로 다음 릴스 이동 완료 (reels ID 변경: {new_match.group(1)})"
-                        )
+                if self._wait_for_url_change(page, initial_url):
+                    new_url = page.url
+                    new_id, old_id = _reel_id(new_url), _reel_id(initial_url)
+                    if new_id and old_id and new_id != old_id:
+                        self.logger.info(f"화살표 키로 다음 릴스 이동 완료 (reels ID 변경: {new_id})")
                     else:
                         self.logger.info(f"화살표 키로 다음 릴스 이동 완료 (URL 변경): {new_url}")
                     return True
@@ -1448,100 +1510,140 @@ class InstagramReelsScraper:
             self.logger.warning(f"다음 릴스 이동 실패: {e}")
             return False
 
+    @staticmethod
+    def _wait_for_url_change(page: Page, initial_url: str, timeout: int = 4000) -> bool:
+        """
+        페이지 URL이 initial_url에서 바뀔 때까지 대기 (바뀌는 즉시 반환)
+
+        Args:
+            page: Playwright Page 객체
+            initial_url: 이동 전 URL
+            timeout: 최대 대기 시간 (밀리초)
+
+        Returns:
+            제한 시간 안에 URL이 바뀌었는지 여부
+        """
+        try:
+            # 뒤쪽 탭은 requestAnimationFrame이 멈출 수 있으므로 시간 간격으로 확인
+            page.wait_for_function(
+                "u => location.href !== u", arg=initial_url, polling=100, timeout=timeout
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    @staticmethod
+    def _wait_for_reel_settled(page: Page, timeout: int = 3000) -> bool:
+        """
+        이동한 릴스가 화면 중앙에 자리 잡고 영상 메타데이터가 로드될 때까지 대기
+
+        Args:
+            page: Playwright Page 객체
+            timeout: 최대 대기 시간 (밀리초)
+
+        Returns:
+            제한 시간 안에 릴스가 자리 잡았는지 여부
+        """
+        try:
+            page.wait_for_function(
+                _REEL_SETTLED_JS,
+                arg={"selector": ACTIVE_REEL_CARD_SELECTOR, "token": time.monotonic_ns()},
+                polling=100,
+                timeout=timeout,
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
     def start_collecting_reels(self) -> None:
         """
         릴스 수집 시작 (무한 반복)
 
         릴스 탭에서 현재 릴스 정보를 수집하고, 다음 릴스로 이동하여 반복합니다.
+        config.reel_tabs가 2 이상이면 같은 컨텍스트에 릴스 피드를 추가로 열어 탭을 차례로 넘깁니다.
+        (Sync API는 스레드 간에 공유할 수 없으므로 한 스레드에서 번갈아 처리)
         수집한 데이터는 주기적으로 저장합니다.
         """
+        seen_keys: Optional[PersistentKeys] = None
+        collected_reels: list[ReelData] = []
+        saved_count = 0  # NDJSON에 기록한 릴스 수
+        ndjson_path: Optional[Path] = None
         try:
-            if self.browser_manager is None:
+            if not self._browser_started:
                 raise ScrapingError("브라우저가 시작되지 않았습니다. 먼저 로그인하세요.")
 
-            page = self.browser_manager.get_page()
-            self.logger.info("릴스 수집 시작...")
+            # 추가 탭은 같은 컨텍스트(세션 공유)에서 릴스 피드를 따로 열고, 모든 탭을 차례로 넘김
+            # 피드 API 응답은 컨텍스트 단위로 캐시되므로 탭이 늘어날수록 한 번에 모이는 릴스도 늘어남
+            pages = [self.browser.get_page()]
+            while len(pages) < self.config.reel_tabs:
+                extra = self.browser.new_page()
+                self._goto(extra, REELS_URL, wait_until="commit")
+                pages.append(extra)
+            self.logger.info(f"릴스 수집 시작... (탭 {len(pages)}개)")
 
             # 릴스 페이지 로딩 대기
-            self._wait_for_reels_page_load(page)
+            for page in pages:
+                self._wait_for_reels_page_load(page)
 
-            collected_reels: list[ReelData] = []
-            collected_reel_ids: set[str] = set()  # 중복 체크용 (URL 기반 ID)
-            collected_thumbnails: set[str] = set()  # 썸네일 중복 체크용
+            # 중복 체크용 키 (릴스 ID 또는 썸네일 해시, 최근 5000개는 메모리에서 바로 확인)
+            # output_dir/seen.sqlite에 기록해 다시 실행해도 이전에 저장한 릴스는 건너뜀
+            seen_keys = PersistentKeys(self.config.output_dir / "seen.sqlite", max_size=5000)
+
+            # 수집 중에는 새로 모은 릴스만 NDJSON 파일에 이어 써서 매번 전체를 다시 직렬화하지 않음
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            ndjson_path = self.config.output_dir / f"reels_data_{timestamp}.ndjson"
             save_interval = 10  # 10개마다 저장
             consecutive_failures = 0  # 연속 실패 횟수
-            max_failures = 5  # 최대 연속 실패 허용 횟수
+            max_failures = 5  # 최대 연속 실패 허용 횟수 (모든 탭 합산)
+            turn = 0  # 이번에 넘길 탭 순번
             
             while True:
+                page = pages[turn % len(pages)]
+                turn += 1
                 try:
-                    # 현재 릴스 정보 수집
-                    reel_data = self._extract_current_reel_data(page)
-                    
-                    if reel_data:
-                        # 중복 체크 (여러 방법 사용)
-                        is_duplicate = False
-                        duplicate_reason = None
-                        
-                        # 방법 1: ReelData.link 또는 현재 페이지 URL에서 /reels/<id>/ 기준 중복 체크
-                        reel_id: Optional[str] = None
-                        url_candidates: list[tuple[str, str]] = []
-
-                        # 우선순위 1: reel_data.link (가능하면 이 값을 신뢰)
-                        if reel_data.link and isinstance(reel_data.link, str):
-                            url_candidates.append(("link", reel_data.link))
-
-                        # 백업용: page.url
-                        current_url = page.url
-                        if isinstance(current_url, str):
-                            url_candidates.append(("URL", current_url))
-
-                        for source_name, url_value in url_candidates:
-                            match = re.search(r"/reels?/([^/?#]+)/?", url_value)
-                            if not match:
-                                continue
-
-                            candidate_id = match.group(1)
-
-                            # 이미 같은 ID로 판정된 경우는 다시 확인할 필요 없음
-                            if reel_id is not None and candidate_id == reel_id:
-                                continue
+                    # 피드가 API로 미리 받아온 릴스를 한 번에 수집
+                    prefetched = self._collect_cached_reels(seen_keys)
+                    if prefetched:
+                        collected_reels.extend(prefetched)
+                        consecutive_failures = 0
+                        self.logger.info(
+                            f"API 응답에서 릴스 {len(prefetched)}개 수집 (총 {len(collected_reels)}개)"
+                        )
 
-                            reel_id = candidate_id
+                    # 현재 릴스 정보 수집 (위에서 이미 수집한 릴스면 DOM 추출 없이 건너뜀)
+                    current_id = _reel_id(page.url)
+                    if current_id and current_id in seen_keys:
+                        self.logger.debug(f"이미 수집한 릴스: {current_id}")
+                        reel_data = None
+                    else:
+                        reel_data = self._extract_current_reel_data(page)
 
-                            if reel_id in collected_reel_ids:
-                                is_duplicate = True
-                                duplicate_reason = f"reels ID ({source_name}): {reel_id}"
-                            else:
-                                collected_reel_ids.add(reel_id)
+                    if reel_data:
+                        # 중복 체크 키: 릴스 ID (link 우선, 없으면 현재 URL) > 썸네일 URL 해시
+                        reel_id = reel_data.reel_id or current_id
+                        if reel_id:
+                            dedup_key = reel_id
+                        elif reel_data.thumbnail:
+                            digest = hashlib.sha1(reel_data.thumbnail.encode()).hexdigest()[:24]
+                            dedup_key = f"t:{digest}"
+                        else:
+                            dedup_key = None
 
-                            # 한 번 유효 ID를 처리했으면 더 이상 다른 소스는 볼 필요 없음
-                            break
-                        
-                        # 방법 3: 백업 - 썸네일 URL로 체크
-                        if not is_duplicate and reel_data.thumbnail:
-                            thumbnail_key = reel_data.thumbnail
-                            if thumbnail_key in collected_thumbnails:
-                                is_duplicate = True
-                                duplicate_reason = f"썸네일: {reel_data.thumbnail[:50]}..."
-                            else:
-                                collected_thumbnails.add(thumbnail_key)
-                        
-                        if is_duplicate:
-                            self.logger.warning(f"중복 릴스 감지 ({duplicate_reason})")
-                        
-                        # 중복이 아닌 경우에만 추가
-                        if not is_duplicate:
+                        # 중복이 아닌 경우에만 추가 (키가 없으면 판단할 수 없으므로 추가)
+                        if dedup_key is None or seen_keys.add(dedup_key):
                             collected_reels.append(reel_data)
                             consecutive_failures = 0  # 성공 시 실패 카운터 리셋
                             self.logger.info(f"수집된 릴스 수: {len(collected_reels)} (작성자: {reel_data.author})")
                         else:
+                            # 썸네일 키는 "t:" 접두사로 구분됨
+                            self.logger.warning(f"중복 릴스 감지 ({dedup_key})")
                             self.logger.info("중복 릴스 건너뜀")
-                        
-                        # 주기적으로 저장
-                        if len(collected_reels) >= save_interval:
-                            self.logger.info(f"{save_interval}개 수집 완료. 임시 저장 중...")
-                            self.save_to_json(collected_reels)
-                            save_interval += 10
+
+                    # 주기적으로 저장 (API 응답으로 한 번에 여러 개가 늘어날 수 있음)
+                    if len(collected_reels) - saved_count >= save_interval:
+                        self.logger.info(f"{len(collected_reels)}개 수집 완료. 임시 저장 중...")
+                        self._append_ndjson(collected_reels[saved_count:], ndjson_path)
+                        saved_count = len(collected_reels)
                     
                     # 다음 릴스로 이동
                     if not self._move_to_next_reel(page):
@@ -1552,12 +1654,13 @@ class InstagramReelsScraper:
                             self.logger.error(f"연속 {max_failures}회 이동 실패. 수집 중단.")
                             break
                         
-                        time.sleep(3)
+                        # 늦게 전환되는 경우에 대비해 URL이 바뀌면 바로 재시도 (최대 2초)
+                        self._wait_for_url_change(page, page.url, timeout=2000)
                     else:
                         consecutive_failures = 0  # 이동 성공 시 실패 카운터 리셋
-                        # 이동 성공 후 추가 안정화 대기
-                        time.sleep(1)
-                        random_delay(0.5, 1.0)
+                        # 고정 대기 대신 새 릴스가 자리 잡는 즉시 진행 (최대 3초)
+                        if not self._wait_for_reel_settled(page):
+                            self.logger.debug("릴스 안정화 대기 시간 초과 (계속 진행)")
 
                 except KeyboardInterrupt:
                     self.logger.info("사용자에 의해 중단되었습니다.")
@@ -1573,6 +1676,15 @@ class InstagramReelsScraper:
         except Exception as e:
             self.logger.error(f"릴스 수집 실패: {e}")
             raise ScrapingError(f"릴스 수집에 실패했습니다: {e}") from e
+        finally:
+            # 중복 체크 키를 기록하기 전에 아직 저장하지 않은 릴스를 먼저 기록
+            # (키만 남고 데이터가 없으면 다음 실행에서도 그 릴스를 영영 건너뜀)
+            try:
+                if ndjson_path is not None and len(collected_reels) > saved_count:
+                    self._append_ndjson(collected_reels[saved_count:], ndjson_path)
+            finally:
+                if seen_keys is not None:
+                    seen_keys.close()
 
     def scrape_reels(
         self,
@@ -1605,25 +1717,20 @@ class InstagramReelsScraper:
         try:
             self.logger.info(f"스크래핑 시작 - 해시태그: {hashtag}, URL: {url}")
 
-            # 브라우저 시작 (아직 시작되지 않은 경우)
-            if self.browser_manager is None:
-                self.browser_manager = BrowserManager(self.config)
-                self.browser_manager.start()
-
-            page = self.browser_manager.get_page()
+            # 브라우저는 처음 접근할 때 시작됨
+            page = self.browser.get_page()
             reels: list[ReelData] = []
 
             if url:
                 # 특정 URL로 스크래핑
-                page.goto(url)
+                self._goto(page, url)
                 page.wait_for_load_state("networkidle")
                 # TODO: 단일 릴스 데이터 추출
             elif hashtag:
                 # 해시태그로 검색
-                search_url = f"https://www.instagram.com/explore/tags/{hashtag.replace('#', '')}/"
-                page.goto(search_url)
+                self._goto(page, self._hashtag_url(hashtag))
                 page.wait_for_load_state("networkidle")
-                # TODO: 해시태그 검색 결과에서 릴스 추출
+                reels = self.extract_reels_from_page(page, max_reels)
 
             # 요청 딜레이 적용
             if self.config.request_delay > 0:
@@ -1638,6 +1745,120 @@ class InstagramReelsScraper:
             self.logger.error(f"스크래핑 실패: {e}")
             raise ScrapingError(f"스크래핑에 실패했습니다: {e}") from e
 
+    @staticmethod
+    def _hashtag_url(hashtag: str) -> str:
+        """해시태그 검색 페이지 URL 생성"""
+        return f"https://www.instagram.com/explore/tags/{hashtag.replace('#', '')}/"
+
+    def scrape_hashtags(self, hashtags: list[str], max_reels: Optional[int] = None) -> list[ReelData]:
+        """
+        여러 해시태그를 동시에 스크래핑
+
+        같은 브라우저 컨텍스트에 최대 config.max_concurrency개의 페이지를 열고,
+        각 페이지의 네비게이션을 먼저 모두 시작한 뒤 로드 완료를 차례로 기다린다.
+        Sync API는 호출 스레드를 막지만 페이지 로드 자체는 브라우저에서 병렬로 진행된다.
+
+        Args:
+            hashtags: 해시태그 리스트
+            max_reels: 해시태그별 최대 수집 개수 (선택, config보다 우선)
+
+        Returns:
+            릴스 정보 리스트
+
+        Raises:
+            ScrapingError: 스크래핑 실패 시
+            RateLimitError: 요청 제한 초과 시
+        """
+        if not hashtags:
+            raise ScrapingError("해시태그가 필요합니다.")
+
+        max_reels = max_reels or self.config.max_reels
+
+        try:
+            self.logger.info(f"해시태그 동시 스크래핑 시작: {len(hashtags)}개")
+
+            pages = [self.browser.get_page()]
+            concurrency = min(self.config.max_concurrency, len(hashtags))
+            while len(pages) < concurrency:
+                pages.append(self.browser.new_page())
+
+            reels: list[ReelData] = []
+            for start in range(0, len(hashtags), concurrency):
+                batch = list(zip(pages, hashtags[start : start + concurrency]))
+
+                # 응답이 시작되면 바로 반환되므로 배치 안의 페이지 로드가 겹쳐서 진행됨
+                for page, hashtag in batch:
+                    self._goto(page, self._hashtag_url(hashtag), wait_until="commit")
+
+                for page, hashtag in batch:
+                    page.wait_for_load_state("networkidle")
+                    self.logger.debug(f"해시태그 페이지 로드 완료: {hashtag}")
+                    reels.extend(self.extract_reels_from_page(page, max_reels))
+
+                # 요청 딜레이 적용 (배치 단위)
+                if self.config.request_delay > 0:
+                    time.sleep(self.config.request_delay)
+
+            self.logger.info(f"해시태그 동시 스크래핑 완료: {len(reels)}개 수집")
+            return reels
+        except RateLimitError as e:
+            self.logger.error(f"요청 제한 초과: {e}")
+            raise
+        except Exception as e:
+            self.logger.error(f"스크래핑 실패: {e}")
+            raise ScrapingError(f"스크래핑에 실패했습니다: {e}") from e
+
+    def extract_reels_from_page(self, page: Page, max_reels: Optional[int] = None) -> list[ReelData]:
+        """
+        해시태그 검색 결과 페이지의 릴스 카드에서 데이터 추출
+
+        page.content()로 전체 HTML을 가져오지 않고, 카드 링크들에 대해 JS를 한 번만 실행하여
+        필요한 필드만 담긴 작은 리스트를 받아 한 번에 검증한다.
+
+        Args:
+            page: Playwright Page 객체
+            max_reels: 최대 추출 개수 (None이면 전체)
+
+        Returns:
+            추출된 릴스 데이터 리스트
+
+        Raises:
+            DataExtractionError: 데이터 추출 실패 시
+        """
+        try:
+            limit = max_reels if max_reels is not None else 2**31 - 1
+            cards = page.locator(REEL_LINK_SELECTOR).evaluate_all(_REEL_CARDS_JS, limit)
+            reels = REEL_LIST_ADAPTER.validate_python(cards)
+            self.logger.info(f"릴스 카드 추출: {len(reels)}개")
+            return reels
+        except Exception as e:
+            self.logger.error(f"릴스 카드 추출 실패: {e}")
+            raise DataExtractionError(f"릴스 카드 추출에 실패했습니다: {e}") from e
+
+    def _extract_reel_fields(self, reel_element: any) -> dict:  # noqa: ANN001
+        """
+        릴스 요소에서 필드 값을 dict로 추출 (검증 전 원본 값)
+
+        Args:
+            reel_element: 릴스 HTML 요소 또는 데이터 객체
+
+        Returns:
+            ReelData 필드명을 키로 하는 dict
+        """
+        # TODO: 실제 데이터 추출 로직 구현
+        # Playwright의 page.locator()를 사용하여 요소 선택
+        # 예: page.locator('selector').text_content()
+        return {
+            "thumbnail": None,
+            "likes": None,
+            "comments": None,
+            "author": None,
+            "creator_profile_image": None,
+            "title": None,
+            "music": None,
+            "link": None,
+        }
+
     def extract_reel_data(self, reel_element: any) -> ReelData:  # noqa: ANN001
         """
         릴스 요소에서 데이터 추출
@@ -1653,32 +1874,47 @@ class InstagramReelsScraper:
         """
         try:
             self.logger.debug("데이터 추출 시작")
-            # TODO: 실제 데이터 추출 로직 구현
-            # Playwright의 page.locator()를 사용하여 요소 선택
-            # 예: page.locator('selector').text_content()
-            data = ReelData(
-                thumbnail=None,
-                likes=None,
-                comments=None,
-                author=None,
-                creator_profile_image=None,
-                title=None,
-                music=None,
-                link=None,
-            )
+            # 추출기가 필드 타입을 보장하므로 검증 없이 생성 (일괄 경로에서는 검증 유지)
+            data = ReelData.model_construct(**self._extract_reel_fields(reel_element))
             self.logger.debug("데이터 추출 완료")
             return data
         except Exception as e:
             self.logger.error(f"데이터 추출 실패: {e}")
             raise DataExtractionError(f"데이터 추출에 실패했습니다: {e}") from e
 
-    def save_to_json(self, data: list[ReelData], filename: Optional[str] = None) -> Path:
+    def extract_reels_bulk(self, reel_elements: list) -> list[ReelData]:
+        """
+        여러 릴스 요소에서 데이터를 추출하고 한 번에 검증
+
+        Args:
+            reel_elements: 릴스 HTML 요소 또는 데이터 객체 리스트
+
+        Returns:
+            추출된 릴스 데이터 리스트
+
+        Raises:
+            DataExtractionError: 데이터 추출 실패 시
+        """
+        try:
+            self.logger.debug(f"데이터 일괄 추출 시작: {len(reel_elements)}개")
+            fields = [self._extract_reel_fields(element) for element in reel_elements]
+            data = REEL_LIST_ADAPTER.validate_python(fields)
+            self.logger.debug("데이터 일괄 추출 완료")
+            return data
+        except Exception as e:
+            self.logger.error(f"데이터 일괄 추출 실패: {e}")
+            raise DataExtractionError(f"데이터 일괄 추출에 실패했습니다: {e}") from e
+
+    def save_to_json(
+        self, data: list[ReelData], filename: Optional[str] = None, compress: bool = False
+    ) -> Path:
         """
         데이터를 JSON 파일로 저장
 
         Args:
             data: 저장할 데이터
             filename: 파일명 (None이면 자동 생성)
+            compress: True이면 gzip으로 압축해서 파일명 뒤에 .gz를 붙여 저장
 
         Returns:
             저장된 파일 경로
@@ -1687,20 +1923,21 @@ class InstagramReelsScraper:
             InstagramScraperError: 저장 실패 시
         """
         if filename is None:
-            from datetime import datetime
-
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"reels_data_{timestamp}.json"
 
         filepath = self.config.output_dir / filename
+        if compress:
+            filepath = filepath.with_name(f"{filepath.name}.gz")
 
         try:
             self.logger.info(f"데이터 저장 중: {filepath}")
-            # Pydantic 모델을 dict로 변환
-            data_dict = [item.model_dump(mode="json") for item in data]
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data_dict, f, ensure_ascii=False, indent=2)
+            # 중간 dict 리스트 없이 pydantic-core에서 바로 UTF-8 JSON 바이트로 직렬화해서 기록
+            payload = REEL_LIST_ADAPTER.dump_json(data, indent=2)
+            if compress:
+                # 레벨 1이면 기본 레벨보다 CPU를 훨씬 덜 쓰고 크기는 대부분 줄어듦
+                payload = gzip.compress(payload, compresslevel=1)
+            filepath.write_bytes(payload)
 
             self.logger.info(f"데이터 저장 완료: {len(data)}개 항목")
             return filepath
@@ -1708,6 +1945,25 @@ class InstagramReelsScraper:
             self.logger.error(f"데이터 저장 실패: {e}")
             raise InstagramScraperError(f"데이터 저장에 실패했습니다: {e}") from e
 
+    def _append_ndjson(self, data: list[ReelData], filepath: Path) -> None:
+        """
+        데이터를 NDJSON 파일 끝에 한 줄에 하나씩 추가 (수집 중 임시 저장용)
+
+        Args:
+            data: 추가할 데이터
+            filepath: NDJSON 파일 경로
+
+        Raises:
+            InstagramScraperError: 저장 실패 시
+        """
+        try:
+            with open(filepath, "ab") as f:
+                f.writelines(REEL_ADAPTER.dump_json(item) + b"\n" for item in data)
+            self.logger.info(f"임시 저장 완료: {len(data)}개 항목 추가 ({filepath.name})")
+        except Exception as e:
+            self.logger.error(f"임시 저장 실패: {e}")
+            raise InstagramScraperError(f"임시 저장에 실패했습니다: {e}") from e
+
     def save_to_csv(self, data: list[ReelData], filename: Optional[str] = None) -> Path:
         """
         데이터를 CSV 파일로 저장
@@ -1723,26 +1979,52 @@ class InstagramReelsScraper:
             InstagramScraperError: 저장 실패 시
         """
         try:
-            import pandas as pd
-
             if filename is None:
-                from datetime import datetime
-
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"reels_data_{timestamp}.csv"
 
             filepath = self.config.output_dir / filename
 
             self.logger.info(f"CSV 저장 중: {filepath}")
-            # Pydantic 모델을 dict로 변환
-            data_dict = [item.model_dump(mode="json") for item in data]
-            df = pd.DataFrame(data_dict)
-            df.to_csv(filepath, index=False, encoding="utf-8-sig")
+            # Pydantic 모델 리스트를 한 번에 dict로 변환
+            rows = REEL_LIST_ADAPTER.dump_python(data, mode="json")
+
+            fieldnames = list(ReelData.model_fields)
+            if pacsv is not None:
+                # pyarrow가 있으면 열 단위 테이블로 만들어 C 구현으로 기록 (엑셀 호환 BOM은 직접 기록)
+                table = pa.table({name: [row[name] for row in rows] for name in fieldnames})
+                with open(filepath, "wb") as f:
+                    f.write(b"\xef\xbb\xbf")
+                    pacsv.write_csv(
+                        table, f, write_options=pacsv.WriteOptions(quoting_style="needed")
+                    )
+            else:
+                # 평평한 필드만 있으므로 pandas 없이 표준 csv 모듈로 기록 (엑셀 호환 BOM 유지)
+                with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+                    writer.writerows(rows)
 
             self.logger.info(f"CSV 저장 완료: {len(data)}개 항목")
             return filepath
-        except ImportError:
-            raise InstagramScraperError("CSV 저장을 위해 pandas가 필요합니다.")
         except Exception as e:
             self.logger.error(f"CSV 저장 실패: {e}")
-            raise InstagramScraperError(f"CSV 저장에 실패했습니다: {e}") from e
\ No newline at end of file
+            raise InstagramScraperError(f"CSV 저장에 실패했습니다: {e}") from e
+
+    def close(self) -> None:
+        """
+        브라우저 종료
+
+        이 스크래퍼의 context/page만 닫습니다. 공유 브라우저 프로세스는 다른 인스턴스가
+        사용 중이면 그대로 유지되므로, 다음 계정/세션은 새 context만 만들면 됩니다.
+        """
+        if "_io_pool" in self.__dict__:
+            # 남은 디버그 파일 기록은 백그라운드에서 마저 끝나도록 기다리지 않음
+            self.__dict__.pop("_io_pool").shutdown(wait=False)
+        if self._browser_started:
+            self.browser.close()
+            del self.__dict__["browser"]
+            self._locator_cache.clear()
+            self._navigation_hooked.clear()
+            self._reel_cache.clear()
+            self.logger.info("브라우저 종료 완료")
@@ -3,23 +3,268 @@
 숏트렌드 사이트에서 릴스 데이터를 수집하는 클래스
 """
 
+import gzip
 import re
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from .browser import BrowserManager
 from .config import ScrapingConfig
 from .exceptions import InstagramScraperError, LoginError, ScrapingError
-from .models import ShortrendReelData
+from .models import SHORTREND_ADAPTER, SHORTREND_LIST_ADAPTER, ShortrendReelData
 from .utils.human_behavior import random_delay, simulate_page_interaction
 from .utils.logger import get_logger
 from .utils.wait_utils import safe_fill_input, wait_for_element
 
 
+# 릴스 카드 컨테이너 셀렉터 (우선순위 순)
+REEL_CONTAINER_SELECTORS = (
+    "div.relative > div.bg-white.rounded-xl",
+    "div.bg-white.rounded-xl.shadow-md",
+    "div.relative",
+)
+
+# 숫자 텍스트 파싱 ("208.6만", "3.2천", "1234")
+_NUMBER_RE = re.compile(r"([\d.]+)")
+_NUMBER_UNITS = {"만": 10000, "천": 1000}
+
+# 셀렉터 순서대로 셀렉터당 최대 5개 요소를 확인하여 처음 보이는 요소를 클릭
+# (클릭 후 상태 변화를 확인할 수 있도록 클릭한 요소에 data-scraper-clicked 표시)
+_CLICK_FIRST_VISIBLE_JS = """
+(selectors) => {
+    for (const selector of selectors) {
+        for (const el of Array.from(document.querySelectorAll(selector)).slice(0, 5)) {
+            if (el.getClientRects().length > 0) {
+                el.setAttribute('data-scraper-clicked', '1');
+                el.click();
+                return true;
+            }
+        }
+    }
+    return false;
+}
+"""
+
+# 마지막 카드를 화면 아래쪽에 맞춰 다음 카드 로딩을 유도 (카드가 없으면 문서 끝으로 스크롤)
+_SCROLL_TO_LAST_CARD_JS = """
+(selector) => {
+    const cards = document.querySelectorAll(selector);
+    if (cards.length) cards[cards.length - 1].scrollIntoView({ block: 'end' });
+    else window.scrollTo(0, document.body.scrollHeight);
+}
+"""
+
+# 날짜 입력 필드(#date)에 설정한 값이 유지되고 있으면 true (필드가 없으면 기다리지 않음)
+_DATE_VALUE_SET_JS = """
+(value) => {
+    const el = document.querySelector('#date');
+    return !el || el.value === value;
+}
+"""
+
+# 클릭한 토글이 다시 그려졌거나 꺼진 상태 클래스(bg-gray-200)가 빠졌으면 true
+_CLICKED_TOGGLE_CHANGED_JS = """
+() => {
+    const el = document.querySelector('[data-scraper-clicked]');
+    return !el || !(el.className || '').includes('bg-gray-200');
+}
+"""
+
+# 카드 하나에서 모든 필드를 한 번에 추출 (썸네일이 없으면 null)
+# seen에 있는 썸네일이면 나머지 필드는 읽지 않고 { thumbnail_url, duplicate: true }만 반환
+_EXTRACT_CARD_JS = """
+(card, seen) => {
+    // 화면 밖에서 내용이 내려간(높이 0) 카드는 썸네일도 없으므로 하위 요소를 찾지 않고 종료
+    if (card.getBoundingClientRect().height === 0) return null;
+
+    const data = {};
+
+    // 썸네일 이미지 URL (여러 방법 시도)
+    let thumbnail = null;
+
+    // 방법 1: data-image-url 속성 (가장 확실)
+    const container = card.querySelector('div[data-image-url]');
+    if (container) {
+        thumbnail = container.getAttribute('data-image-url');
+    }
+
+    // 방법 2: img[alt="릴스 썸네일"]
+    if (!thumbnail) {
+        const img = card.querySelector('img[alt="릴스 썸네일"]');
+        if (img && img.src) {
+            thumbnail = img.src;
+        }
+    }
+
+    // 방법 3: img 태그에서 cdninstagram 포함된 것
+    if (!thumbnail) {
+        const imgs = card.querySelectorAll('img[src*="cdninstagram"]');
+        for (let img of imgs) {
+            if (img.src && img.src.includes('cdninstagram')) {
+                thumbnail = img.src;
+                break;
+            }
+        }
+    }
+
+    // 썸네일이 없으면 null 반환
+    if (!thumbnail) return null;
+    if (seen && seen.has(thumbnail)) return { thumbnail_url: thumbnail, duplicate: true };
+
+    data.thumbnail_url = thumbnail;
+
+    // 랭킹/날짜/증가율/영상 길이 배지: 카드의 div를 한 번만 훑으면서 각각 처음 맞는 요소를 기록
+    // (날짜/영상 길이는 bg-black 배지 중에서만 찾고, 넷 다 찾으면 바로 멈춤)
+    let rankBadge = null;
+    let dateElem = null;
+    let growthBadge = null;
+    let durationElem = null;
+    for (const d of card.querySelectorAll('div')) {
+        const t = d.textContent;
+        if (!t) continue;
+        if (!rankBadge && t.includes('TOP')) rankBadge = d;
+        if (!growthBadge && t.includes('+') && t.includes('%')) growthBadge = d;
+        if ((d.className || '').includes('bg-black')) {
+            if (!dateElem && t.includes('월')) dateElem = d;
+            if (!durationElem && t.includes(':')) durationElem = d;
+        }
+        if (rankBadge && dateElem && growthBadge && durationElem) break;
+    }
+
+    // 랭킹 정보
+    if (rankBadge) {
+        data.rank = rankBadge.textContent.trim();
+        const rankMatch = data.rank.match(/TOP\\s*(\\d+)/);
+        if (rankMatch) {
+            data.rank_number = parseInt(rankMatch[1]);
+        }
+    }
+
+    // 날짜
+    if (dateElem) {
+        data.date = dateElem.textContent.trim();
+    }
+
+    // 증가율
+    if (growthBadge) {
+        data.growth_rate = growthBadge.textContent.trim();
+    }
+
+    // "208.6만", "32.3천", "1234" 같은 숫자 텍스트를 정수로 변환
+    // (32.3 * 1000 = 32299.999...처럼 소수 곱셈 오차가 있으므로 단위가 있으면 반올림)
+    const parseCount = (t) => {
+        const num = parseFloat(t.replace(/[^\\d.]/g, '')) || 0;
+        if (t.includes('만')) return Math.round(num * 10000);
+        if (t.includes('천')) return Math.round(num * 1000);
+        return Math.floor(num);
+    };
+
+    // 통계 정보 (조회수, 좋아요, 댓글)
+    const stats = Array.from(
+        card.querySelectorAll('div.flex.flex-col.items-center')
+    );
+    stats.slice(0, 3).forEach((stat, i) => {
+        const mainSpan = stat.querySelector('span.text-xs.font-medium');
+        if (mainSpan) {
+            const keys = ['views', 'likes', 'comments'];
+            data[keys[i]] = parseCount(mainSpan.textContent.trim());
+
+            // 변화율 (모든 span에서 찾기)
+            const allSpans = Array.from(stat.querySelectorAll('span'));
+            allSpans.forEach((span, idx) => {
+                const text = span.textContent.trim();
+                if (text === '일' || text === '주') {
+                    const nextSpan = allSpans[idx + 1];
+                    if (nextSpan) {
+                        const changeText = nextSpan.textContent.trim();
+                        const dailyKeys = [
+                            'views_daily_change',
+                            'likes_daily_change',
+                            'comments_daily_change',
+                        ];
+                        const weeklyKeys = [
+                            'views_weekly_change',
+                            'likes_weekly_change',
+                            'comments_weekly_change',
+                        ];
+                        if (text === '일') {
+                            data[dailyKeys[i]] = changeText;
+                        } else if (text === '주') {
+                            data[weeklyKeys[i]] = changeText;
+                        }
+                    }
+                }
+            });
+        }
+    });
+
+    // 작성자 정보
+    const usernameSpan = Array.from(
+        card.querySelectorAll('span.text-sm.font-medium')
+    ).find(s => s.textContent && s.textContent.includes('@'));
+    if (usernameSpan) {
+        data.author_username = usernameSpan.textContent.trim();
+    }
+
+    const displayNameSpan = card.querySelector(
+        'span.text-xs.text-gray-500'
+    );
+    if (displayNameSpan) {
+        data.author_display_name = displayNameSpan.textContent.trim();
+    }
+
+    const followersSpan = Array.from(
+        card.querySelectorAll('span.bg-gray-100')
+    ).find(s => s.textContent && s.textContent.includes('만'));
+    if (followersSpan) {
+        data.author_followers = parseCount(followersSpan.textContent.trim());
+    }
+
+    // 제목/캡션
+    const titleElem = card.querySelector('p.text-sm.font-bold.line-clamp-2');
+    if (titleElem) {
+        data.title = titleElem.textContent.trim();
+    }
+
+    // 영상 길이
+    if (durationElem) {
+        data.duration = durationElem.textContent.trim();
+    }
+
+    // Instagram 링크
+    const instagramLink = card.querySelector('a[href*="instagram.com"]');
+    if (instagramLink) {
+        data.instagram_link = instagramLink.getAttribute('href');
+    }
+
+    return data;
+}
+"""
+
+# 페이지의 카드를 evaluate 한 번으로 추출 (카드마다 element_handle/evaluate 왕복 없음)
+# 이미 처리한 앞쪽 카드(start 이전)는 건너뛰고, 전체 카드 수(count)와 새 카드만 반환
+# seen(이미 수집한 썸네일 목록)을 넘기면 해당 카드는 필드 추출 없이 중복 표시만 함
+_EXTRACT_CARDS_JS = """
+({ selector, start, seen }) => {
+    const extract = %s;
+    const skip = new Set(seen || []);
+    const cards = Array.from(document.querySelectorAll(selector));
+    return { count: cards.length, cards: cards.slice(start).map((card) => extract(card, skip)) };
+}
+""" % _EXTRACT_CARD_JS.strip()
+
+# 추출 스크립트를 init script로 한 번만 설치해 window.__extractShortrendCards로 노출
+# (설치 전에 열린 문서라면 함수가 없으므로 null을 돌려주고 전체 스크립트로 다시 추출)
+_EXTRACT_CARDS_INIT_JS = "window.__extractShortrendCards = %s;" % _EXTRACT_CARDS_JS.strip()
+_CALL_EXTRACT_CARDS_JS = (
+    "args => (window.__extractShortrendCards ? window.__extractShortrendCards(args) : null)"
+)
+
+
 class ShortrendScraper:
     """
     숏트렌드 사이트를 스크래핑하는 클래스
@@ -44,6 +289,7 @@ class ShortrendScraper:
         self.email = email or self.config.shortrend_email
         self.password = password or self.config.shortrend_password
         self.browser_manager: Optional[BrowserManager] = None
+        self._reel_selector: Optional[str] = None  # 찾은 릴스 카드 컨테이너 셀렉터
         self.logger = get_logger(self.__class__.__name__)
 
         # 출력 디렉토리 생성
@@ -78,6 +324,8 @@ class ShortrendScraper:
             if self.browser_manager is None:
                 self.browser_manager = BrowserManager(self.config)
                 self.browser_manager.start()
+                # 다음 네비게이션부터 모든 문서에 카드 추출 함수가 미리 정의됨
+                self.browser_manager.context.add_init_script(_EXTRACT_CARDS_INIT_JS)
 
             page = self.browser_manager.get_page()
 
@@ -89,12 +337,6 @@ class ShortrendScraper:
                 timeout=30000,
             )
 
-            # 페이지가 완전히 로드될 때까지 대기
-            try:
-                page.wait_for_load_state("domcontentloaded", timeout=10000)
-            except Exception:
-                self.logger.debug("페이지 로드 대기 실패 (계속 진행)")
-
             random_delay(1.0, 2.0)  # 사용자처럼 랜덤 대기
 
             # 페이지 상호작용 시뮬레이션 (봇 감지 우회)
@@ -109,9 +351,6 @@ class ShortrendScraper:
             except Exception as e:
                 self.logger.warning(f"로그인 폼 대기 실패, 계속 진행: {e}")
 
-            # 추가 안정화 대기
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(1000)
 
             # 디버깅: 페이지 HTML 저장 및 스크린샷 저장
             self.logger.info("=" * 60)
@@ -119,20 +358,19 @@ class ShortrendScraper:
             self.logger.info("=" * 60)
             self.logger.info("현재 페이지 URL: " + page.url)
 
-            # 페이지 HTML 저장 (디버깅용)
-            html_content = page.content()
-            debug_dir = self.config.output_dir / "debug"
-            debug_dir.mkdir(parents=True, exist_ok=True)
+            # 페이지 HTML/스크린샷 저장 (디버깅용, 설정한 경우에만)
+            if self.config.save_debug_artifacts:
+                debug_dir = self.config.output_dir / "debug"
+                debug_dir.mkdir(parents=True, exist_ok=True)
 
-            html_file = debug_dir / "shortrend_login_page.html"
-            with open(html_file, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            self.logger.info(f"페이지 HTML 저장: {html_file}")
+                html_file = debug_dir / "shortrend_login_page.html"
+                html_file.write_text(page.content(), encoding="utf-8")
+                self.logger.info(f"페이지 HTML 저장: {html_file}")
 
-            # 스크린샷 저장
-            screenshot_file = debug_dir / "shortrend_login_page.png"
-            page.screenshot(path=str(screenshot_file), full_page=True)
-            self.logger.info(f"스크린샷 저장: {screenshot_file}")
+                # 스크린샷 저장 (전체 페이지 캡처는 레이아웃을 여러 번 계산하므로 뷰포트만)
+                screenshot_file = debug_dir / "shortrend_login_page.png"
+                page.screenshot(path=str(screenshot_file))
+                self.logger.info(f"스크린샷 저장: {screenshot_file}")
 
             self.logger.info("입력 필드와 로그인 버튼을 찾는 중...")
 
@@ -192,8 +430,8 @@ class ShortrendScraper:
             # 버튼이 활성화될 때까지 대기
             self.logger.info("로그인 버튼 활성화 대기 중...")
             try:
+                # 클릭 자체가 버튼이 안정되고 활성화될 때까지 기다리므로 추가 고정 대기는 하지 않음
                 login_button.wait_for(state="attached", timeout=3000)
-                page.wait_for_timeout(500)  # 추가 안정화 대기
             except Exception:
                 pass  # 대기 실패해도 계속 진행
 
@@ -212,9 +450,20 @@ class ShortrendScraper:
                 login_button.click(force=True)
                 self.logger.info("강제 클릭 완료")
 
-            # 로그인 처리 대기
-            self.logger.info("로그인 처리 대기 중... (5초)")
-            time.sleep(5)  # Python의 time.sleep 사용
+            # 로그인 처리 대기 (로그인 페이지를 벗어나는 즉시 진행, 최대 10초)
+            self.logger.info("로그인 처리 대기 중...")
+            try:
+                page.wait_for_url(
+                    lambda url: "login" not in url, wait_until="domcontentloaded", timeout=10000
+                )
+            except PlaywrightTimeoutError:
+                pass  # 아래에서 현재 URL로 결과를 판단
+
+            # 로그인 후 페이지의 요청이 잦아들 때까지 한 번만 대기 (이후 필터 설정/수집은 바로 진행)
+            try:
+                page.wait_for_load_state("networkidle", timeout=15000)
+            except PlaywrightTimeoutError:
+                self.logger.debug("네트워크 안정화 대기 시간 초과 (계속 진행)")
 
             # 로그인 결과 확인
             try:
@@ -256,8 +505,7 @@ class ShortrendScraper:
             page: Playwright Page 객체
         """
         try:
-            # 페이지가 완전히 로드될 때까지 대기
-            page.wait_for_load_state("domcontentloaded", timeout=10000)
+            # 로그인 직후 networkidle까지 기다렸으므로 로드 상태는 다시 확인하지 않음
             random_delay(1.0, 2.0)
 
             # 1. 날짜를 오늘 날짜로 설정
@@ -290,7 +538,11 @@ class ShortrendScraper:
                     """
                 )
                 self.logger.info(f"날짜 설정 완료: {today}")
-                page.wait_for_timeout(500)
+                # 페이지가 값을 되돌리지 않고 반영했는지 확인 (반영되는 즉시 진행, 최대 2초)
+                try:
+                    page.wait_for_function(_DATE_VALUE_SET_JS, arg=today, timeout=2000)
+                except PlaywrightTimeoutError:
+                    self.logger.debug("날짜 값 반영 대기 시간 초과 (계속 진행)")
             else:
                 self.logger.warning("날짜 입력 필드를 찾을 수 없습니다.")
 
@@ -303,28 +555,16 @@ class ShortrendScraper:
                 'div[class*="bg-gray-200"]',  # 클래스에 bg-gray-200가 포함된 경우
             ]
 
-            # 토글 컨테이너 찾기 (부모 요소에서 찾기)
-            toggle_found = False
-            for selector in toggle_selectors:
+            # 보이는 토글 중 첫 번째를 페이지 안에서 바로 클릭 (요소별 is_visible 왕복 없음)
+            toggle_found = page.evaluate(_CLICK_FIRST_VISIBLE_JS, toggle_selectors)
+            if toggle_found:
+                self.logger.info("새 영상만 보기 토글 활성화 완료")
+                # 클릭한 토글이 꺼진 상태(bg-gray-200)에서 바뀌는 즉시 진행 (최대 2초)
                 try:
-                    toggles = page.locator(selector).all()
-                    for toggle in toggles[:5]:  # 최대 5개까지만 확인
-                        try:
-                            if toggle.is_visible(timeout=1000):
-                                # 토글 클릭
-                                toggle.click()
-                                self.logger.info("새 영상만 보기 토글 활성화 완료")
-                                toggle_found = True
-                                page.wait_for_timeout(500)
-                                break
-                        except Exception:
-                            continue
-                    if toggle_found:
-                        break
-                except Exception:
-                    continue
-
-            if not toggle_found:
+                    page.wait_for_function(_CLICKED_TOGGLE_CHANGED_JS, timeout=2000)
+                except PlaywrightTimeoutError:
+                    self.logger.debug("토글 상태 변경 대기 시간 초과 (계속 진행)")
+            else:
                 self.logger.warning("새 영상만 보기 토글을 찾을 수 없습니다.")
 
             random_delay(0.5, 1.0)
@@ -348,17 +588,15 @@ class ShortrendScraper:
         self.logger.info("=" * 60)
 
         try:
-            # 사용자가 종료할 때까지 대기
-            while True:
-                time.sleep(1)
-                # 브라우저가 닫혔는지 확인
-                try:
-                    page = self.browser_manager.get_page()
-                    # 페이지가 여전히 유효한지 확인
-                    _ = page.url  # B018: 변수에 할당하여 사용
-                except Exception:
-                    self.logger.info("브라우저가 닫혔습니다.")
-                    break
+            # 사용자가 페이지(또는 브라우저)를 닫을 때까지 폴링 없이 close 이벤트를 대기
+            # (브라우저 연결이 끊겨도 페이지 close 이벤트가 발생함)
+            try:
+                page = self.browser_manager.get_page()
+                if not page.is_closed():
+                    page.wait_for_event("close", timeout=0)
+            except Exception as e:
+                self.logger.debug(f"페이지 종료 대기 중단: {e}")
+            self.logger.info("브라우저가 닫혔습니다.")
         except KeyboardInterrupt:
             self.logger.info("사용자에 의해 중단되었습니다.")
 
@@ -377,36 +615,20 @@ class ShortrendScraper:
 
         text = text.strip().replace(",", "").replace(" ", "")
 
-        # 만 단위 처리
-        if "만" in text:
-            match = re.search(r"([\d.]+)", text)
-            if match:
-                try:
-                    num = float(match.group(1))
-                    return int(num * 10000)
-                except ValueError:
-                    pass
-
-        # 천 단위 처리
-        elif "천" in text:
-            match = re.search(r"([\d.]+)", text)
-            if match:
-                try:
-                    num = float(match.group(1))
-                    return int(num * 1000)
-                except ValueError:
-                    pass
-
-        # 일반 숫자
-        else:
-            match = re.search(r"([\d.]+)", text)
-            if match:
-                try:
-                    return int(float(match.group(1)))
-                except ValueError:
-                    pass
+        match = _NUMBER_RE.search(text)
+        if not match:
+            return None
+        try:
+            num = float(match.group(1))
+        except ValueError:
+            return None
 
-        return None
+        # 만/천 단위 처리 (단위가 없으면 일반 숫자)
+        # (32.3 * 1000 = 32299.999...처럼 소수 곱셈 오차가 있으므로 단위가 있으면 반올림)
+        for unit, multiplier in _NUMBER_UNITS.items():
+            if unit in text:
+                return round(num * multiplier)
+        return int(num)
 
     def _extract_reel_data(self, reel_card) -> Optional[ShortrendReelData]:
         """
@@ -425,222 +647,61 @@ class ShortrendScraper:
             if not element_handle:
                 return None
 
-            extracted_data = element_handle.evaluate("""
-                (card) => {
-                    const data = {};
-
-                    // 썸네일 이미지 URL (여러 방법 시도)
-                    let thumbnail = null;
-
-                    // 방법 1: data-image-url 속성 (가장 확실)
-                    const container = card.querySelector('div[data-image-url]');
-                    if (container) {
-                        thumbnail = container.getAttribute('data-image-url');
-                    }
-
-                    // 방법 2: img[alt="릴스 썸네일"]
-                    if (!thumbnail) {
-                        const img = card.querySelector('img[alt="릴스 썸네일"]');
-                        if (img && img.src) {
-                            thumbnail = img.src;
-                        }
-                    }
-
-                    // 방법 3: img 태그에서 cdninstagram 포함된 것
-                    if (!thumbnail) {
-                        const imgs = card.querySelectorAll('img[src*="cdninstagram"]');
-                        for (let img of imgs) {
-                            if (img.src && img.src.includes('cdninstagram')) {
-                                thumbnail = img.src;
-                                break;
-                            }
-                        }
-                    }
-
-                    // 썸네일이 없으면 null 반환
-                    if (!thumbnail) return null;
-
-                    data.thumbnail_url = thumbnail;
-
-                    // 랭킹 정보
-                    const rankBadge = Array.from(card.querySelectorAll('div'))
-                        .find(d => d.textContent && d.textContent.includes('TOP'));
-                    if (rankBadge) {
-                        data.rank = rankBadge.textContent.trim();
-                        const rankMatch = data.rank.match(/TOP\\s*(\\d+)/);
-                        if (rankMatch) {
-                            data.rank_number = parseInt(rankMatch[1]);
-                        }
-                    }
-
-                    // 날짜
-                    const dateElem = Array.from(card.querySelectorAll('div')).find(d => {
-                        const classes = d.className || '';
-                        return (
-                            classes.includes('bg-black') &&
-                            d.textContent &&
-                            d.textContent.includes('월')
-                        );
-                    });
-                    if (dateElem) {
-                        data.date = dateElem.textContent.trim();
-                    }
-
-                    // 증가율
-                    const growthBadge = Array.from(card.querySelectorAll('div')).find(
-                        d =>
-                            d.textContent &&
-                            d.textContent.includes('+') &&
-                            d.textContent.includes('%')
-                    );
-                    if (growthBadge) {
-                        data.growth_rate = growthBadge.textContent.trim();
-                    }
-
-                    // 통계 정보 (조회수, 좋아요, 댓글)
-                    const stats = Array.from(
-                        card.querySelectorAll('div.flex.flex-col.items-center')
-                    );
-                    stats.slice(0, 3).forEach((stat, i) => {
-                        const mainSpan = stat.querySelector('span.text-xs.font-medium');
-                        if (mainSpan) {
-                            const mainText = mainSpan.textContent.trim();
-                            const mainNum =
-                                parseFloat(mainText.replace(/[^\\d.]/g, '')) || 0;
-                            const keys = ['views', 'likes', 'comments'];
-                            if (mainText.includes('만')) {
-                                data[keys[i]] = Math.floor(mainNum * 10000);
-                            } else if (mainText.includes('천')) {
-                                data[keys[i]] = Math.floor(mainNum * 1000);
-                            } else {
-                                data[keys[i]] = Math.floor(mainNum);
-                            }
-
-                            // 변화율 (모든 span에서 찾기)
-                            const allSpans = Array.from(stat.querySelectorAll('span'));
-                            allSpans.forEach((span, idx) => {
-                                const text = span.textContent.trim();
-                                if (text === '일' || text === '주') {
-                                    const nextSpan = allSpans[idx + 1];
-                                    if (nextSpan) {
-                                        const changeText = nextSpan.textContent.trim();
-                                        const dailyKeys = [
-                                            'views_daily_change',
-                                            'likes_daily_change',
-                                            'comments_daily_change',
-                                        ];
-                                        const weeklyKeys = [
-                                            'views_weekly_change',
-                                            'likes_weekly_change',
-                                            'comments_weekly_change',
-                                        ];
-                                        if (text === '일') {
-                                            data[dailyKeys[i]] = changeText;
-                                        } else if (text === '주') {
-                                            data[weeklyKeys[i]] = changeText;
-                                        }
-                                    }
-                                }
-                            });
-                        }
-                    });
-
-                    // 작성자 정보
-                    const usernameSpan = Array.from(
-                        card.querySelectorAll('span.text-sm.font-medium')
-                    ).find(s => s.textContent && s.textContent.includes('@'));
-                    if (usernameSpan) {
-                        data.author_username = usernameSpan.textContent.trim();
-                    }
-
-                    const displayNameSpan = card.querySelector(
-                        'span.text-xs.text-gray-500'
-                    );
-                    if (displayNameSpan) {
-                        data.author_display_name = displayNameSpan.textContent.trim();
-                    }
+            try:
+                return self._to_reel_data(element_handle.evaluate(_EXTRACT_CARD_JS))
+            finally:
+                # 핸들을 쥐고 있으면 브라우저가 DOM 참조를 놓지 못하므로 바로 해제
+                element_handle.dispose()
 
-                    const followersSpan = Array.from(
-                        card.querySelectorAll('span.bg-gray-100')
-                    ).find(s => s.textContent && s.textContent.includes('만'));
-                    if (followersSpan) {
-                        const followersText = followersSpan.textContent.trim();
-                        const followersNum = parseFloat(followersText.replace(/[^\\d.]/g, '')) || 0;
-                        if (followersText.includes('만')) {
-                            data.author_followers = Math.floor(followersNum * 10000);
-                        } else if (followersText.includes('천')) {
-                            data.author_followers = Math.floor(followersNum * 1000);
-                        } else {
-                            data.author_followers = Math.floor(followersNum);
-                        }
-                    }
+        except Exception as e:
+            self.logger.debug(f"릴스 데이터 추출 실패: {e}")
+            return None
 
-                    // 제목/캡션
-                    const titleElem = card.querySelector('p.text-sm.font-bold.line-clamp-2');
-                    if (titleElem) {
-                        data.title = titleElem.textContent.trim();
-                    }
+    def _to_reel_data(self, extracted_data: Optional[dict]) -> Optional[ShortrendReelData]:
+        """
+        _EXTRACT_CARD_JS가 추출한 카드 데이터를 모델로 변환
 
-                    // 영상 길이
-                    const durationElem = Array.from(card.querySelectorAll('div')).find(d => {
-                        const classes = d.className || '';
-                        return (
-                            classes.includes('bg-black') &&
-                            d.textContent &&
-                            d.textContent.includes(':')
-                        );
-                    });
-                    if (durationElem) {
-                        data.duration = durationElem.textContent.trim();
-                    }
+        Args:
+            extracted_data: 카드 하나의 추출 결과 (썸네일이 없으면 None)
 
-                    // Instagram 링크
-                    const instagramLink = card.querySelector('a[href*="instagram.com"]');
-                    if (instagramLink) {
-                        data.instagram_link = instagramLink.getAttribute('href');
-                    }
+        Returns:
+            릴스 데이터, 썸네일이 없거나 변환에 실패하면 None
+        """
+        if not extracted_data or not extracted_data.get('thumbnail_url'):
+            return None
 
-                    return data;
-                }
-            """)
+        try:
+            # _EXTRACT_CARD_JS는 모델 필드 이름 그대로 값이 있는 키만 채우므로 그대로 전달
+            return ShortrendReelData(**extracted_data)
+        except Exception as e:
+            self.logger.debug(f"릴스 데이터 변환 실패: {e}")
+            return None
 
-            if not extracted_data or not extracted_data.get('thumbnail_url'):
-                return None
+    def _extract_cards(self, page: Page, args: dict) -> dict:
+        """
+        페이지의 릴스 카드를 evaluate 한 번으로 추출
 
-            # JavaScript에서 추출한 데이터를 모델로 변환
-            data = ShortrendReelData(
-                thumbnail_url=extracted_data.get('thumbnail_url'),
-                rank=extracted_data.get('rank'),
-                rank_number=extracted_data.get('rank_number'),
-                date=extracted_data.get('date'),
-                growth_rate=extracted_data.get('growth_rate'),
-                views=extracted_data.get('views'),
-                views_daily_change=extracted_data.get('views_daily_change'),
-                views_weekly_change=extracted_data.get('views_weekly_change'),
-                likes=extracted_data.get('likes'),
-                likes_daily_change=extracted_data.get('likes_daily_change'),
-                likes_weekly_change=extracted_data.get('likes_weekly_change'),
-                comments=extracted_data.get('comments'),
-                comments_daily_change=extracted_data.get('comments_daily_change'),
-                comments_weekly_change=extracted_data.get('comments_weekly_change'),
-                author_username=extracted_data.get('author_username'),
-                author_display_name=extracted_data.get('author_display_name'),
-                author_followers=extracted_data.get('author_followers'),
-                title=extracted_data.get('title'),
-                duration=extracted_data.get('duration'),
-                instagram_link=extracted_data.get('instagram_link'),
-            )
+        init script로 설치한 함수가 있으면 짧은 호출만 보내고, 없으면 전체 스크립트를 보낸다.
 
-            return data
+        Args:
+            page: Playwright Page 객체
+            args: _EXTRACT_CARDS_JS 인자 (selector, start, seen)
 
-        except Exception as e:
-            self.logger.debug(f"릴스 데이터 추출 실패: {e}")
-            return None
+        Returns:
+            {"count": 전체 카드 수, "cards": 새 카드 추출 결과 리스트}
+        """
+        result = page.evaluate(_CALL_EXTRACT_CARDS_JS, args)
+        if result is None:
+            result = page.evaluate(_EXTRACT_CARDS_JS, args)
+        return result
 
     def collect_reels(self, max_count: int = 100) -> list[ShortrendReelData]:
         """
         무한 스크롤로 릴스 수집
 
+        스크롤할 때마다 새로 수집한 릴스를 output_dir의 NDJSON 파일에 이어 써서,
+        수집이 중간에 끊겨도 그때까지의 결과가 남는다.
+
         Args:
             max_count: 최대 수집 개수 (기본: 100)
 
@@ -657,42 +718,48 @@ class ShortrendScraper:
             page = self.browser_manager.get_page()
             self.logger.info(f"릴스 수집 시작 (최대 {max_count}개)...")
 
-            # 페이지 로딩 대기
-            page.wait_for_load_state("domcontentloaded", timeout=10000)
             random_delay(1.0, 2.0)
 
             collected_reels: list[ShortrendReelData] = []
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            ndjson_path = self.config.output_dir / f"shortrend_reels_{timestamp}.ndjson"
+            saved_count = 0  # NDJSON에 기록한 릴스 수
             collected_thumbnails: set[str] = set()  # 중복 체크용
 
-            # 릴스 카드 컨테이너 찾기 (여러 셀렉터 시도)
-            reel_container_selectors = [
-                'div.relative > div.bg-white.rounded-xl',
-                'div.bg-white.rounded-xl.shadow-md',
-                'div.relative',
-            ]
-
-            reel_cards = []
-            for selector in reel_container_selectors:
-                try:
-                    cards = page.locator(selector).all()
-                    if len(cards) > 0:
-                        reel_cards = cards
-                        self.logger.info(f"릴스 카드 컨테이너 찾음: {selector} ({len(cards)}개)")
+            # 릴스 카드 컨테이너 찾기 (처음 한 번만 셀렉터를 차례로 확인하고 결과를 재사용)
+            if self._reel_selector is None:
+                for selector in REEL_CONTAINER_SELECTORS:
+                    try:
+                        count = page.locator(selector).count()
+                    except Exception:
+                        continue
+                    if count > 0:
+                        self._reel_selector = selector
+                        self.logger.info(f"릴스 카드 컨테이너 찾음: {selector} ({count}개)")
                         break
-                except Exception:
-                    continue
 
-            if not reel_cards:
+            if self._reel_selector is None:
                 raise ScrapingError("릴스 카드 컨테이너를 찾을 수 없습니다.")
+            reel_selector = self._reel_selector
 
             last_count = 0
             no_change_count = 0
             max_no_change = 5  # 5번 연속 변화 없으면 종료
+            processed = 0  # 이미 추출한 카드 수 (스크롤로 새로 붙은 카드만 추출)
 
             while len(collected_reels) < max_count:
-                # 현재 보이는 릴스 카드 수 확인
-                reel_cards = page.locator(reel_container_selectors[0]).all()
-                current_count = len(reel_cards)
+                # 새로 로드된 카드만 한 번에 추출 (카드 수 확인도 같은 결과로 처리)
+                result = self._extract_cards(page, {"selector": reel_selector, "start": processed})
+                current_count = result["count"]
+                if current_count < processed:
+                    # 목록이 다시 그려져 카드가 줄었으면 처음부터 다시 추출
+                    # (이미 수집한 썸네일을 넘겨 브라우저 쪽에서 중복 카드의 필드 추출을 건너뜀)
+                    processed = 0
+                    seen = list(collected_thumbnails)
+                    result = self._extract_cards(
+                        page, {"selector": reel_selector, "start": 0, "seen": seen}
+                    )
+                    current_count = result["count"]
 
                 self.logger.info(
                     f"현재 로드된 릴스: {current_count}개, "
@@ -710,11 +777,15 @@ class ShortrendScraper:
 
                 last_count = current_count
 
-                # 각 릴스 카드에서 데이터 추출
-                for i, reel_card in enumerate(reel_cards):
+                # 새 릴스 카드 데이터를 모델로 변환 (i는 페이지 전체 기준 카드 순번)
+                for i, extracted_data in enumerate(result["cards"], start=processed):
                     try:
-                        # 데이터 추출
-                        reel_data = self._extract_reel_data(reel_card)
+                        if extracted_data and extracted_data.get("duplicate"):
+                            thumb_preview = extracted_data["thumbnail_url"][:50]
+                            self.logger.debug(f"중복 릴스 건너뜀: {thumb_preview}...")
+                            continue
+
+                        reel_data = self._to_reel_data(extracted_data)
 
                         if reel_data and reel_data.thumbnail_url:
                             # 중복 체크
@@ -742,15 +813,19 @@ class ShortrendScraper:
                                 )
                                 self.logger.debug(f"중복 릴스 건너뜀: {thumb_preview}...")
                         else:
-                            # 디버깅: 첫 번째 카드의 HTML 저장
-                            if i == 0 and len(collected_reels) == 0:
+                            # 디버깅: 첫 번째 카드의 HTML 저장 (설정한 경우에만)
+                            if (
+                                i == 0
+                                and len(collected_reels) == 0
+                                and self.config.save_debug_artifacts
+                            ):
                                 try:
-                                    html = reel_card.inner_html()
+                                    card = page.locator(reel_selector).nth(i)
+                                    html = card.inner_html()
                                     debug_dir = self.config.output_dir / "debug"
                                     debug_dir.mkdir(parents=True, exist_ok=True)
                                     debug_file = debug_dir / "reel_card_sample.html"
-                                    with open(debug_file, "w", encoding="utf-8") as f:
-                                        f.write(html)
+                                    debug_file.write_text(html, encoding="utf-8")
                                     self.logger.warning(
                                         f"릴스 {i} 데이터 추출 실패 (썸네일 없음). "
                                         f"샘플 HTML 저장: {debug_file}"
@@ -764,16 +839,31 @@ class ShortrendScraper:
                         self.logger.warning(f"릴스 {i} 추출 중 오류: {e}")
                         continue
 
+                processed = current_count
+
+                # 이번 스크롤에서 새로 수집한 릴스만 NDJSON에 이어 씀
+                if len(collected_reels) > saved_count:
+                    self._append_ndjson(collected_reels[saved_count:], ndjson_path)
+                    saved_count = len(collected_reels)
+
                 # 목표 개수에 도달했는지 확인
                 if len(collected_reels) >= max_count:
                     break
 
                 # 스크롤 다운
                 self.logger.info("스크롤 다운 중...")
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                page.evaluate(_SCROLL_TO_LAST_CARD_JS, reel_selector)
 
-                # 새 콘텐츠 로딩 대기 (시간 단축)
-                page.wait_for_timeout(1000)  # 2초 -> 1초로 단축
+                # 새 카드가 붙는 즉시 진행 (최대 2초, 늘지 않으면 위에서 변화 없음으로 집계)
+                try:
+                    page.wait_for_function(
+                        "([sel, n]) => document.querySelectorAll(sel).length > n",
+                        arg=[reel_selector, current_count],
+                        polling=100,
+                        timeout=2000,
+                    )
+                except PlaywrightTimeoutError:
+                    pass
 
             self.logger.info(f"릴스 수집 완료: {len(collected_reels)}개")
             return collected_reels
@@ -782,32 +872,35 @@ class ShortrendScraper:
             self.logger.error(f"릴스 수집 실패: {e}")
             raise ScrapingError(f"릴스 수집에 실패했습니다: {e}") from e
 
-    def save_to_json(self, data: list[ShortrendReelData], filename: Optional[str] = None) -> Path:
+    def save_to_json(
+        self, data: list[ShortrendReelData], filename: Optional[str] = None, compress: bool = False
+    ) -> Path:
         """
         데이터를 JSON 파일로 저장
 
         Args:
             data: 저장할 데이터
             filename: 파일명 (None이면 자동 생성)
+            compress: True이면 gzip으로 압축해서 파일명 뒤에 .gz를 붙여 저장
 
         Returns:
             저장된 파일 경로
         """
-        import json
-
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"shortrend_reels_{timestamp}.json"
 
         filepath = self.config.output_dir / filename
+        if compress:
+            filepath = filepath.with_name(f"{filepath.name}.gz")
 
         try:
             self.logger.info(f"데이터 저장 중: {filepath}")
-            # Pydantic 모델을 dict로 변환
-            data_dict = [item.model_dump(mode="json", exclude_none=True) for item in data]
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data_dict, f, ensure_ascii=False, indent=2)
+            # 중간 dict 리스트 없이 pydantic-core에서 바로 UTF-8 JSON 바이트로 직렬화해서 기록
+            payload = SHORTREND_LIST_ADAPTER.dump_json(data, indent=2, exclude_none=True)
+            if compress:
+                payload = gzip.compress(payload, compresslevel=1)
+            filepath.write_bytes(payload)
 
             self.logger.info(f"데이터 저장 완료: {len(data)}개 항목")
             return filepath
@@ -815,6 +908,27 @@ class ShortrendScraper:
             self.logger.error(f"데이터 저장 실패: {e}")
             raise InstagramScraperError(f"데이터 저장에 실패했습니다: {e}") from e
 
+    def _append_ndjson(self, data: list[ShortrendReelData], filepath: Path) -> None:
+        """
+        데이터를 NDJSON 파일 끝에 한 줄에 하나씩 추가 (수집 중 저장용)
+
+        Args:
+            data: 추가할 데이터
+            filepath: NDJSON 파일 경로
+
+        Raises:
+            InstagramScraperError: 저장 실패 시
+        """
+        try:
+            with open(filepath, "ab") as f:
+                f.writelines(
+                    SHORTREND_ADAPTER.dump_json(item, exclude_none=True) + b"\n" for item in data
+                )
+            self.logger.debug(f"임시 저장 완료: {len(data)}개 항목 추가 ({filepath.name})")
+        except Exception as e:
+            self.logger.error(f"임시 저장 실패: {e}")
+            raise InstagramScraperError(f"임시 저장에 실패했습니다: {e}") from e
+
     def close(self) -> None:
         """브라우저 종료"""
         if self.browser_manager:
@@ -2,6 +2,7 @@
 유틸리티 모듈
 """
 
+from .dedup import PersistentKeys, RecentKeys
 from .human_behavior import (
     human_like_click,
     human_like_scroll,
@@ -11,12 +12,21 @@ from .human_behavior import (
     simulate_typing,
 )
 from .logger import get_logger, setup_logger
-from .wait_utils import safe_fill_input, wait_for_element, wait_for_page_load
+from .rate_limit import RateLimiter
+from .wait_utils import (
+    combine_selectors,
+    first_visible_selector,
+    safe_fill_input,
+    wait_for_element,
+    wait_for_page_load,
+)
 
 __all__ = [
     "setup_logger",
     "get_logger",
     "wait_for_element",
+    "combine_selectors",
+    "first_visible_selector",
     "wait_for_page_load",
     "safe_fill_input",
     "random_delay",
@@ -25,4 +35,7 @@ __all__ = [
     "random_mouse_movement",
     "simulate_typing",
     "simulate_page_interaction",
+    "RateLimiter",
+    "RecentKeys",
+    "PersistentKeys",
 ]
@@ -0,0 +1,113 @@
+"""
+중복 체크 유틸리티
+장시간 수집에서도 메모리가 늘어나지 않도록 최근 키만 기억하는 집합과,
+실행이 끝나도 수집한 키를 잊지 않도록 SQLite에 기록하는 집합
+"""
+
+import sqlite3
+from collections import deque
+from pathlib import Path
+
+
+class RecentKeys:
+    """
+    최근 max_size개의 키만 기억하는 집합
+
+    가득 차면 가장 먼저 추가된 키부터 잊는다. 피드에서 한참 전에 본 릴스가 다시 나오는 일은
+    드물기 때문에, 수집 시간이 길어져도 중복 체크 비용과 메모리를 일정하게 유지할 수 있다.
+    """
+
+    def __init__(self, max_size: int = 5000) -> None:
+        """
+        초기화
+
+        Args:
+            max_size: 기억할 최대 키 수
+        """
+        self.max_size = max_size
+        self._keys: set[str] = set()
+        self._order: deque[str] = deque()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str) -> bool:
+        """
+        키 추가
+
+        Args:
+            key: 추가할 키
+
+        Returns:
+            새 키면 True, 이미 있던 키면 False
+        """
+        if key in self._keys:
+            return False
+        if len(self._order) >= self.max_size:
+            self._keys.discard(self._order.popleft())
+        self._order.append(key)
+        self._keys.add(key)
+        return True
+
+
+class PersistentKeys(RecentKeys):
+    """
+    SQLite 파일에 기록되어 다음 실행에서도 유지되는 키 집합
+
+    최근 키는 메모리(RecentKeys)에서 먼저 확인하고, 없을 때만 DB를 조회한다.
+    커밋(fsync)은 commit_every개를 추가할 때마다 한 번씩 몰아서 하고, close()에서 나머지를 기록한다.
+    """
+
+    def __init__(self, path: Path, max_size: int = 5000, commit_every: int = 20) -> None:
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+            max_size: 메모리에 기억할 최근 키 수
+            commit_every: 몇 개를 추가할 때마다 커밋할지
+        """
+        super().__init__(max_size=max_size)
+        self.commit_every = commit_every
+        self._pending = 0
+        self._db = sqlite3.connect(path)
+        self._db.execute("CREATE TABLE IF NOT EXISTS seen(id TEXT PRIMARY KEY)")
+        self._db.commit()
+
+    def __contains__(self, key: object) -> bool:
+        if super().__contains__(key):
+            return True
+        return self._db.execute("SELECT 1 FROM seen WHERE id = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def add(self, key: str) -> bool:
+        """
+        키 추가 (이전 실행에서 기록한 키도 중복으로 판단)
+
+        Args:
+            key: 추가할 키
+
+        Returns:
+            새 키면 True, 이미 있던 키면 False
+        """
+        if not super().add(key):
+            return False
+        try:
+            self._db.execute("INSERT INTO seen VALUES (?)", (key,))
+        except sqlite3.IntegrityError:
+            return False
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self._db.commit()
+            self._pending = 0
+        return True
+
+    def close(self) -> None:
+        """남은 키를 커밋하고 DB 연결 종료"""
+        self._db.commit()
+        self._db.close()
@@ -5,6 +5,7 @@
 
 import random
 import time
+from typing import Optional
 
 from playwright.sync_api import Locator, Page
 
@@ -12,6 +13,20 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# 현재 위치 확인부터 단계별 스크롤까지 브라우저 안에서 한 번에 실행 (단계마다 왕복하지 않음)
+_STEPPED_SCROLL_JS = """
+async ({ amount, steps, minDelay, maxDelay }) => {
+    const start = window.pageYOffset;
+    const target = Math.max(0, start + amount);
+    const dy = (target - start) / steps;
+    for (let i = 1; i <= steps; i++) {
+        window.scrollTo(0, start + dy * i);
+        const delay = minDelay + Math.random() * (maxDelay - minDelay);
+        await new Promise((resolve) => setTimeout(resolve, delay));
+    }
+}
+"""
+
 
 def random_delay(min_seconds: float = 0.5, max_seconds: float = 2.0) -> None:
     """
@@ -41,21 +56,16 @@ def human_like_scroll(
         direction: 스크롤 방향 ("down" 또는 "up")
     """
     try:
-        current_position = page.evaluate("window.pageYOffset")
-
-        if direction == "down":
-            target_position = current_position + scroll_amount
-        else:
-            target_position = max(0, current_position - scroll_amount)
-
-        # 부드러운 스크롤 시뮬레이션
-        steps = random.randint(3, 7)
-        step_size = (target_position - current_position) / steps
-
-        for i in range(steps):
-            scroll_to = current_position + (step_size * (i + 1))
-            page.evaluate(f"window.scrollTo(0, {scroll_to})")
-            random_delay(0.1, 0.3)
+        # 부드러운 스크롤 시뮬레이션 (단계 사이 100~300ms 대기)
+        page.evaluate(
+            _STEPPED_SCROLL_JS,
+            {
+                "amount": scroll_amount if direction == "down" else -scroll_amount,
+                "steps": random.randint(3, 7),
+                "minDelay": 100,
+                "maxDelay": 300,
+            },
+        )
 
         random_delay(scroll_pause_time, scroll_pause_time * 1.5)
         logger.debug(f"스크롤 완료: {direction} ({scroll_amount}px)")
@@ -73,12 +83,19 @@ def human_like_click(locator: Locator, delay_before: float = 0.3, delay_after: f
         delay_after: 클릭 후 대기 시간 (초)
     """
     try:
-        # 요소로 마우스 이동
-        locator.hover()
-        random_delay(delay_before * 0.5, delay_before * 1.5)
-
-        # 클릭
-        locator.click()
+        # 요소 위치를 한 번만 계산하고 마우스 API로 이동/클릭
+        # (hover()와 click()은 각자 요소를 다시 찾고 위치를 계산함)
+        locator.scroll_into_view_if_needed()
+        box = locator.bounding_box()
+        if box is None:
+            locator.click()
+        else:
+            mouse = locator.page.mouse
+            x = box["x"] + box["width"] / 2
+            y = box["y"] + box["height"] / 2
+            mouse.move(x, y, steps=random.randint(3, 8))
+            random_delay(delay_before * 0.5, delay_before * 1.5)
+            mouse.click(x, y)
         random_delay(delay_after * 0.5, delay_after * 1.5)
 
         logger.debug("클릭 완료 (사용자 행동 시뮬레이션)")
@@ -87,17 +104,21 @@ def human_like_click(locator: Locator, delay_before: float = 0.3, delay_after: f
         raise
 
 
-def random_mouse_movement(page: Page, duration: float = 0.5) -> None:
+def random_mouse_movement(
+    page: Page, duration: float = 0.5, viewport: Optional[dict[str, int]] = None
+) -> None:
     """
     랜덤 마우스 움직임 시뮬레이션
 
     Args:
         page: Playwright Page 객체
         duration: 움직임 지속 시간 (초)
+        viewport: 미리 조회한 뷰포트 크기 (없으면 page.viewport_size를 조회)
     """
     try:
         # 랜덤 위치로 마우스 이동
-        viewport = page.viewport_size
+        if viewport is None:
+            viewport = page.viewport_size
         if viewport:
             x = random.randint(100, viewport["width"] - 100)
             y = random.randint(100, viewport["height"] - 100)
@@ -123,10 +144,14 @@ def simulate_typing(page: Page, selector: str, text: str, typing_delay: float =
         locator.click()
         random_delay(0.2, 0.5)
 
-        # 한 글자씩 입력
-        for char in text:
-            locator.type(char, delay=typing_delay * 1000)  # 밀리초로 변환
-            random_delay(typing_delay * 0.5, typing_delay * 1.5)
+        # 글자마다 호출하지 않고 2~3 덩어리로 나눠 press_sequentially로 입력
+        # (키 간격은 Playwright가 처리하고, 덩어리마다 간격을 바꾸고 잠깐 쉬어 일정한 리듬을 피함)
+        step = max(1, -(-len(text) // random.randint(2, 3)))
+        for start in range(0, len(text), step):
+            delay_ms = typing_delay * 1000 * random.uniform(0.5, 1.5)  # 밀리초로 변환
+            locator.press_sequentially(text[start : start + step], delay=delay_ms)
+            if start + step < len(text):
+                random_delay(typing_delay * 0.5, typing_delay * 1.5)
 
         logger.debug(f"타이핑 완료: {len(text)}자")
     except Exception as e:
@@ -145,6 +170,7 @@ def simulate_page_interaction(page: Page, min_actions: int = 1, max_actions: int
     """
     try:
         num_actions = random.randint(min_actions, max_actions)
+        viewport = page.viewport_size  # 세션 중 바뀌지 않으므로 한 번만 조회
 
         for _ in range(num_actions):
             action = random.choice(["scroll", "mouse"])
@@ -154,7 +180,7 @@ def simulate_page_interaction(page: Page, min_actions: int = 1, max_actions: int
                     page, scroll_pause_time=0.5, scroll_amount=random.randint(200, 500)
                 )
             elif action == "mouse":
-                random_mouse_movement(page, duration=0.3)
+                random_mouse_movement(page, duration=0.3, viewport=viewport)
 
             random_delay(0.5, 1.5)
 
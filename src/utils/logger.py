@@ -14,6 +14,7 @@ def setup_logger(
     log_file: Optional[Path] = None,
     rotation: str = "10 MB",
     retention: str = "7 days",
+    fast: bool = False,
 ) -> None:
     """
     로거 설정
@@ -23,16 +24,27 @@ def setup_logger(
         log_file: 로그 파일 경로 (None이면 파일 로깅 안 함)
         rotation: 로그 파일 회전 크기
         retention: 로그 파일 보관 기간
+        fast: True이면 콘솔에 색상 없이 시간/레벨/메시지만 출력 (로그가 많은 수집 실행용)
     """
     # 기본 로거 제거
     logger.remove()
 
     # 콘솔 출력 설정
+    # enqueue=True: 포맷/기록은 백그라운드 스레드에서 처리해 수집 루프가 stderr I/O를 기다리지 않음
+    # diagnose=False: 예외 로그에 변수 값(로그인 정보 등)을 펼쳐 적지 않음
+    # fast=True: 색상 태그 해석을 건너뛰고 한 줄을 짧게 만들어 기록 비용을 줄임
+    if fast:
+        console_format = "{time:HH:mm:ss} {level} {message}"
+    else:
+        console_format = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
     logger.add(
         sys.stderr,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        format=console_format,
         level=log_level,
-        colorize=True,
+        colorize=not fast,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
     # 파일 출력 설정 (선택)
@@ -49,6 +61,9 @@ def setup_logger(
                     rotation=rotation,
                     retention=retention,
                     encoding="utf-8",
+                    enqueue=True,
+                    backtrace=False,
+                    diagnose=False,
                 )
         except (ValueError, OSError) as e:
             # 로그 파일 생성 실패 시 콘솔만 사용
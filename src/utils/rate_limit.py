@@ -0,0 +1,114 @@
+"""
+요청 제한 유틸리티
+토큰 버킷으로 요청 속도를 제한하고, 요청 제한(429/챌린지) 감지 시 지수 백오프와 서킷 브레이커를 적용
+"""
+
+import time
+from collections.abc import Callable
+
+from ..exceptions import RateLimitError
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """
+    토큰 버킷 + 지수 백오프 + 서킷 브레이커
+
+    - 시간당 requests_per_hour개까지 요청을 허용하고, 최대 burst개까지 몰아서 보낼 수 있다.
+    - 요청 제한이 감지되면 base_backoff초부터 두 배씩 늘려가며(최대 max_backoff초) 대기한다.
+    - 연속으로 max_consecutive_hits번 감지되면 회로를 열어 대기 대신 RateLimitError를 발생시키고,
+      백오프 시간이 지나면 한 번의 시험 요청을 허용한다.
+    """
+
+    def __init__(
+        self,
+        requests_per_hour: int = 180,
+        burst: int = 10,
+        base_backoff: float = 5.0,
+        max_backoff: float = 300.0,
+        max_consecutive_hits: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        초기화
+
+        Args:
+            requests_per_hour: 시간당 허용 요청 수
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+            base_backoff: 첫 백오프 대기 시간 (초)
+            max_backoff: 최대 백오프 대기 시간 (초)
+            max_consecutive_hits: 회로를 여는 연속 요청 제한 감지 횟수
+            clock: 현재 시각 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.rate = requests_per_hour / 3600.0
+        self.burst = burst
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_consecutive_hits = max_consecutive_hits
+        self._clock = clock
+        self._sleep = sleep
+
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        self._blocked_until = 0.0
+        self.consecutive_hits = 0
+
+    @property
+    def is_open(self) -> bool:
+        """회로가 열려 있는지 (연속 감지 한도 초과 후 백오프 시간이 지나지 않음)"""
+        return (
+            self.consecutive_hits >= self.max_consecutive_hits
+            and self._clock() < self._blocked_until
+        )
+
+    def acquire(self) -> None:
+        """
+        요청 하나를 보내기 전에 호출 (필요한 만큼 대기)
+
+        Raises:
+            RateLimitError: 회로가 열려 있는 경우
+        """
+        if self.is_open:
+            raise RateLimitError(
+                f"요청 제한이 연속 {self.consecutive_hits}회 감지되어 요청을 중단합니다."
+            )
+
+        # 백오프 중이면 남은 시간만큼 대기
+        remaining = self._blocked_until - self._clock()
+        if remaining > 0:
+            logger.info(f"요청 제한 백오프 대기: {remaining:.1f}초")
+            self._sleep(remaining)
+
+        # 토큰 보충 후 부족하면 토큰 하나가 생길 때까지 대기
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        if self._tokens < 1:
+            wait = (1 - self._tokens) / self.rate
+            logger.debug(f"요청 속도 제한 대기: {wait:.1f}초")
+            self._sleep(wait)
+            self._tokens = 1.0
+            self._refilled_at = self._clock()
+        self._tokens -= 1
+
+    def record_rate_limit(self, reason: str) -> None:
+        """
+        요청 제한 감지 기록 (다음 acquire부터 백오프 적용)
+
+        Args:
+            reason: 감지 사유 (로깅용)
+        """
+        self.consecutive_hits += 1
+        backoff = min(self.base_backoff * 2 ** (self.consecutive_hits - 1), self.max_backoff)
+        self._blocked_until = max(self._blocked_until, self._clock() + backoff)
+        logger.warning(
+            f"요청 제한 감지 ({reason}) - {self.consecutive_hits}회 연속, {backoff:.0f}초 백오프"
+        )
+
+    def record_success(self) -> None:
+        """정상 응답 기록 (연속 감지 횟수 초기화)"""
+        self.consecutive_hits = 0
@@ -3,6 +3,7 @@
 웹 페이지 로딩 및 요소 대기를 위한 유틸리티 함수
 """
 
+from collections.abc import Sequence
 from typing import Optional
 
 from playwright.sync_api import Locator, Page
@@ -11,28 +12,88 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# 셀렉터 중 현재 보이는 요소가 있는 첫 번째 셀렉터를 반환 (순수 CSS 셀렉터만 지원)
+_FIRST_VISIBLE_SELECTOR_JS = """
+selectors => {
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (el.getClientRects().length > 0) return selector;
+        }
+    }
+    return null;
+}
+"""
+
 
-def wait_for_page_load(page: Page, timeout: int = 30000) -> None:
+def wait_for_page_load(page: Page, timeout: int = 30000, strict: bool = False) -> None:
     """
     페이지가 완전히 로드될 때까지 대기
 
+    DOM이 로드되면 바로 진행하고 networkidle은 짧게만 기다린다.
+    분석 비콘처럼 연결이 계속 열려 있는 페이지는 networkidle에 도달하지 못하는 경우가 많다.
+
     Args:
         page: Playwright Page 객체
         timeout: 타임아웃 (밀리초)
+        strict: True이면 networkidle도 timeout까지 기다림
     """
     try:
-        # 네트워크가 안정될 때까지 대기
-        page.wait_for_load_state("networkidle", timeout=timeout)
         # DOM이 로드될 때까지 대기
         page.wait_for_load_state("domcontentloaded", timeout=timeout)
-        logger.debug("페이지 로드 완료")
     except Exception as e:
         logger.warning(f"페이지 로드 대기 중 오류 (계속 진행): {e}")
+        return
+
+    try:
+        # 네트워크가 안정될 때까지 대기 (strict가 아니면 최대 2초만)
+        page.wait_for_load_state("networkidle", timeout=timeout if strict else min(timeout, 2000))
+        logger.debug("페이지 로드 완료")
+    except Exception as e:
+        if strict:
+            logger.warning(f"페이지 로드 대기 중 오류 (계속 진행): {e}")
+        else:
+            logger.debug("networkidle 대기 시간 초과 (DOM 로드 완료, 계속 진행)")
+
+
+def combine_selectors(page: Page, selectors: Sequence[str]) -> Locator:
+    """
+    여러 셀렉터를 하나의 Locator로 결합 (어느 하나라도 일치하면 매칭)
+
+    :has-text() 같은 Playwright 전용 셀렉터도 섞을 수 있도록 쉼표 결합 대신 or_()로 연결한다.
+
+    Args:
+        page: Playwright Page 객체
+        selectors: 결합할 셀렉터 리스트
+
+    Returns:
+        결합된 Locator 객체
+    """
+    combined = page.locator(selectors[0])
+    for selector in selectors[1:]:
+        combined = combined.or_(page.locator(selector))
+    return combined
+
+
+def first_visible_selector(page: Page, selectors: Sequence[str]) -> Optional[str]:
+    """
+    현재 보이는 요소가 있는 셀렉터 중 우선순위가 가장 높은 것을 반환 (대기 없음)
+
+    셀렉터마다 is_visible()을 호출하지 않고 페이지 안에서 한 번에 확인한다.
+    document.querySelector를 사용하므로 :has-text() 같은 Playwright 전용 셀렉터는 쓸 수 없다.
+
+    Args:
+        page: Playwright Page 객체
+        selectors: 확인할 CSS 셀렉터 리스트 (우선순위 순)
+
+    Returns:
+        일치한 셀렉터, 없으면 None
+    """
+    return page.evaluate(_FIRST_VISIBLE_SELECTOR_JS, list(selectors))
 
 
 def wait_for_element(
     page: Page,
-    selectors: list[str],
+    selectors: Sequence[str],
     timeout: int = 5000,
     state: str = "visible",  # type: ignore[assignment]
     description: str = "요소",
@@ -40,61 +101,73 @@ def wait_for_element(
     """
     여러 셀렉터 중 하나가 나타날 때까지 대기
 
+    셀렉터별로 차례로 타임아웃까지 기다리지 않고 결합된 Locator 하나로 한 번만 대기한 뒤,
+    조건을 만족하는 셀렉터 중 우선순위가 가장 높은 것을 반환한다.
+
     Args:
         page: Playwright Page 객체
-        selectors: 시도할 셀렉터 리스트
-        timeout: 각 셀렉터당 타임아웃 (밀리초)
+        selectors: 시도할 셀렉터 리스트 (우선순위 순)
+        timeout: 전체 타임아웃 (밀리초)
         state: 대기할 상태 ("visible", "attached", "hidden")
         description: 요소 설명 (로깅용)
 
     Returns:
         찾은 Locator 객체, 없으면 None
     """
+    combined = combine_selectors(page, selectors).first
+    try:
+        logger.debug(f"{description} 찾는 중: {len(selectors)}개 셀렉터")
+        combined.wait_for(state=state, timeout=timeout)
+    except Exception as e:
+        logger.debug(f"셀렉터 대기 실패: {description} - {e}")
+        logger.error(f"{description}을(를) 찾을 수 없습니다.")
+        return None
+
+    # 이미 나타난 상태이므로 여기서는 대기 없이 우선순위 순으로 확인
     for selector in selectors:
+        locator = page.locator(selector).first
         try:
-            logger.debug(f"{description} 찾는 중: {selector}")
-            page.wait_for_selector(selector, timeout=timeout, state=state)
-            locator = page.locator(selector).first
-            locator.wait_for(state=state, timeout=2000)
-
-            if state == "visible" and locator.is_visible():
-                logger.info(f"{description} 찾음: {selector}")
-                return locator
-            elif state != "visible":
-                logger.info(f"{description} 찾음: {selector}")
-                return locator
+            if state == "visible":
+                matched = locator.is_visible()
+            elif state == "attached":
+                matched = locator.count() > 0
+            else:
+                break
         except Exception as e:
-            logger.debug(f"셀렉터 실패: {selector} - {e}")
+            logger.debug(f"셀렉터 확인 실패: {selector} - {e}")
             continue
+        if matched:
+            logger.info(f"{description} 찾음: {selector}")
+            return locator
 
-    logger.error(f"{description}을(를) 찾을 수 없습니다.")
-    return None
+    logger.info(f"{description} 찾음")
+    return combined
 
 
-def safe_fill_input(locator: Locator, value: str, description: str = "입력 필드") -> bool:
+def safe_fill_input(
+    locator: Locator, value: str, description: str = "입력 필드", settle_ms: int = 0
+) -> bool:
     """
     입력 필드에 안전하게 값 입력
 
+    고정 대기 없이 Playwright의 동작 가능 여부 검사(보이고 편집 가능한지)에 맡긴다.
+
     Args:
         locator: 입력 필드 Locator
         value: 입력할 값
         description: 필드 설명 (로깅용)
+        settle_ms: 입력 후 값을 확인하기 전 추가로 기다릴 시간 (밀리초, 사이트가 필요로 할 때만)
 
     Returns:
         입력 성공 여부
     """
     try:
-        # 클릭하여 포커스
+        # 클릭하여 포커스 후 기존 내용 지우고 값 입력 (각 동작이 편집 가능해질 때까지 대기)
         locator.click()
-        locator.page.wait_for_timeout(300)
-
-        # 기존 내용 지우기
         locator.clear()
-        locator.page.wait_for_timeout(200)
-
-        # 값 입력
         locator.fill(value, timeout=5000)
-        locator.page.wait_for_timeout(500)
+        if settle_ms:
+            locator.page.wait_for_timeout(settle_ms)
 
         # 입력 확인
         input_value = locator.input_value()
@@ -105,7 +178,6 @@ def safe_fill_input(locator: Locator, value: str, description: str = "입력 필
             logger.warning(f"{description} 입력값 불일치. 재시도...")
             locator.clear()
             locator.fill(value)
-            locator.page.wait_for_timeout(500)
             return True
     except Exception as e:
         logger.error(f"{description} 입력 실패: {e}")
@@ -0,0 +1,148 @@
+"""
+브라우저 관리 테스트
+"""
+
+import pytest
+
+from src import browser as browser_module
+from src.browser import BrowserManager
+from src.config import ScrapingConfig
+
+
+class FakePage:
+    """테스트용 Page"""
+
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+    def set_default_navigation_timeout(self, timeout):
+        self.navigation_timeout = timeout
+
+    def add_init_script(self, script):
+        self.init_script = script
+
+    def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    """테스트용 BrowserContext"""
+
+    def new_page(self):
+        return FakePage()
+
+    def storage_state(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{}")
+
+    def close(self):
+        pass
+
+
+class FakeBrowser:
+    """테스트용 Browser"""
+
+    def __init__(self):
+        self.closed = False
+
+    def new_context(self, **kwargs):
+        self.context_options = kwargs
+        return FakeContext()
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowserType:
+    """테스트용 BrowserType"""
+
+    name = "chromium"
+
+    def __init__(self):
+        self.launch_count = 0
+
+    def launch(self, **kwargs):
+        self.launch_count += 1
+        return FakeBrowser()
+
+
+class FakePlaywright:
+    """테스트용 Playwright"""
+
+    def __init__(self):
+        self.chromium = self.firefox = self.webkit = FakeBrowserType()
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    """sync_playwright를 가짜 구현으로 교체"""
+    fake = FakePlaywright()
+
+    class _Starter:
+        def start(self):
+            return fake
+
+    monkeypatch.setattr(browser_module, "sync_playwright", lambda: _Starter())
+    return fake
+
+
+class TestBrowserManager:
+    """BrowserManager 테스트 클래스"""
+
+    def test_shares_browser_between_instances(self, fake_playwright):
+        """두 인스턴스가 하나의 브라우저를 공유하고 마지막 close에서만 종료"""
+        config = ScrapingConfig(output_dir="test_output")
+        first = BrowserManager(config)
+        second = BrowserManager(config)
+
+        first.start()
+        second.start()
+        shared_browser = first.browser
+
+        assert fake_playwright.chromium.launch_count == 1
+        assert second.browser is shared_browser
+        assert first.page is not second.page
+
+        first.close()
+        assert not shared_browser.closed
+        assert not fake_playwright.stopped
+
+        second.close()
+        assert shared_browser.closed
+        assert fake_playwright.stopped
+
+    def test_new_page_closed_with_manager(self, fake_playwright):
+        """추가 페이지는 같은 컨텍스트에 생성되고 close에서 함께 닫힘"""
+        manager = BrowserManager(ScrapingConfig(output_dir="test_output"))
+        manager.start()
+
+        extra = manager.new_page()
+        assert extra is not manager.page
+        assert extra.init_script == manager.page.init_script
+
+        manager.close()
+        assert extra.closed
+
+    def test_storage_state_round_trip(self, fake_playwright, tmp_path):
+        """저장한 브라우저 상태를 다음 시작 시 컨텍스트에 복원"""
+        state_file = tmp_path / "state" / "browser_state.json"
+        config = ScrapingConfig(output_dir="test_output", playwright_storage_state=state_file)
+
+        first = BrowserManager(config)
+        first.start()
+        assert not first.storage_state_loaded
+        assert first.save_storage_state() == state_file
+        first.close()
+
+        second = BrowserManager(config)
+        second.start()
+        assert second.storage_state_loaded
+        assert second.browser.context_options["storage_state"] == str(state_file)
+        second.close()
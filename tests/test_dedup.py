@@ -0,0 +1,35 @@
+"""
+중복 체크 유틸리티 테스트
+"""
+
+from src.utils.dedup import PersistentKeys, RecentKeys
+
+
+def test_recent_keys_forgets_oldest():
+    """가득 차면 가장 오래된 키부터 잊고, 이미 있는 키는 다시 추가되지 않음"""
+    keys = RecentKeys(max_size=2)
+
+    assert keys.add("a")
+    assert keys.add("b")
+    assert not keys.add("a")
+
+    assert keys.add("c")
+    assert "a" not in keys
+    assert "b" in keys and "c" in keys
+    assert len(keys) == 2
+
+
+def test_persistent_keys_survive_reopen(tmp_path):
+    """close() 후 같은 파일을 다시 열면 이전 실행에서 추가한 키도 중복으로 판단"""
+    path = tmp_path / "seen.sqlite"
+    keys = PersistentKeys(path, commit_every=2)
+    assert keys.add("a")
+    assert not keys.add("a")
+    keys.close()
+
+    reopened = PersistentKeys(path)
+    assert "a" in reopened
+    assert not reopened.add("a")
+    assert reopened.add("b")
+    assert len(reopened) == 2
+    reopened.close()
@@ -0,0 +1,71 @@
+"""
+요청 제한 유틸리티 테스트
+"""
+
+import pytest
+
+from src.exceptions import RateLimitError
+from src.utils.rate_limit import RateLimiter
+
+
+class FakeClock:
+    """테스트용 시계 (sleep하면 시간이 흐름)"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """테스트용 시계"""
+    return FakeClock()
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트 클래스"""
+
+    def test_token_bucket_waits_after_burst(self, clock):
+        """burst를 다 쓰면 다음 토큰이 생길 때까지 대기"""
+        limiter = RateLimiter(requests_per_hour=3600, burst=2, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.sleeps == []
+
+        limiter.acquire()
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_backoff_doubles_and_resets_on_success(self, clock):
+        """연속 감지마다 백오프가 두 배로 늘고, 정상 응답 후 초기화"""
+        limiter = RateLimiter(base_backoff=5, clock=clock, sleep=clock.sleep)
+
+        limiter.record_rate_limit("429")
+        limiter.acquire()
+        limiter.record_rate_limit("429")
+        limiter.acquire()
+        assert clock.sleeps == [5, 10]
+
+        limiter.record_success()
+        limiter.record_rate_limit("429")
+        limiter.acquire()
+        assert clock.sleeps[-1] == 5
+
+    def test_circuit_opens_after_consecutive_hits(self, clock):
+        """연속 감지 한도를 넘으면 대기 대신 RateLimitError, 백오프 후 시험 요청 허용"""
+        limiter = RateLimiter(max_consecutive_hits=2, clock=clock, sleep=clock.sleep)
+
+        limiter.record_rate_limit("429")
+        limiter.record_rate_limit("challenge")
+        with pytest.raises(RateLimitError):
+            limiter.acquire()
+
+        clock.now += 10
+        limiter.acquire()
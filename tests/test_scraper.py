@@ -2,10 +2,14 @@
 스크래퍼 테스트
 """
 
+import json
+from types import SimpleNamespace
+
 import pytest
 
 from src.config import ScrapingConfig
 from src.exceptions import LoginError, ScrapingError
+from src.models import ReelData
 from src.scraper import InstagramReelsScraper
 
 
@@ -46,6 +50,177 @@ class TestInstagramReelsScraper:
         with pytest.raises(ScrapingError):
             scraper.scrape_reels()
 
+    def test_extract_reels_bulk(self, scraper):
+        """여러 요소 일괄 추출 테스트"""
+        reels = scraper.extract_reels_bulk([object(), object()])
+        assert len(reels) == 2
+        assert all(isinstance(reel, ReelData) for reel in reels)
+
+    def test_extract_reels_from_page(self, scraper):
+        """릴스 카드 추출 결과를 한 번에 검증"""
+
+        class FakeLocator:
+            def evaluate_all(self, expression, limit):
+                assert limit == 1
+                return [{"link": "https://www.instagram.com/reel/abc123/", "thumbnail": None, "title": " 제목 "}]
+
+        class FakePage:
+            def locator(self, selector):
+                return FakeLocator()
+
+        reels = scraper.extract_reels_from_page(FakePage(), max_reels=1)
+        assert reels[0].title == "제목"
+        assert str(reels[0].link) == "https://www.instagram.com/reel/abc123/"
+
+    def test_extract_current_reel_data(self, scraper):
+        """현재 릴스 정보를 evaluate 한 번으로 수집하고 숫자 텍스트를 변환"""
+
+        class FakePage:
+            url = "https://www.instagram.com/reels/abc123/"
+            calls = 0
+
+            def evaluate(self, expression, arg):
+                self.calls += 1
+                return {
+                    "counts": {"likes": "17.4만", "comments": "1,234"},
+                    "author": "작성자",
+                    "profileImage": None,
+                    "title": None,
+                    "thumbnail": None,
+                    "music": "작성자 · 오리지널 오디오",
+                    "link": self.url,
+                    "container": "video",
+                }
+
+        page = FakePage()
+        reel = scraper._extract_current_reel_data(page)
+
+        assert page.calls == 1
+        assert reel.likes == 174000
+        assert reel.comments == 1234
+        assert reel.author == "작성자"
+
+    def test_extract_current_reel_data_from_api_cache(self, scraper):
+        """피드 API 응답에 있는 릴스는 DOM을 읽지 않고 캐시에서 생성"""
+        media = {
+            "code": "abc123",
+            "like_count": 4346,
+            "comment_count": 12,
+            "user": {"username": "작성자", "profile_pic_url": "https://example.com/p.jpg"},
+            "caption": {"text": "제목"},
+            "image_versions2": {"candidates": [{"url": "https://example.com/t.jpg"}]},
+            "clips_metadata": {"original_sound_info": {"original_audio_title": "오리지널 오디오"}},
+        }
+        response = SimpleNamespace(
+            status=200,
+            ok=True,
+            url="https://www.instagram.com/graphql/query",
+            request=SimpleNamespace(resource_type="fetch"),
+            json=lambda: {"data": {"edges": [{"node": {"media": media}}]}},
+        )
+        scraper._on_response(response)
+
+        class FakePage:
+            url = "https://www.instagram.com/reels/abc123/"
+
+            def evaluate(self, expression, arg):
+                raise AssertionError("캐시된 릴스에서 DOM을 읽음")
+
+        reel = scraper._extract_current_reel_data(FakePage())
+
+        assert reel.likes == 4346
+        assert reel.author == "작성자"
+        assert reel.music == "작성자 · 오리지널 오디오"
+        assert reel.link == FakePage.url
+        assert reel.reel_id == "abc123"
+        assert "reel_id" not in ReelData.model_fields
+
+    def test_save_to_json(self, scraper, tmp_path):
+        """JSON 저장 테스트 (한글 보존, 들여쓰기 형식)"""
+        scraper.config.output_dir = tmp_path
+        data = [ReelData(author="작성자", likes=10, link="https://www.instagram.com/reel/abc123/")]
+
+        filepath = scraper.save_to_json(data, filename="reels.json")
+
+        text = filepath.read_text(encoding="utf-8")
+        assert "작성자" in text
+        assert text.startswith('[\n  {\n    "thumbnail": null,')
+        assert json.loads(text) == [item.model_dump(mode="json") for item in data]
+
+    def test_append_ndjson(self, scraper, tmp_path):
+        """임시 저장은 기존 파일을 다시 쓰지 않고 한 줄씩 이어 씀"""
+        filepath = tmp_path / "reels.ndjson"
+        first = ReelData(author="작성자", likes=10)
+        second = ReelData(author="작성자2")
+
+        scraper._append_ndjson([first], filepath)
+        scraper._append_ndjson([second], filepath)
+
+        lines = filepath.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["author"] for line in lines] == ["작성자", "작성자2"]
+
+    def test_collecting_reels_flushes_unsaved_batch(self, scraper, tmp_path, monkeypatch):
+        """저장 주기 전에 수집이 멈춰도 남은 릴스를 기록한 뒤 중복 체크 키를 남김"""
+        scraper.config.output_dir = tmp_path
+
+        class FakePage:
+            url = "https://www.instagram.com/reels/reel0/"
+
+        page = FakePage()
+        scraper.__dict__["browser"] = SimpleNamespace(get_page=lambda: page)
+
+        def move_to_next_reel(page):
+            # 이동에 실패했지만 URL은 바뀐 것처럼 처리해 매번 새 릴스를 수집 (5회 실패 후 중단)
+            page.url = f"https://www.instagram.com/reels/reel{len(extracted)}/"
+            return False
+
+        extracted = []
+
+        def extract_current_reel_data(page):
+            extracted.append(page.url)
+            return ReelData(author="작성자", link=page.url)
+
+        monkeypatch.setattr(scraper, "_wait_for_reels_page_load", lambda page: None)
+        monkeypatch.setattr(scraper, "_extract_current_reel_data", extract_current_reel_data)
+        monkeypatch.setattr(scraper, "_move_to_next_reel", move_to_next_reel)
+        monkeypatch.setattr(scraper, "_wait_for_url_change", lambda *args, **kwargs: False)
+
+        scraper.start_collecting_reels()
+
+        (ndjson_path,) = tmp_path.glob("reels_data_*.ndjson")
+        lines = ndjson_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == len(extracted) == 5
+        assert [json.loads(line)["link"] for line in lines] == extracted
+
+    def test_save_to_csv(self, scraper, tmp_path):
+        """CSV 저장 테스트 (헤더 순서, 빈 값 처리)"""
+        scraper.config.output_dir = tmp_path
+        data = [ReelData(author="작성자", likes=10)]
+
+        filepath = scraper.save_to_csv(data, filename="reels.csv")
+
+        lines = filepath.read_text(encoding="utf-8-sig").splitlines()
+        assert lines[0] == ",".join(ReelData.model_fields)
+        assert lines[1] == ",10,,작성자,,,,"
+
+    def test_close_releases_browser(self, scraper):
+        """close()는 시작된 브라우저만 닫고 다음 접근 시 새로 생성"""
+
+        class FakeManager:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        manager = FakeManager()
+        scraper.__dict__["browser"] = manager
+
+        scraper.close()
+
+        assert manager.closed
+        assert not scraper._browser_started
+        scraper.close()  # 시작되지 않은 상태에서는 아무 것도 하지 않음
+
     @pytest.mark.slow
     def test_scrape_reels_with_hashtag(self, scraper):
         """해시태그로 스크래핑 테스트"""
@@ -0,0 +1,67 @@
+"""
+숏트렌드 스크래퍼 테스트
+"""
+
+import gzip
+import json
+
+import pytest
+
+from src.config import ScrapingConfig
+from src.models import ShortrendReelData
+from src.shortrend_scraper import ShortrendScraper
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    """테스트용 숏트렌드 스크래퍼 인스턴스"""
+    return ShortrendScraper(config=ScrapingConfig(output_dir=tmp_path))
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("208.6만", 2086000),
+        ("3.2천", 3200),
+        ("32.3천", 32300),
+        ("1,234", 1234),
+        ("", None),
+        ("없음", None),
+    ],
+)
+def test_parse_number(scraper, text, expected):
+    """만/천 단위와 쉼표가 있는 숫자 텍스트 변환"""
+    assert scraper._parse_number(text) == expected
+
+
+def test_to_reel_data(scraper):
+    """카드 추출 결과를 모델로 변환 (썸네일이 없으면 None)"""
+    reel = scraper._to_reel_data(
+        {"thumbnail_url": "https://example.com/t.jpg", "rank_number": 1, "views": 80000}
+    )
+
+    assert reel.rank_number == 1
+    assert reel.views == 80000
+    assert scraper._to_reel_data({"title": "썸네일 없음"}) is None
+
+
+def test_append_ndjson(scraper, tmp_path):
+    """수집 중 저장은 한 줄에 하나씩 이어 쓰고 None 필드는 생략"""
+    filepath = tmp_path / "reels.ndjson"
+
+    scraper._append_ndjson([ShortrendReelData(title="첫 번째")], filepath)
+    scraper._append_ndjson([ShortrendReelData(title="두 번째", views=10)], filepath)
+
+    lines = filepath.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"title": "첫 번째"},
+        {"title": "두 번째", "views": 10},
+    ]
+
+
+def test_save_to_json_compress(scraper):
+    """compress=True이면 .gz를 붙여 gzip으로 저장"""
+    filepath = scraper.save_to_json([ShortrendReelData(title="제목")], "reels.json", compress=True)
+
+    assert filepath.name == "reels.json.gz"
+    assert json.loads(gzip.decompress(filepath.read_bytes())) == [{"title": "제목"}]
@@ -0,0 +1,84 @@
+"""
+대기 유틸리티 테스트
+"""
+
+from src.utils.wait_utils import wait_for_element, wait_for_page_load
+
+
+class FakeLocator:
+    """테스트용 Locator (결합된 셀렉터 중 하나라도 보이면 매칭)"""
+
+    def __init__(self, page, selectors):
+        self.page = page
+        self.selectors = selectors
+
+    @property
+    def first(self):
+        return self
+
+    def or_(self, other):
+        return FakeLocator(self.page, self.selectors + other.selectors)
+
+    def wait_for(self, state, timeout):
+        self.page.waits.append(tuple(self.selectors))
+        if not self.is_visible():
+            raise TimeoutError(f"{self.selectors} not {state}")
+
+    def is_visible(self):
+        return any(selector in self.page.visible for selector in self.selectors)
+
+    def count(self):
+        return int(self.is_visible())
+
+
+class FakePage:
+    """테스트용 Page"""
+
+    def __init__(self, visible):
+        self.visible = set(visible)
+        self.waits = []
+
+    def locator(self, selector):
+        return FakeLocator(self, [selector])
+
+
+class TestWaitForElement:
+    """wait_for_element 테스트 클래스"""
+
+    def test_waits_once_and_returns_highest_priority(self):
+        """결합된 Locator로 한 번만 대기하고 우선순위가 높은 셀렉터 반환"""
+        page = FakePage(visible={"#b", "#c"})
+
+        locator = wait_for_element(page, ["#a", "#b", "#c"], timeout=100)
+
+        assert page.waits == [("#a", "#b", "#c")]
+        assert locator.selectors == ["#b"]
+
+    def test_returns_none_when_nothing_matches(self):
+        """어떤 셀렉터도 나타나지 않으면 None"""
+        page = FakePage(visible=set())
+
+        assert wait_for_element(page, ["#a", "#b"], timeout=100) is None
+
+
+class FakeLoadPage:
+    """테스트용 Page (networkidle에 도달하지 않음)"""
+
+    def __init__(self):
+        self.states = []
+
+    def wait_for_load_state(self, state, timeout):
+        self.states.append((state, timeout))
+        if state == "networkidle":
+            raise TimeoutError("networkidle")
+
+
+def test_wait_for_page_load_treats_networkidle_as_best_effort():
+    """DOM 로드를 먼저 기다리고 networkidle은 짧게만 기다림 (strict이면 전체 timeout)"""
+    page = FakeLoadPage()
+    wait_for_page_load(page, timeout=30000)
+    assert page.states == [("domcontentloaded", 30000), ("networkidle", 2000)]
+
+    page = FakeLoadPage()
+    wait_for_page_load(page, timeout=30000, strict=True)
+    assert page.states == [("domcontentloaded", 30000), ("networkidle", 30000)]